@@ -0,0 +1,120 @@
+"""Measure per-request overhead of action endpoints.
+
+Run with `python -m benchmarks.actions`.
+
+"""
+
+import typing
+
+import fastapi
+
+import fastapi_rest_framework
+
+from . import common
+
+
+class ActionView(common.BaseView):
+    """View with actions, which don't need reload statement."""
+
+    router = fastapi.APIRouter(
+        prefix="/benchmark",
+    )
+
+    @fastapi_rest_framework.action()
+    async def ping(
+        self,
+        **kwargs: typing.Any,
+    ) -> None:
+        """Do nothing."""
+
+    @fastapi_rest_framework.action(detail=True)
+    async def ping_detail(
+        self,
+        instance: common.Model,
+        **kwargs: typing.Any,
+    ) -> common.Schema:
+        """Return instance."""
+        return common.Schema.model_validate(instance)
+
+
+def get_endpoint(name: str) -> typing.Any:
+    """Get registered endpoint function by name."""
+    for route in ActionView.router.routes:
+        if route.name == f"benchmark-{name}":  # type: ignore
+            return route.endpoint  # type: ignore
+    raise ValueError(name)
+
+
+def main() -> None:
+    """Run benchmark."""
+    view = ActionView()
+    view.action = "ping"
+    repository = common.Repository()
+    context = fastapi_rest_framework.Context()
+    action_context = (
+        get_endpoint("ping").__annotations__["action_context"].__origin__()
+    )
+    ping = get_endpoint("ping")
+    ping_detail = get_endpoint("ping-detail")
+
+    def resolve_per_request() -> None:
+        # Config which was resolved twice on each request before plan
+        for _ in range(2):
+            view.get_permissions(action=view.action)
+            view.get_validator(action=view.action)
+            view.get_interactor(action=view.action)
+            view.get_joined_load_options(action=view.action)
+            view.get_select_in_load_options(action=view.action)
+            view.get_annotations(action=view.action)
+
+    common.report(
+        "Action endpoints (microseconds per request)",
+        [
+            (
+                "config resolution, removed from request",
+                f"{common.measure(resolve_per_request):.2f}",
+            ),
+            (
+                "reload statement, now prepared only if used",
+                "{:.2f}".format(
+                    common.measure_async(
+                        lambda: view.prepare_fetch_statement(
+                            user=None,
+                            repository=repository,
+                        ),
+                    ),
+                ),
+            ),
+            (
+                "action endpoint",
+                "{:.2f}".format(
+                    common.measure_async(
+                        lambda: ping(
+                            action_context=action_context,
+                            user=None,
+                            repository=repository,
+                            context=context,
+                        ),
+                    ),
+                ),
+            ),
+            (
+                "detail action endpoint",
+                "{:.2f}".format(
+                    common.measure_async(
+                        lambda: ping_detail(
+                            pk=1,
+                            action_context=action_context,
+                            user=None,
+                            repository=repository,
+                            context=context,
+                        ),
+                    ),
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
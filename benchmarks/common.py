@@ -0,0 +1,151 @@
+import asyncio
+import collections.abc
+import dataclasses
+import statistics
+import time
+import typing
+
+import fastapi
+import pydantic
+
+import fastapi_rest_framework
+
+
+@dataclasses.dataclass
+class Model:
+    """Model which is stored in memory."""
+
+    pk_field: typing.ClassVar[str] = "id"
+
+    id: int
+    name: str
+
+
+class Repository:
+    """Repository which keeps instances in memory.
+
+    Statements are plain dicts, so benchmarks measure only framework
+    overhead.
+
+    """
+
+    model = Model
+    instances: typing.ClassVar[list[Model]] = [
+        Model(id=index, name=f"name-{index}") for index in range(100)
+    ]
+
+    def get_fetch_statement(
+        self,
+        **kwargs: typing.Any,
+    ) -> dict[str, typing.Any]:
+        """Prepare statement for fetching."""
+        return kwargs
+
+    async def fetch_first(
+        self,
+        statement: dict[str, typing.Any] | None = None,
+        **filters_by: typing.Any,
+    ) -> Model | None:
+        """Fetch first matching entry."""
+        pk = int((statement or filters_by)["id"])
+        return self.instances[pk] if 0 <= pk < len(self.instances) else None
+
+
+class Schema(pydantic.BaseModel):
+    """Schema of model."""
+
+    model_config = pydantic.ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class Filters(fastapi_rest_framework.Filters[Model, None, typing.Any]):
+    """Filters which are not applied."""
+
+    async def to_filters(
+        self,
+        user: None,
+        context: fastapi_rest_framework.ContextType,
+    ) -> list[typing.Any]:
+        """Prepare filters."""
+        return []
+
+
+class BaseView(
+    fastapi_rest_framework.BaseAPIView[
+        typing.Any,
+        typing.Any,
+        typing.Any,
+        typing.Any,
+        typing.Any,
+        None,
+        Repository,
+        Model,
+    ],
+):
+    """Base view for benchmarks."""
+
+    repository_class = Repository
+    model = Model
+
+    @property
+    def user_dependency(self) -> type[None]:
+        """Prepare security dependency."""
+        return typing.Annotated[  # type: ignore
+            None,
+            fastapi.Depends(lambda: None),
+        ]
+
+    @property
+    def repository_dependency(self) -> type[Repository]:
+        """Prepare repository dependency."""
+        return typing.Annotated[  # type: ignore
+            Repository,
+            fastapi.Depends(Repository),
+        ]
+
+
+def measure(
+    func: collections.abc.Callable[[], typing.Any],
+    number: int = 1000,
+    repeat: int = 5,
+) -> float:
+    """Get median time of single call of function in microseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings) * 1_000_000
+
+
+def measure_async(
+    func: collections.abc.Callable[[], collections.abc.Awaitable[typing.Any]],
+    number: int = 1000,
+    repeat: int = 5,
+) -> float:
+    """Get median time of single await of coroutine in microseconds."""
+
+    async def run() -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                await func()
+            timings.append((time.perf_counter() - start) / number)
+        return statistics.median(timings) * 1_000_000
+
+    return asyncio.run(run())
+
+
+def report(
+    title: str,
+    rows: collections.abc.Sequence[tuple[str, str]],
+) -> None:
+    """Print results of benchmark."""
+    width = max(len(name) for name, _ in rows)
+    print(title)  # noqa: T201
+    for name, value in rows:
+        print(f"  {name:<{width}}  {value}")  # noqa: T201
@@ -0,0 +1,85 @@
+"""Measure definition of views with eager and lazy registration.
+
+Run with `python -m benchmarks.imports`. Subclasses of view of example_app
+are defined and then mounted via `include_views`. With lazy registration
+definition is cheap and endpoints are registered on mounting. Each
+measurement is made in fresh interpreter, so modules are not cached between
+runs.
+
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+from . import common
+
+REPEAT = 5
+SCRIPT = """
+import time
+
+import fastapi
+
+import example_app
+import fastapi_rest_framework
+
+start = time.perf_counter()
+views = [
+    type(
+        f"TestModelAPIView{index}",
+        (example_app.views.TestModelAPIView,),
+        {"router": fastapi.APIRouter(prefix=f"/test-models-{index}")},
+    )
+    for index in range(10)
+]
+defined = time.perf_counter()
+fastapi_rest_framework.include_views(fastapi.APIRouter(), *views)
+mounted = time.perf_counter()
+print(defined - start, mounted - defined)
+"""
+
+
+def run(lazy: bool) -> tuple[float, float]:
+    """Get median definition and mounting time in milliseconds."""
+    env = {
+        **os.environ,
+        "FASTAPI_REST_FRAMEWORK_LAZY_REGISTRATION": "1" if lazy else "0",
+    }
+    timings = [
+        tuple(
+            map(
+                float,
+                subprocess.run(  # noqa: S603
+                    [sys.executable, "-c", SCRIPT],
+                    env=env,
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout.split(),
+            ),
+        )
+        for _ in range(REPEAT)
+    ]
+    return (
+        statistics.median(defined for defined, _ in timings) * 1000,
+        statistics.median(mounted for _, mounted in timings) * 1000,
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+    rows = []
+    for mode, lazy in (("eager", False), ("lazy", True)):
+        defined, mounted = run(lazy=lazy)
+        rows.extend(
+            (
+                (f"{mode}: definition of 10 views, ms", f"{defined:.1f}"),
+                (f"{mode}: mounting of 10 views, ms", f"{mounted:.1f}"),
+            ),
+        )
+    common.report("Registration of views", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Measure cost of registration of views on startup.
+
+Run with `python -m benchmarks.startup`.
+
+"""
+
+import gc
+import time
+import tracemalloc
+import typing
+
+import fastapi
+
+import fastapi_rest_framework
+
+from . import common
+
+VIEWS_COUNT = 150
+
+
+def create_view(index: int) -> type[common.BaseView]:
+    """Create view with all core endpoints and paginated action."""
+
+    class View(
+        fastapi_rest_framework.ExportMixin[
+            common.Schema,
+            common.Filters,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            None,
+            common.Repository,
+            common.Model,
+        ],
+        fastapi_rest_framework.ListMixin[
+            common.Schema,
+            common.Filters,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            None,
+            common.Repository,
+            common.Model,
+        ],
+        fastapi_rest_framework.DetailMixin[
+            common.Schema,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            None,
+            common.Repository,
+            common.Model,
+        ],
+        fastapi_rest_framework.CreateMixin[
+            common.Schema,
+            common.Schema,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            None,
+            common.Repository,
+            common.Model,
+        ],
+        fastapi_rest_framework.UpdateMixin[
+            common.Schema,
+            common.Schema,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            None,
+            common.Repository,
+            common.Model,
+        ],
+        fastapi_rest_framework.DeleteMixin[
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            typing.Any,
+            None,
+            common.Repository,
+            common.Model,
+        ],
+        common.BaseView,
+    ):
+        router = fastapi.APIRouter(prefix=f"/view-{index}")
+        filter = common.Filters
+        list_schema = common.Schema
+        detail_schema = common.Schema
+        create_schema = common.Schema
+        create_detail_schema = common.Schema
+        update_schema = common.Schema
+        update_detail_schema = common.Schema
+        ordering_fields = ("id", "name")
+
+        @fastapi_rest_framework.action(paginated=True)
+        async def search(
+            self,
+            **kwargs: typing.Any,
+        ) -> None:
+            """Do nothing."""
+
+    return View
+
+
+def main() -> None:
+    """Run benchmark.
+
+    Time and memory are measured in separate runs, since tracing of memory
+    allocations slows down registration.
+
+    """
+    gc.collect()
+    start = time.perf_counter()
+    for index in range(VIEWS_COUNT):
+        create_view(index)
+    duration = (time.perf_counter() - start) * 1000
+    gc.collect()
+    tracemalloc.start()
+    views = [
+        create_view(index) for index in range(VIEWS_COUNT, VIEWS_COUNT * 2)
+    ]
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    common.report(
+        f"Registration of {len(views)} views",
+        [
+            ("total time, ms", f"{duration:.1f}"),
+            ("time per view, ms", f"{duration / len(views):.2f}"),
+            ("retained memory, KiB", f"{memory:.0f}"),
+            ("memory per view, KiB", f"{memory / len(views):.1f}"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Measure throughput of model validators.
+
+Run with `python -m benchmarks.validators`. Validator, which builds its
+validation map on each validation, is compared with validator, which
+declares validation plan once, and with same validator, which pure
+validators are compiled into request schema. Each validation includes
+validation of request schema. Checks against repository are answered in
+memory, so only overhead of validators is measured.
+
+Validators are measured on payload with checks against repository, where
+preparation of checks takes most of time, and on payload, which fields
+have only validators without checks.
+
+"""
+
+import typing
+
+import pydantic
+import sqlalchemy
+
+import fastapi_rest_framework
+
+from . import common
+
+
+class Model:
+    """Model with columns, which validators build checks from."""
+
+    pk_field: typing.ClassVar[str] = "id"
+
+    id = sqlalchemy.column("id")
+    name = sqlalchemy.column("name")
+
+
+class Repository:
+    """Repository, which reports that all checked entries are present."""
+
+    model = Model
+
+    def init_other(
+        self,
+        repository_class: type["Repository"],
+    ) -> "Repository":
+        """Init other repo from current."""
+        return repository_class()
+
+    async def run_checks(
+        self,
+        checks: typing.Sequence[fastapi_rest_framework.RepositoryCheck],
+    ) -> list[int]:
+        """Find one entry for each count and none for each exists."""
+        return [
+            int(check.kind == fastapi_rest_framework.RepositoryCheckKind.count)
+            for check in checks
+        ]
+
+
+class Schema(pydantic.BaseModel):
+    """Request schema."""
+
+    name: str
+    timezone: str
+    tags: list[str]
+    related_id: int
+    other_related_id: int
+
+
+class MapValidator(
+    fastapi_rest_framework.BaseModelValidator[typing.Any, typing.Any],
+):
+    """Validator, which builds validation map on each validation."""
+
+    def _get_validation_map(
+        self,
+        value: fastapi_rest_framework.ApiDataType,
+        context: fastapi_rest_framework.ContextType,
+    ) -> fastapi_rest_framework.ValidationMapType:
+        return {
+            "name": (
+                fastapi_rest_framework.RegexValidator(
+                    pattern=r"([A-Z])\w+",
+                    human_error="Regex validation failed",
+                ),
+                fastapi_rest_framework.UniqueByFieldValidator(
+                    field="name",
+                    repository=self.repository,
+                    human_name="name",
+                    instance=self.instance,
+                ),
+            ),
+            "timezone": (fastapi_rest_framework.TimeZoneValidator(),),
+            "tags": (
+                fastapi_rest_framework.BaseListValidator(
+                    instance_validator=fastapi_rest_framework.NotEqualToValues(
+                        values=[""],
+                    ),
+                ),
+            ),
+            "related_id": (
+                fastapi_rest_framework.ObjectPKValidator(
+                    human_name="related",
+                    repository=self.repository.init_other(Repository),
+                ),
+            ),
+            "other_related_id": (
+                fastapi_rest_framework.ObjectPKValidator(
+                    human_name="related",
+                    repository=self.repository.init_other(Repository),
+                ),
+            ),
+        }
+
+
+class PlanValidator(
+    fastapi_rest_framework.BaseModelValidator[typing.Any, typing.Any],
+):
+    """Validator, which declares validation plan once."""
+
+    validation_plan: typing.ClassVar[
+        fastapi_rest_framework.ValidationMapType
+    ] = {
+        "name": (
+            fastapi_rest_framework.RegexValidator(
+                pattern=r"([A-Z])\w+",
+                human_error="Regex validation failed",
+            ),
+            fastapi_rest_framework.UniqueByFieldValidator(
+                field="name",
+                human_name="name",
+            ),
+        ),
+        "timezone": (fastapi_rest_framework.TimeZoneValidator(),),
+        "tags": (
+            fastapi_rest_framework.BaseListValidator(
+                instance_validator=fastapi_rest_framework.NotEqualToValues(
+                    values=[""],
+                ),
+            ),
+        ),
+        "related_id": (
+            fastapi_rest_framework.ObjectPKValidator(
+                human_name="related",
+                repository_class=Repository,
+            ),
+        ),
+        "other_related_id": (
+            fastapi_rest_framework.ObjectPKValidator(
+                human_name="related",
+                repository_class=Repository,
+            ),
+        ),
+    }
+
+
+class PureSchema(pydantic.BaseModel):
+    """Request schema, which fields are not checked against repository."""
+
+    name: str
+    timezone: str
+    tags: list[str]
+
+
+def get_pure_validation_map() -> fastapi_rest_framework.ValidationMapType:
+    """Get validators, which don't check data against repository."""
+    return {
+        "name": (
+            fastapi_rest_framework.RegexValidator(
+                pattern=r"([A-Z])\w+",
+                human_error="Regex validation failed",
+            ),
+        ),
+        "timezone": (fastapi_rest_framework.TimeZoneValidator(),),
+        "tags": (
+            fastapi_rest_framework.BaseListValidator(
+                instance_validator=fastapi_rest_framework.NotEqualToValues(
+                    values=[""],
+                ),
+            ),
+        ),
+    }
+
+
+class PureMapValidator(
+    fastapi_rest_framework.BaseModelValidator[typing.Any, typing.Any],
+):
+    """Validator without checks, which builds map on each validation."""
+
+    def _get_validation_map(
+        self,
+        value: fastapi_rest_framework.ApiDataType,
+        context: fastapi_rest_framework.ContextType,
+    ) -> fastapi_rest_framework.ValidationMapType:
+        return get_pure_validation_map()
+
+
+class PurePlanValidator(
+    fastapi_rest_framework.BaseModelValidator[typing.Any, typing.Any],
+):
+    """Validator without checks, which declares validation plan once."""
+
+    validation_plan: typing.ClassVar[
+        fastapi_rest_framework.ValidationMapType
+    ] = get_pure_validation_map()
+
+
+def measure_validators(
+    cases: typing.Sequence[
+        tuple[
+            str,
+            type[
+                fastapi_rest_framework.BaseModelValidator[
+                    typing.Any,
+                    typing.Any,
+                ]
+            ],
+            type[pydantic.BaseModel],
+        ]
+    ],
+    data: dict[str, typing.Any],
+) -> list[tuple[str, str]]:
+    """Measure validation of data by validators with request schemas."""
+    repository = Repository()
+    rows = []
+    for name, validator_class, schema in cases:
+
+        async def validate(
+            validator_class: type[
+                fastapi_rest_framework.BaseModelValidator[
+                    typing.Any,
+                    typing.Any,
+                ]
+            ] = validator_class,
+            schema: type[pydantic.BaseModel] = schema,
+        ) -> None:
+            await validator_class(repository=repository).validate_schema(
+                schema=schema.model_validate(data),
+                context={},
+            )
+
+        timing = common.measure_async(validate)
+        rows.append(
+            (
+                name,
+                f"{timing:.2f} us, {1_000_000 / timing:.0f} validations/s",
+            ),
+        )
+    return rows
+
+
+def main() -> None:
+    """Run benchmark."""
+    common.report(
+        "Model validators",
+        measure_validators(
+            cases=(
+                ("validation map per validation", MapValidator, Schema),
+                ("compiled validation plan", PlanValidator, Schema),
+                (
+                    "pure validators in schema",
+                    PlanValidator,
+                    PlanValidator.get_request_schema(Schema),
+                ),
+            ),
+            data={
+                "name": "Name",
+                "timezone": "UTC",
+                "tags": ["first", "second"],
+                "related_id": 1,
+                "other_related_id": 2,
+                # Fields without validators
+                **{f"field_{index}": index for index in range(10)},
+            },
+        ),
+    )
+    common.report(
+        "Model validators without checks against repository",
+        measure_validators(
+            cases=(
+                (
+                    "validation map per validation",
+                    PureMapValidator,
+                    PureSchema,
+                ),
+                ("compiled validation plan", PurePlanValidator, PureSchema),
+                (
+                    "pure validators in schema",
+                    PurePlanValidator,
+                    PurePlanValidator.get_request_schema(PureSchema),
+                ),
+            ),
+            data={
+                "name": "Name",
+                "timezone": "UTC",
+                "tags": [f"tag-{index}" for index in range(20)],
+            },
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,8 +16,13 @@ from . import (
 router = fastapi.APIRouter(
     redirect_slashes=False,
 )
-router.include_router(views.TestModelAPIView.router)
-router.include_router(views.SoftDeleteTestModelAPIView.router)
+fastapi_rest_framework.include_views(
+    router,
+    views.TestModelAPIView,
+    views.SoftDeleteTestModelAPIView,
+    views.CursorTestModelAPIView,
+    views.CachedTestModelAPIView,
+)
 router.include_router(views.guarded_endpoint_router)
 router.include_router(views.S3GetParamsView.router)
 
@@ -76,6 +76,8 @@ class AllowPermission(
 ):
     """Check that user is allowed."""
 
+    independent = True
+
     async def _check_permission(
         self,
         user: UserJWTData,
@@ -1,18 +1,18 @@
+import typing
+
 import fastapi_rest_framework
 
 from .. import repositories
 
 
 class TextListValidator(
-    fastapi_rest_framework.BaseValidator[str, str],
+    fastapi_rest_framework.BasePureValidator[str, str],
 ):
     """Validate value in text_list."""
 
-    async def _validate(
+    def _validate_value(
         self,
         value: str | None,
-        loc: fastapi_rest_framework.LOCType,
-        context: fastapi_rest_framework.ContextType,
     ) -> str | None:
         """Perform validation."""
         if not value:
@@ -33,81 +33,68 @@ class TestModelValidator(
 ):
     """Validate test model data."""
 
-    def _get_unique_constraints(
-        self,
-    ) -> list[fastapi_rest_framework.UniqueConstraintType]:
-        return [
-            (
-                "text",
-                "text_nullable",
+    validation_plan: typing.ClassVar[
+        fastapi_rest_framework.ValidationMapType
+    ] = {
+        "text_unique": (
+            fastapi_rest_framework.UniqueByFieldValidator(
+                field="text_unique",
+                human_name="Text unique",
             ),
-        ]
-
-    def _get_validation_map(
-        self,
-        value: fastapi_rest_framework.ApiDataType,
-        context: fastapi_rest_framework.ContextType,
-    ) -> fastapi_rest_framework.ValidationMapType:
-        return {
-            "text_unique": (
-                fastapi_rest_framework.UniqueByFieldValidator(
-                    field="text_unique",
-                    repository=self.repository,
-                    human_name="Text unique",
-                    instance=self.instance,
-                ),
+        ),
+        "text_nullable": (
+            fastapi_rest_framework.RegexValidator(
+                pattern=r"([A-Z])\w+",
+                human_error="Regex validation failed",
             ),
-            "text_nullable": (
-                fastapi_rest_framework.RegexValidator(
-                    pattern=r"([A-Z])\w+",
-                    human_error="Regex validation failed",
-                ),
-                fastapi_rest_framework.NotEqualToValues(
-                    values=["NotEqualToValues"],
-                ),
+            fastapi_rest_framework.NotEqualToValues(
+                values=["NotEqualToValues"],
             ),
-            "timezone": (fastapi_rest_framework.TimeZoneValidator(),),
-            "date_time": (fastapi_rest_framework.DatetimeValidator(),),
-            "date_time_nullable": (
-                fastapi_rest_framework.DatetimeValidator(),
+        ),
+        "timezone": (fastapi_rest_framework.TimeZoneValidator(),),
+        "date_time": (fastapi_rest_framework.DatetimeValidator(),),
+        "date_time_nullable": (fastapi_rest_framework.DatetimeValidator(),),
+        "text_list": (
+            fastapi_rest_framework.BaseListValidator(
+                instance_validator=TextListValidator(),
             ),
-            "text_list": (
-                fastapi_rest_framework.BaseListValidator(
-                    instance_validator=TextListValidator(),
-                ),
+        ),
+        "text_list_nullable": (
+            fastapi_rest_framework.BaseListValidator(
+                instance_validator=TextListValidator(),
             ),
-            "text_list_nullable": (
-                fastapi_rest_framework.BaseListValidator(
-                    instance_validator=TextListValidator(),
-                ),
+        ),
+        "related_model_id": (
+            fastapi_rest_framework.ObjectPKValidator(
+                human_name="related model",
+                repository_class=repositories.RelatedModelRepository,
             ),
-            "related_model_id": (
-                fastapi_rest_framework.ObjectPKValidator(
-                    human_name="related model",
-                    repository=self.repository.init_other(
-                        repositories.RelatedModelRepository,
-                    ),
-                ),
+        ),
+        "related_model_id_nullable": (
+            fastapi_rest_framework.ObjectPKValidator(
+                human_name="related model",
+                repository_class=repositories.RelatedModelRepository,
             ),
-            "related_model_id_nullable": (
-                fastapi_rest_framework.ObjectPKValidator(
-                    human_name="related model",
-                    repository=self.repository.init_other(
-                        repositories.RelatedModelRepository,
-                    ),
-                ),
+        ),
+        "m2m_related_models_ids": (
+            fastapi_rest_framework.ObjectPKValidator(
+                human_name="related models",
+                repository_class=repositories.RelatedModelRepository,
             ),
-            "m2m_related_models_ids": (
-                fastapi_rest_framework.ObjectPKValidator(
-                    human_name="related models",
-                    repository=self.repository.init_other(
-                        repositories.RelatedModelRepository,
-                    ),
-                ),
+        ),
+        "file": (fastapi_rest_framework.s3.S3URLValidator(),),
+        "files": (fastapi_rest_framework.s3.S3URLValidator(),),
+    }
+
+    def _get_unique_constraints(
+        self,
+    ) -> list[fastapi_rest_framework.UniqueConstraintType]:
+        return [
+            (
+                "text",
+                "text_nullable",
             ),
-            "file": (fastapi_rest_framework.s3.S3URLValidator(),),
-            "files": (fastapi_rest_framework.s3.S3URLValidator(),),
-        }
+        ]
 
 
 class ListTestModelValidator(
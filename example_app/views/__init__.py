@@ -1,3 +1,5 @@
+from .cached_test_model import CachedTestModelAPIView
+from .cursor_test_model import CursorTestModelAPIView
 from .guarded_endpoint import router as guarded_endpoint_router
 from .s3 import S3GetParamsView
 from .soft_delete_test_model import SoftDeleteTestModelAPIView
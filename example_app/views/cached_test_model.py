@@ -0,0 +1,62 @@
+import fastapi
+
+import fastapi_rest_framework
+
+from .. import models, repositories, schemas, security
+from . import core
+from .test_model import Context, Filters
+
+
+class CachedTestModelAPIView(
+    core.ListMixin[
+        schemas.TestModelList,
+        Filters,
+        repositories.TestModelRepository,
+        repositories.TestModelRepository.model,
+    ],
+    core.DetailMixin[
+        schemas.TestModelList,
+        repositories.TestModelRepository,
+        repositories.TestModelRepository.model,
+    ],
+    core.BaseView[
+        repositories.TestModelRepository,
+        repositories.TestModelRepository.model,
+    ],
+):
+    """TestModel API with cached responses and conditional requests."""
+
+    router = fastapi.APIRouter(
+        prefix="/cached-test-models",
+        tags=["CachedTestModels"],
+    )
+    repository_class = repositories.TestModelRepository
+    model = repository_class.model
+    base_permissions = (security.AuthRequiredPermission[model](),)
+    permission_map = {  # noqa: RUF012
+        "default": (security.AllowPermission[model](),),
+    }
+    annotations_map = {  # noqa: RUF012
+        "default": (
+            repositories.TestModelRepository.model.related_models_count,
+        ),
+    }
+    select_in_load_map = {  # noqa: RUF012
+        "default": (repositories.TestModelRepository.model.related_model,),
+    }
+    joined_load_map = {  # noqa: RUF012
+        "default": (repositories.TestModelRepository.model.related_models,),
+    }
+    cache_config_map = {  # noqa: RUF012
+        "default": fastapi_rest_framework.CacheConfig(ttl=60, stale_ttl=60),
+    }
+    cache_models = (models.RelatedModel,)
+    cache_control_map = {  # noqa: RUF012
+        "default": "private, max-age=60",
+    }
+    etag_field = "modified"
+    list_schema = schemas.TestModelList
+    detail_schema = schemas.TestModelList
+    filter = Filters
+    ordering_fields = ("id",)
+    context = Context
@@ -51,6 +51,24 @@ class ListMixin(
     """List mixin for sqlalchemy."""
 
 
+class ExportMixin(
+    fastapi_rest_framework.sqlalchemy.ExportMixin[
+        fastapi_rest_framework.ListSchema,
+        fastapi_rest_framework.FiltersT,
+        security.UserJWTData,
+        fastapi_rest_framework.sqlalchemy.SqlAlchemyRepositoryT,
+        saritasa_sqlalchemy_tools.BaseModelT,
+    ],
+    typing.Generic[
+        fastapi_rest_framework.ListSchema,
+        fastapi_rest_framework.FiltersT,
+        fastapi_rest_framework.sqlalchemy.SqlAlchemyRepositoryT,
+        saritasa_sqlalchemy_tools.BaseModelT,
+    ],
+):
+    """Export mixin for sqlalchemy."""
+
+
 class DetailMixin(
     fastapi_rest_framework.sqlalchemy.DetailMixin[
         fastapi_rest_framework.DetailSchema,
@@ -0,0 +1,53 @@
+import fastapi
+
+import fastapi_rest_framework
+
+from .. import repositories, schemas, security
+from . import core
+from .test_model import Context, Filters
+
+
+class CursorTestModelAPIView(
+    core.ListMixin[
+        schemas.TestModelList,
+        Filters,
+        repositories.TestModelRepository,
+        repositories.TestModelRepository.model,
+    ],
+    core.BaseView[
+        repositories.TestModelRepository,
+        repositories.TestModelRepository.model,
+    ],
+):
+    """TestModel API with cursor pagination."""
+
+    router = fastapi.APIRouter(
+        prefix="/cursor-test-models",
+        tags=["CursorTestModels"],
+    )
+    repository_class = repositories.TestModelRepository
+    model = repository_class.model
+    base_permissions = (security.AuthRequiredPermission[model](),)
+    permission_map = {  # noqa: RUF012
+        "default": (security.AllowPermission[model](),),
+    }
+    annotations_map = {  # noqa: RUF012
+        "default": (
+            repositories.TestModelRepository.model.related_models_count,
+        ),
+    }
+    select_in_load_map = {  # noqa: RUF012
+        "default": (repositories.TestModelRepository.model.related_model,),
+    }
+    joined_load_map = {  # noqa: RUF012
+        "default": (repositories.TestModelRepository.model.related_models,),
+    }
+    list_schema = schemas.TestModelList
+    filter = Filters
+    ordering_fields = ("id", "number")
+    pagination_mode = fastapi_rest_framework.PaginationMode.cursor
+    prerender_response_map = {  # noqa: RUF012
+        "list": True,
+    }
+    context = Context
+    statement_cache_size = 128
@@ -48,4 +48,7 @@ class SoftDeleteTestModelAPIView(
     create_detail_schema = schemas.SoftDeleteTestCreateModelDetail
     update_schema = schemas.SoftDeleteTestModelCreateUpdateRequest
     update_detail_schema = schemas.SoftDeleteTestUpdateModelDetail
+    prerender_response_map = {  # noqa: RUF012
+        "default": True,
+    }
     context = Context
@@ -66,6 +66,12 @@ class Filters(core.Filters[repositories.TestModelRepository.model]):
         return self
 
 
+# Schema of items of bulk request, which runs pure validators of item validator
+TestModelBulkCreateRequest = validators.TestModelValidator.get_request_schema(
+    schemas.TestModelBulkCreateRequest,
+)
+
+
 class TestModelAPIView(
     core.DeleteMixin[
         repositories.TestModelRepository,
@@ -94,6 +100,12 @@ class TestModelAPIView(
         repositories.TestModelRepository,
         repositories.TestModelRepository.model,
     ],
+    core.ExportMixin[
+        schemas.TestModelList,
+        Filters,
+        repositories.TestModelRepository,
+        repositories.TestModelRepository.model,
+    ],
     core.BaseView[
         repositories.TestModelRepository,
         repositories.TestModelRepository.model,
@@ -116,6 +128,10 @@ class TestModelAPIView(
         "default": validators.TestModelValidator,
         "action": validators.ListTestModelValidator,
     }
+    validation_limits_map = {  # noqa: RUF012
+        "default": None,
+        "action": fastapi_rest_framework.ValidationLimits(max_errors=100),
+    }
     annotations_map = {  # noqa: RUF012
         "default": (
             repositories.TestModelRepository.model.related_models_count,
@@ -216,15 +232,19 @@ class TestModelAPIView(
         self,
         user: security.UserJWTData,
         repository: repositories.TestModelRepository,
-        objects: list[schemas.TestModelBulkCreateRequest],
+        objects: list[TestModelBulkCreateRequest],
         validator: type[validators.ListTestModelValidator],
         interactor: type[interactors.TestModelInteractor],
         context: Context,
+        validation_limits: fastapi_rest_framework.ValidationLimits | None,
         **kwargs,
     ) -> None:
         """Recreate all instances."""
-        data = await validator(repository=repository)(
-            value=list(map(dict, objects)),
+        list_validator = validator(repository=repository)
+        if validation_limits:
+            list_validator.limits = validation_limits
+        data = await list_validator.validate_schemas(
+            schemas=objects,
             context=dict(context),
         )
         if data is None:
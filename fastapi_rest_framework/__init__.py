@@ -1,5 +1,13 @@
 import contextlib
 
+from .cache import (
+    BaseCacheBackend,
+    CacheConfig,
+    CacheEntry,
+    InMemoryCacheBackend,
+    get_cache_backend,
+    set_cache_backend,
+)
 from .common_types import ContextType
 from .exception_handlers import (
     explicit_pydantic_error_handler,
@@ -22,9 +30,12 @@ from .interactors import (
 )
 from .permissions import (
     BasePermission,
+    PermissionDecision,
+    PermissionDecisionCache,
     PermissionInstanceT,
     RequestData,
     UserT,
+    check_permissions,
     get_permissions_dependency,
 )
 from .repositories import (
@@ -36,34 +47,55 @@ from .repositories import (
     ApiRepositoryProtocolT,
     LazyLoadedT,
     OrderingClauseT,
+    RepositoryCheck,
+    RepositoryCheckKind,
     SelectStatementT,
+    UniqueViolationError,
     WhereFilterT,
 )
 from .validators import (
+    LOOKUP_CACHE_CONTEXT_KEY,
+    UNIQUE_VIOLATIONS_CONTEXT_KEY,
     AnyGenericInput,
     AnyGenericOutput,
     ApiDataType,
     BaseListValidator,
     BaseModelListValidator,
     BaseModelValidator,
+    BasePureValidator,
+    BaseRepositoryValidator,
     BaseValidator,
     DatetimeValidator,
     GenericError,
     LOCType,
+    LookupCache,
+    LookupValue,
+    LoweredValidators,
     NotEqualToValues,
     ObjectPKValidator,
     RegexValidator,
     TimeZoneValidator,
     UniqueByFieldValidator,
     UniqueConstraintType,
+    UniqueViolation,
+    UniqueViolations,
     ValidationError,
+    ValidationErrors,
     ValidationErrorSchema,
     ValidationErrorType,
+    ValidationLimits,
     ValidationMapType,
+    ValidationPlan,
+    ValidatorBinding,
+    ValuesLookup,
+    compile_request_schema,
+    get_lookup_cache,
+    get_unique_violations,
 )
 from .views import (
     DEFAULT_ERROR_RESPONSES,
     ActionMixin,
+    ActionPlan,
     ActionResponsesMap,
     AnyBaseAPIView,
     AnyFilters,
@@ -71,22 +103,31 @@ from .views import (
     BaseAPIViewMeta,
     BaseAPIViewMixin,
     Context,
+    CountStrategy,
     CreateMixin,
     CreateSchema,
+    CursorPaginatedResult,
+    CursorPaginationParams,
     DeleteMixin,
     DetailMixin,
     DetailSchema,
+    ExportFormat,
+    ExportMixin,
     Filters,
     FiltersT,
     ListMixin,
     ListSchema,
+    PageInfo,
     PaginatedBaseModel,
     PaginatedResult,
+    PaginationMode,
     PaginationParams,
     ResponsesMap,
     UpdateMixin,
     UpdateSchema,
     action,
+    include_views,
+    register_pending_views,
 )
 
 with contextlib.suppress(ImportError):
@@ -109,6 +150,7 @@ __all__ = (
     "s3",
     "action",
     "ActionMixin",
+    "ActionPlan",
     "ActionResponsesMap",
     "AnnotationT",
     "AnyApiDataInteractor",
@@ -127,58 +169,96 @@ __all__ = (
     "BaseAPIView",
     "BaseAPIViewMeta",
     "BaseAPIViewMixin",
+    "BaseCacheBackend",
     "BaseHooksMixin",
     "BaseListValidator",
     "BaseModelListValidator",
     "BaseModelValidator",
     "BasePermission",
+    "BasePureValidator",
+    "BaseRepositoryValidator",
     "BaseValidator",
+    "CacheConfig",
+    "CacheEntry",
     "Context",
     "ContextType",
+    "CountStrategy",
     "CreateMixin",
     "CreateSchema",
+    "CursorPaginatedResult",
+    "CursorPaginationParams",
     "DatetimeValidator",
     "DEFAULT_ERROR_RESPONSES",
     "DeleteMixin",
     "DetailMixin",
     "DetailSchema",
+    "ExportFormat",
+    "ExportMixin",
     "Filters",
     "FiltersT",
     "GenericError",
+    "check_permissions",
+    "compile_request_schema",
+    "get_cache_backend",
+    "get_lookup_cache",
+    "get_unique_violations",
     "get_permissions_dependency",
     "explicit_pydantic_error_handler",
     "http_exception_handler",
+    "include_views",
+    "InMemoryCacheBackend",
     "LazyLoadedT",
     "ListMixin",
     "ListSchema",
     "LOCType",
+    "LOOKUP_CACHE_CONTEXT_KEY",
+    "LookupCache",
+    "LookupValue",
+    "LoweredValidators",
     "M2MCreateUpdateConfig",
     "NotEqualToValues",
     "NotFoundException",
     "ObjectPKValidator",
     "OrderingClauseT",
+    "PageInfo",
     "PaginatedBaseModel",
     "PaginatedResult",
+    "PaginationMode",
     "PaginationParams",
     "PermissionActionException",
+    "PermissionDecision",
+    "PermissionDecisionCache",
     "PermissionException",
     "PermissionInstanceT",
     "pydantic_validation_error_exception_handler",
     "RegexValidator",
+    "register_pending_views",
+    "RepositoryCheck",
+    "RepositoryCheckKind",
     "RequestData",
     "ResponsesMap",
+    "set_cache_backend",
     "SelectStatementT",
     "TimeZoneValidator",
     "UnauthorizedException",
     "UniqueByFieldValidator",
     "UniqueConstraintType",
+    "UNIQUE_VIOLATIONS_CONTEXT_KEY",
+    "UniqueViolations",
+    "UniqueViolation",
+    "UniqueViolationError",
     "UpdateMixin",
     "UpdateSchema",
     "UserT",
     "validation_error_exception_handler",
     "ValidationError",
     "ValidationErrorSchema",
+    "ValidationErrors",
     "ValidationErrorType",
+    "ValidationLimits",
     "ValidationMapType",
+    "ValidationPlan",
+    "ValidatorBinding",
+    "ValuesLookup",
     "WhereFilterT",
 )
@@ -0,0 +1,9 @@
+from .core import (
+    BaseCacheBackend,
+    CacheConfig,
+    CacheEntry,
+    InMemoryCacheBackend,
+    get_cache_backend,
+    get_model_namespace,
+    set_cache_backend,
+)
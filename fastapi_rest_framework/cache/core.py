@@ -0,0 +1,163 @@
+import asyncio
+import collections
+import collections.abc
+import dataclasses
+import time
+import typing
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheConfig:
+    """Configuration of response cache for endpoint.
+
+    Entry is served as is for `ttl` seconds. After that, for `stale_ttl`
+    seconds it is served to concurrent requests, while one of them loads
+    fresh data (stale-while-revalidate). Stale entries are also served if
+    loading of data fails with one of `cache_stale_on_errors` of view (for
+    example, when db is overloaded).
+
+    """
+
+    ttl: float
+    stale_ttl: float = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """Representation of cached response."""
+
+    content: bytes
+    fresh_until: float
+    stale_until: float
+
+    def is_fresh(self, now: float) -> bool:
+        """Check that entry can be served without revalidation."""
+        return now < self.fresh_until
+
+    def is_expired(self, now: float) -> bool:
+        """Check that entry can't be served at all."""
+        return now >= self.stale_until
+
+
+class BaseCacheBackend:
+    """Base backend for response cache.
+
+    Besides entries, backend stores version counters of models, which are
+    part of cache keys. Counters are bumped by interactors on writes, so
+    entries which depend on changed model are never read again.
+
+    To share cache between processes implement this interface on top of
+    shared storage (for example, redis).
+
+    """
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get entry by key."""
+        raise NotImplementedError  # pragma: no cover
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Save entry, it could be evicted after `stale_until`."""
+        raise NotImplementedError  # pragma: no cover
+
+    async def acquire_lock(self, key: str, timeout: float) -> bool:
+        """Try to acquire lock for revalidation of entry."""
+        raise NotImplementedError  # pragma: no cover
+
+    async def release_lock(self, key: str) -> None:
+        """Release lock for revalidation of entry."""
+        raise NotImplementedError  # pragma: no cover
+
+    async def get_versions(
+        self,
+        namespaces: collections.abc.Sequence[str],
+    ) -> list[int]:
+        """Get current versions of namespaces."""
+        raise NotImplementedError  # pragma: no cover
+
+    async def bump_version(self, namespace: str) -> None:
+        """Increase version of namespace."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class InMemoryCacheBackend(BaseCacheBackend):
+    """Cache backend which stores entries in memory of process.
+
+    Entries are evicted when they are expired or when `max_size` is reached
+    (least recently used first).
+
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.entries: collections.OrderedDict[str, CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self.locks: dict[str, float] = {}
+        self.versions: collections.Counter[str] = collections.Counter()
+        self.mutex = asyncio.Lock()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get entry by key."""
+        if (entry := self.entries.get(key)) is None:
+            return None
+        if entry.is_expired(time.time()):
+            self.entries.pop(key, None)
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Save entry, it could be evicted after `stale_until`."""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def acquire_lock(self, key: str, timeout: float) -> bool:
+        """Try to acquire lock for revalidation of entry."""
+        async with self.mutex:
+            now = time.time()
+            if self.locks.get(key, 0) > now:
+                return False
+            self.locks[key] = now + timeout
+            return True
+
+    async def release_lock(self, key: str) -> None:
+        """Release lock for revalidation of entry."""
+        self.locks.pop(key, None)
+
+    async def get_versions(
+        self,
+        namespaces: collections.abc.Sequence[str],
+    ) -> list[int]:
+        """Get current versions of namespaces."""
+        return [self.versions[namespace] for namespace in namespaces]
+
+    async def bump_version(self, namespace: str) -> None:
+        """Increase version of namespace."""
+        self.versions[namespace] += 1
+
+    def clear(self) -> None:
+        """Remove all entries and versions."""
+        self.entries.clear()
+        self.locks.clear()
+        self.versions.clear()
+
+
+_backend: BaseCacheBackend = InMemoryCacheBackend()
+
+
+def get_cache_backend() -> BaseCacheBackend:
+    """Get backend which is used by views and interactors."""
+    return _backend
+
+
+def set_cache_backend(backend: BaseCacheBackend) -> None:
+    """Set backend which is used by views and interactors."""
+    global _backend
+    _backend = backend
+
+
+def get_model_namespace(model: type[typing.Any]) -> str:
+    """Get namespace of version counter of model."""
+    return f"{model.__module__}.{model.__qualname__}"
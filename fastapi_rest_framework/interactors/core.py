@@ -1,8 +1,17 @@
 import collections.abc
+import contextlib
 import dataclasses
+import functools
 import typing
 
-from .. import common_types, metrics, permissions, repositories, validators
+from .. import (
+    cache,
+    common_types,
+    metrics,
+    permissions,
+    repositories,
+    validators,
+)
 
 
 class BaseHooksMixin(typing.Generic[repositories.APIModelT]):
@@ -217,6 +226,8 @@ class ApiDataInteractor(
                 context=context,
                 refresh=refresh,
             )
+        await self.invalidate_cache()
+        self.invalidate_lookups(context)
         reloaded_instance = await self._reload_instance(
             instance=saved_instance,
             reload_fetch_statement=reload_fetch_statement,
@@ -263,10 +274,11 @@ class ApiDataInteractor(
             data=data,
             context=context,
         )
-        await self._save_object_in_db(
-            instance=instance,
-            refresh=refresh,
-        )
+        with self.raise_unique_violations(context):
+            await self._save_object_in_db(
+                instance=instance,
+                refresh=refresh,
+            )
         for m2m_config, values in m2m_data:
             await self.create_m2m(
                 instance=instance,
@@ -302,10 +314,11 @@ class ApiDataInteractor(
             data=data,
             context=context,
         )
-        await self._save_object_in_db(
-            instance=instance,
-            refresh=refresh,
-        )
+        with self.raise_unique_violations(context):
+            await self._save_object_in_db(
+                instance=instance,
+                refresh=refresh,
+            )
         for m2m_config, values in m2m_data:
             await self.update_m2m(
                 instance=instance,
@@ -327,6 +340,8 @@ class ApiDataInteractor(
             context=context,
         )
         await self.repository.delete(instance=instance)
+        await self.invalidate_cache()
+        self.invalidate_lookups(context)
         await self._post_delete_hook(
             deleted_instance=instance,
             context=context,
@@ -339,15 +354,19 @@ class ApiDataInteractor(
         context: common_types.ContextType,
     ) -> list[repositories.APIModelT]:
         """Perform bulk create."""
-        return await self._create_batch_in_db(
-            objects=tuple(
-                self._prepare_instance_from_api(
-                    data=data_entry,
-                    context=context,
-                )
-                for data_entry in data
-            ),
-        )
+        with self.raise_unique_violations(context):
+            instances = await self._create_batch_in_db(
+                objects=tuple(
+                    self._prepare_instance_from_api(
+                        data=data_entry,
+                        context=context,
+                    )
+                    for data_entry in data
+                ),
+            )
+        await self.invalidate_cache()
+        self.invalidate_lookups(context)
+        return instances
 
     @metrics.tracker
     async def update_batch(
@@ -356,16 +375,67 @@ class ApiDataInteractor(
         context: common_types.ContextType,
     ) -> None:
         """Perform bulk update."""
-        await self._update_batch_in_db(
-            objects=tuple(
-                self._prepare_instance_from_api(
-                    data=data_entry,
-                    context=context,
-                )
-                for data_entry in data
-            ),
+        with self.raise_unique_violations(context):
+            await self._update_batch_in_db(
+                objects=tuple(
+                    self._prepare_instance_from_api(
+                        data=data_entry,
+                        context=context,
+                    )
+                    for data_entry in data
+                ),
+            )
+        await self.invalidate_cache()
+        self.invalidate_lookups(context)
+
+    @metrics.tracker
+    async def invalidate_cache(self) -> None:
+        """Invalidate cached responses which depend on model.
+
+        Version of model is bumped, so cached entries with previous version
+        are not used anymore. Version is bumped once more after commit of
+        changes, since concurrent requests could cache data without not
+        committed changes under bumped version.
+
+        """
+        backend = cache.get_cache_backend()
+        namespace = cache.get_model_namespace(self.repository.model)
+        await backend.bump_version(namespace)
+        self.repository.run_after_commit(
+            functools.partial(backend.bump_version, namespace),
         )
 
+    @metrics.tracker
+    def invalidate_lookups(self, context: common_types.ContextType) -> None:
+        """Invalidate lookups of model in cache of lookups of request.
+
+        Validators of request, which are run after changes, check values of
+        model against database again.
+
+        """
+        if lookup_cache := validators.get_lookup_cache(context):
+            lookup_cache.invalidate(self.repository.model)
+
+    @contextlib.contextmanager
+    def raise_unique_violations(
+        self,
+        context: common_types.ContextType,
+    ) -> collections.abc.Iterator[None]:
+        """Raise validation errors on violations of unique constraints.
+
+        Errors are registered by validators in optimistic mode, which don't
+        check uniqueness before saving.
+
+        """
+        try:
+            yield
+        except repositories.UniqueViolationError as error:
+            registry = validators.get_unique_violations(context)
+            validation_error = registry.get_error(error) if registry else None
+            if validation_error is None:
+                raise
+            raise validation_error from error
+
     @metrics.tracker
     async def _save_object_in_db(
         self,
@@ -483,6 +553,7 @@ class ApiDataInteractor(
                 ),
             },
         )
+        interactor.invalidate_lookups(context)
         # Create m2m links that are not in db, but in requests
         await interactor.create_batch(
             data=[
@@ -1,3 +1,4 @@
+import collections
 import collections.abc
 import contextlib
 import functools
@@ -24,9 +25,27 @@ def tracker(
     return wrapper_tracker
 
 
+# Values of counters, which are collected by default `counter`
+counters: collections.Counter[str] = collections.Counter()
+
+
+def counter(name: str, value: int = 1) -> None:
+    """Increment counter of events (for example cache hits)."""
+    counters[name] += value
+
+
 with contextlib.suppress(KeyError):  # pragma: no cover
     metric_tracker_path = os.environ["FASTAPI_REST_FRAMEWORK_METRIC_TRACKER"]
     *module, tracker_name = metric_tracker_path.split(".")
     tracker = getattr(importlib.import_module(".".join(module)), tracker_name)
 
-__all__ = ("tracker",)
+with contextlib.suppress(KeyError):  # pragma: no cover
+    metric_counter_path = os.environ["FASTAPI_REST_FRAMEWORK_METRIC_COUNTER"]
+    *module, counter_name = metric_counter_path.split(".")
+    counter = getattr(importlib.import_module(".".join(module)), counter_name)
+
+__all__ = (
+    "counter",
+    "counters",
+    "tracker",
+)
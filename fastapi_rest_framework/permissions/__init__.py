@@ -1,3 +1,4 @@
-from .core import BasePermission, PermissionInstanceT
+from .cache import PermissionDecision, PermissionDecisionCache
+from .core import BasePermission, PermissionInstanceT, check_permissions
 from .dependencies import get_permissions_dependency
 from .types import RequestData, UserT
@@ -0,0 +1,69 @@
+import collections
+import collections.abc
+import copy
+import dataclasses
+
+import fastapi
+
+
+@dataclasses.dataclass(frozen=True)
+class PermissionDecision:
+    """Representation of cached result of permission check."""
+
+    error: fastapi.HTTPException | None
+    expires_at: float
+
+    def is_expired(self, now: float) -> bool:
+        """Check that decision can't be used anymore."""
+        return now >= self.expires_at
+
+    def apply(self) -> None:
+        """Raise cached error if permission was denied."""
+        if self.error is not None:
+            # Copy is raised, so traceback of cached error is not extended
+            raise copy.copy(self.error)
+
+
+class PermissionDecisionCache:
+    """In memory storage of decisions of permissions.
+
+    Decisions are evicted when they are expired or when `max_size` is
+    reached (least recently used first).
+
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.decisions: collections.OrderedDict[
+            collections.abc.Hashable,
+            PermissionDecision,
+        ] = collections.OrderedDict()
+
+    def get(
+        self,
+        key: collections.abc.Hashable,
+        now: float,
+    ) -> PermissionDecision | None:
+        """Get decision by key."""
+        if (decision := self.decisions.get(key)) is None:
+            return None
+        if decision.is_expired(now):
+            self.decisions.pop(key, None)
+            return None
+        self.decisions.move_to_end(key)
+        return decision
+
+    def set(
+        self,
+        key: collections.abc.Hashable,
+        decision: PermissionDecision,
+    ) -> None:
+        """Save decision."""
+        self.decisions[key] = decision
+        self.decisions.move_to_end(key)
+        while len(self.decisions) > self.max_size:
+            self.decisions.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all decisions."""
+        self.decisions.clear()
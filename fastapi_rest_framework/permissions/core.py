@@ -1,7 +1,14 @@
+import asyncio
+import collections.abc
+import functools
+import hashlib
+import time
 import typing
 
+import fastapi
+
 from .. import common_types, metrics
-from . import types
+from . import cache, types
 
 PermissionInstanceT = typing.TypeVar("PermissionInstanceT", bound=typing.Any)
 
@@ -12,7 +19,33 @@ class BasePermission(
         types.UserT,
     ],
 ):
-    """Base implementation of permissions."""
+    """Base implementation of permissions.
+
+    Permissions marked as `independent` don't rely on checks of previous
+    permissions (for example that user is authenticated), so they are
+    checked concurrently with neighboring independent permissions.
+
+    Permissions, result of which depends only on user, action and
+    configuration of permission, could set `decision_cache_ttl` and
+    implement `get_decision_cache_config` to reuse results of checks
+    between requests. Results of instance checks are cached only if
+    `get_instance_decision_cache_key` is implemented.
+
+    """
+
+    independent: bool = False
+    decision_cache_ttl: float = 0
+    decision_cache: typing.ClassVar[cache.PermissionDecisionCache] = (
+        cache.PermissionDecisionCache()
+    )
+
+    @property
+    def checks_instance(self) -> bool:
+        """Check that permission has check of instance."""
+        return (
+            type(self)._check_instance_permission
+            is not BasePermission._check_instance_permission
+        )
 
     @metrics.tracker
     async def __call__(
@@ -24,20 +57,137 @@ class BasePermission(
         instance: PermissionInstanceT | None = None,
     ) -> None:
         """Check permissions."""
-        await self._check_permission(
-            user=user,
-            action=action,
-            context=context,
-            request_data=request_data,
-        )
-        if instance:
-            await self._check_instance_permission(
+        await self._check_with_decision_cache(
+            key=self.get_decision_cache_key(
+                user=user,
+                action=action,
+                context=context,
+            ),
+            check=functools.partial(
+                self._check_permission,
                 user=user,
                 action=action,
-                instance=instance,
                 context=context,
                 request_data=request_data,
+            ),
+        )
+        if instance:
+            await self._check_with_decision_cache(
+                key=self.get_instance_decision_cache_key(
+                    user=user,
+                    action=action,
+                    instance=instance,
+                    context=context,
+                ),
+                check=functools.partial(
+                    self._check_instance_permission,
+                    user=user,
+                    action=action,
+                    instance=instance,
+                    context=context,
+                    request_data=request_data,
+                ),
+            )
+
+    def get_decision_cache_key(
+        self,
+        user: types.UserT,
+        action: str,
+        context: common_types.ContextType,
+    ) -> collections.abc.Hashable | None:
+        """Get key of cached result of `_check_permission`.
+
+        By default, key consists of permission class, its configuration,
+        hash of user's claims and action. Result isn't cached, if
+        configuration of permission isn't defined. Override it, if
+        permission depends on context.
+
+        """
+        if not self.decision_cache_ttl:
+            return None
+        config = self.get_decision_cache_config()
+        if config is None:
+            return None
+        return (
+            type(self),
+            config,
+            hashlib.sha256(user.model_dump_json().encode()).hexdigest(),
+            action,
+        )
+
+    def get_decision_cache_config(self) -> collections.abc.Hashable | None:
+        """Get configuration of permission, which its results depend on.
+
+        It's a part of key of cached results, so that instances of same
+        permission with different configuration don't share results. Return
+        `()` if permission has no configuration. By default it's None, so
+        results are not cached.
+
+        """
+        return None
+
+    def get_instance_decision_cache_key(
+        self,
+        user: types.UserT,
+        action: str,
+        instance: PermissionInstanceT,
+        context: common_types.ContextType,
+    ) -> collections.abc.Hashable | None:
+        """Get key of cached result of `_check_instance_permission`."""
+        return None
+
+    async def _check_with_decision_cache(
+        self,
+        key: collections.abc.Hashable | None,
+        check: collections.abc.Callable[
+            [],
+            collections.abc.Awaitable[None],
+        ],
+    ) -> None:
+        """Check permission, reusing decision saved by key."""
+        if key is None:
+            await check()
+            return
+        now = time.monotonic()
+        if (decision := self.decision_cache.get(key, now)) is not None:
+            self._apply_decision(decision)
+            return
+        await self._load_decision(key=key, check=check, now=now)
+
+    @metrics.tracker
+    def _apply_decision(self, decision: cache.PermissionDecision) -> None:
+        """Apply decision, which was saved in cache (cache hit)."""
+        decision.apply()
+
+    @metrics.tracker
+    async def _load_decision(
+        self,
+        key: collections.abc.Hashable,
+        check: collections.abc.Callable[
+            [],
+            collections.abc.Awaitable[None],
+        ],
+        now: float,
+    ) -> None:
+        """Check permission and save its decision (cache miss)."""
+        try:
+            await check()
+        except fastapi.HTTPException as error:
+            self.decision_cache.set(
+                key,
+                cache.PermissionDecision(
+                    error=error,
+                    expires_at=now + self.decision_cache_ttl,
+                ),
             )
+            raise
+        self.decision_cache.set(
+            key,
+            cache.PermissionDecision(
+                error=None,
+                expires_at=now + self.decision_cache_ttl,
+            ),
+        )
 
     async def _check_permission(
         self,
@@ -57,3 +207,121 @@ class BasePermission(
         request_data: types.RequestData,
     ) -> None:
         """Check that user has permission for instance."""
+
+    async def get_queryset_filters(
+        self,
+        user: types.UserT,
+        action: str,
+        context: common_types.ContextType,
+    ) -> collections.abc.Sequence[typing.Any]:
+        """Get filters which limit instances to ones available to user.
+
+        Filters are applied to queries of list endpoints, so rows which user
+        can't access are not loaded at all.
+
+        """
+        return ()
+
+
+async def check_permissions(
+    permissions: collections.abc.Iterable[
+        BasePermission[PermissionInstanceT, types.UserT]
+    ],
+    user: types.UserT,
+    context: common_types.ContextType,
+    action: str,
+    request_data: types.RequestData,
+    instance: PermissionInstanceT | None = None,
+) -> None:
+    """Check permissions in their order.
+
+    Same permission instance is checked once. Consecutive independent
+    permissions are checked concurrently, but error of first failed
+    permission in order is raised, as if they were checked one by one.
+
+    """
+    group: list[BasePermission[PermissionInstanceT, types.UserT]] = []
+    for permission in dict.fromkeys(permissions):
+        if permission.independent:
+            group.append(permission)
+            continue
+        await _check_concurrently(
+            permissions=group,
+            user=user,
+            context=context,
+            action=action,
+            request_data=request_data,
+            instance=instance,
+        )
+        group = []
+        await permission(
+            user=user,
+            context=context,
+            action=action,
+            request_data=request_data,
+            instance=instance,
+        )
+    await _check_concurrently(
+        permissions=group,
+        user=user,
+        context=context,
+        action=action,
+        request_data=request_data,
+        instance=instance,
+    )
+
+
+async def _check_concurrently(
+    permissions: collections.abc.Sequence[
+        BasePermission[PermissionInstanceT, types.UserT]
+    ],
+    user: types.UserT,
+    context: common_types.ContextType,
+    action: str,
+    request_data: types.RequestData,
+    instance: PermissionInstanceT | None = None,
+) -> None:
+    """Check permissions concurrently.
+
+    Once permission fails, checks of following permissions are cancelled,
+    while checks of previous ones are awaited, since their errors take
+    precedence.
+
+    """
+    if len(permissions) <= 1:
+        for permission in permissions:
+            await permission(
+                user=user,
+                context=context,
+                action=action,
+                request_data=request_data,
+                instance=instance,
+            )
+        return
+    tasks = [
+        asyncio.ensure_future(
+            permission(
+                user=user,
+                context=context,
+                action=action,
+                request_data=request_data,
+                instance=instance,
+            ),
+        )
+        for permission in permissions
+    ]
+
+    def cancel_following(task: asyncio.Future[None]) -> None:
+        if task.cancelled() or task.exception() is None:
+            return
+        for following in tasks[tasks.index(task) + 1 :]:
+            following.cancel()
+
+    for task in tasks:
+        task.add_done_callback(cancel_following)
+    try:
+        for task in tasks:
+            await task
+    finally:
+        for task in tasks:
+            task.cancel()
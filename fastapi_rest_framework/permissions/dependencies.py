@@ -36,12 +36,12 @@ def get_permissions_dependency(
         user_data: user_dependency,
         context: context_dependency,
     ) -> None:
-        for permission in permissions:
-            await permission(
-                user=user_data,
-                action=action,
-                context=context,
-                request_data=None,
-            )
+        await core.check_permissions(
+            permissions=permissions,
+            user=user_data,
+            action=action,
+            context=context,
+            request_data=None,
+        )
 
     return _permissions_dependency
@@ -7,6 +7,9 @@ from .protocol import (
     ApiRepositoryProtocolT,
     LazyLoadedT,
     OrderingClauseT,
+    RepositoryCheck,
+    RepositoryCheckKind,
     SelectStatementT,
+    UniqueViolationError,
     WhereFilterT,
 )
@@ -1,4 +1,6 @@
 import collections.abc
+import dataclasses
+import enum
 import typing
 
 SelectStatementT = typing.TypeVar(
@@ -35,6 +37,59 @@ APIModelT = typing.TypeVar(
 )
 
 
+class RepositoryCheckKind(enum.StrEnum):
+    """Representation of kinds of checks of entries."""
+
+    exists = "exists"
+    count = "count"
+
+
+@dataclasses.dataclass(frozen=True)
+class RepositoryCheck:
+    """Representation of check of entries, which match filters.
+
+    Checks are used by validators, so that checks of different validators
+    (even against different repositories) are run in one query.
+
+    """
+
+    repository: "AnyApiRepositoryProtocol"
+    kind: RepositoryCheckKind
+    where: collections.abc.Sequence[typing.Any] = ()
+    filters_by: collections.abc.Mapping[str, typing.Any] = dataclasses.field(
+        default_factory=dict,
+    )
+
+
+class UniqueViolationError(Exception):
+    """Raise if changes of entries violate unique constraint of model.
+
+    `fields` are fields of model, which are covered by constraint, `values`
+    are values of these fields (as reported by data source), if they are
+    known. Details are keyword only, so that error could be combined with
+    errors of data source.
+
+    """
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        constraint_name: str | None = None,
+        fields: collections.abc.Sequence[str] = (),
+        values: collections.abc.Sequence[typing.Any] | None = None,
+    ) -> None:
+        super().__init__(
+            *args
+            or (
+                f"Unique constraint {constraint_name} of fields {fields} is "
+                "violated",
+            ),
+        )
+        self.constraint_name = constraint_name
+        self.fields = tuple(fields)
+        self.values = tuple(values) if values is not None else None
+
+
 class ApiRepositoryProtocol(  # type: ignore
     typing.Protocol[
         APIModelT,
@@ -65,18 +120,35 @@ class ApiRepositoryProtocol(  # type: ignore
         refresh: bool = False,
         attribute_names: collections.abc.Sequence[str] | None = None,
     ) -> APIModelT:
-        """Save model instance."""
+        """Save model instance.
+
+        Raise `UniqueViolationError` if instance violates unique constraint.
+
+        """
         ...  # pragma: no cover
 
     async def delete(self, instance: APIModelT) -> None:
         """Delete model instance."""
 
+    def run_after_commit(
+        self,
+        callback: collections.abc.Callable[
+            [],
+            collections.abc.Awaitable[None],
+        ],
+    ) -> None:
+        """Run callback once changes are committed in data source."""
+
     async def insert_batch(
         self,
         objects: collections.abc.Sequence[APIModelT],
         exclude_fields: collections.abc.Sequence[str] = (),
     ) -> list[APIModelT]:
-        """Create batch of objects."""
+        """Create batch of objects.
+
+        Raise `UniqueViolationError` if objects violate unique constraint.
+
+        """
         ...  # pragma: no cover
 
     async def update_batch(
@@ -84,7 +156,11 @@ class ApiRepositoryProtocol(  # type: ignore
         objects: collections.abc.Sequence[APIModelT],
         exclude_fields: collections.abc.Sequence[str] = (),
     ) -> None:
-        """Update batch of objects."""
+        """Update batch of objects.
+
+        Raise `UniqueViolationError` if objects violate unique constraint.
+
+        """
 
     def get_fetch_statement(
         self,
@@ -118,6 +194,14 @@ class ApiRepositoryProtocol(  # type: ignore
         """Fetch entries."""
         ...  # pragma: no cover
 
+    def stream_all(
+        self,
+        statement: SelectStatementT,
+        chunk_size: int = 1000,
+    ) -> collections.abc.AsyncIterator[collections.abc.Sequence[APIModelT]]:
+        """Fetch entries in chunks without loading all of them in memory."""
+        ...  # pragma: no cover
+
     async def fetch_first(
         self,
         statement: SelectStatementT | None = None,
@@ -142,6 +226,32 @@ class ApiRepositoryProtocol(  # type: ignore
         """Get count of entries."""
         ...  # pragma: no cover
 
+    async def count_capped(
+        self,
+        cap: int,
+        where: collections.abc.Sequence[WhereFilterT] = (),
+        **filters_by: typing.Any,
+    ) -> int:
+        """Get count of entries, but no more than `cap`."""
+        ...  # pragma: no cover
+
+    async def count_estimated(
+        self,
+        where: collections.abc.Sequence[WhereFilterT] = (),
+        **filters_by: typing.Any,
+    ) -> int:
+        """Get estimated count of entries."""
+        ...  # pragma: no cover
+
+    async def count_and_max(
+        self,
+        field: str,
+        where: collections.abc.Sequence[WhereFilterT] = (),
+        **filters_by: typing.Any,
+    ) -> tuple[int, typing.Any]:
+        """Get count of entries and max value of field among them."""
+        ...  # pragma: no cover
+
     async def exists(
         self,
         where: collections.abc.Sequence[WhereFilterT] = (),
@@ -150,6 +260,27 @@ class ApiRepositoryProtocol(  # type: ignore
         """Check existence of entries."""
         ...  # pragma: no cover
 
+    async def fetch_existing_values(
+        self,
+        fields: collections.abc.Sequence[str],
+        values: collections.abc.Collection[tuple[typing.Any, ...]],
+        where: collections.abc.Sequence[WhereFilterT] = (),
+    ) -> set[tuple[typing.Any, ...]]:
+        """Get which of combinations of values of fields have entries."""
+        ...  # pragma: no cover
+
+    async def run_checks(
+        self,
+        checks: collections.abc.Sequence[RepositoryCheck],
+    ) -> list[int]:
+        """Run checks in one query.
+
+        For each check count of entries is returned (`0` or `1` for
+        `exists` checks).
+
+        """
+        ...  # pragma: no cover
+
 
 AnyApiRepositoryProtocol = ApiRepositoryProtocol[
     typing.Any,
@@ -1,7 +1,10 @@
+import asyncio
+import collections
 import collections.abc
 import typing
 
 import humanize
+import saritasa_s3_tools
 
 import fastapi_rest_framework
 
@@ -15,7 +18,26 @@ class S3URLValidator(
         str | collections.abc.Sequence[str],
     ],
 ):
-    """Check that s3 url is valid one and extract it's key."""
+    """Check that s3 url is valid one and extract it's key.
+
+    Keys of sequence are checked concurrently (each unique key once). If
+    `list_threshold` is set, keys of folder with at least that many checked
+    keys are found with listing of folder instead of request per key (it
+    requires permission to list bucket).
+
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        list_threshold: int | None = None,
+    ) -> None:
+        super().__init__()
+        # Max number of concurrent requests to s3 on check of sequence
+        self.max_concurrency = max_concurrency
+        # Min number of checked keys of folder, which are found with listing
+        # of folder
+        self.list_threshold = list_threshold
 
     async def _validate(
         self,
@@ -69,22 +91,113 @@ class S3URLValidator(
             )
             for url in value
         ]
-        errors = []
-        for index, key in enumerate(keys):
-            if not key or not await s3_client.async_is_file_in_bucket(key=key):
-                errors.append(
-                    fastapi_rest_framework.ValidationError(
-                        error_type=fastapi_rest_framework.ValidationErrorType.not_found,
-                        error_message="File was not found",
-                        loc=(*loc, index),
-                    ),
-                )
+        found_keys = await self._find_keys(
+            s3_client=s3_client,
+            keys={key for key in keys if key},
+        )
+        errors = [
+            fastapi_rest_framework.ValidationError(
+                error_type=fastapi_rest_framework.ValidationErrorType.not_found,
+                error_message="File was not found",
+                loc=(*loc, index),
+            )
+            for index, key in enumerate(keys)
+            if key not in found_keys
+        ]
         if errors:
             raise fastapi_rest_framework.ValidationError(
                 all_errors=errors,
             )
         return keys
 
+    async def _find_keys(
+        self,
+        s3_client: saritasa_s3_tools.AsyncS3Client,
+        keys: set[str],
+    ) -> set[str]:
+        """Find keys, which are present in bucket."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        folders: collections.defaultdict[str, set[str]] = (
+            collections.defaultdict(set)
+        )
+        for key in keys:
+            folders[key.rpartition("/")[0]].add(key)
+        checks: list[collections.abc.Awaitable[set[str]]] = []
+        for folder, folder_keys in folders.items():
+            if (
+                self.list_threshold is not None
+                and len(folder_keys) >= self.list_threshold
+            ):
+                checks.append(
+                    self._list_folder(
+                        s3_client=s3_client,
+                        folder=folder,
+                        keys=folder_keys,
+                        semaphore=semaphore,
+                    ),
+                )
+                continue
+            checks.extend(
+                self._check_key(
+                    s3_client=s3_client,
+                    key=key,
+                    semaphore=semaphore,
+                )
+                for key in folder_keys
+            )
+        return set().union(*await asyncio.gather(*checks))
+
+    async def _check_key(
+        self,
+        s3_client: saritasa_s3_tools.AsyncS3Client,
+        key: str,
+        semaphore: asyncio.Semaphore,
+    ) -> set[str]:
+        """Check that key is present in bucket."""
+        async with semaphore:
+            if await s3_client.async_is_file_in_bucket(key=key):
+                return {key}
+        return set()
+
+    async def _list_folder(
+        self,
+        s3_client: saritasa_s3_tools.AsyncS3Client,
+        folder: str,
+        keys: set[str],
+        semaphore: asyncio.Semaphore,
+    ) -> set[str]:
+        """Find keys of folder with listing of folder.
+
+        Listing starts right before first key and stops once last key is
+        passed, since s3 lists keys in order.
+
+        """
+        last_key = max(keys)
+        params: dict[str, typing.Any] = {
+            "Bucket": s3_client.default_bucket,
+            "Prefix": f"{folder}/" if folder else "",
+            "Delimiter": "/",
+            "StartAfter": min(keys)[:-1],
+        }
+        found_keys: set[str] = set()
+        async with semaphore:
+            while True:
+                response = await s3_client.run_sync_as_async(
+                    s3_client.boto3_client.list_objects_v2,
+                    **params,
+                )
+                listed_keys = [
+                    content["Key"] for content in response.get("Contents", ())
+                ]
+                found_keys.update(keys.intersection(listed_keys))
+                if (
+                    not response.get("IsTruncated")
+                    or found_keys == keys
+                    or (listed_keys and listed_keys[-1] >= last_key)
+                ):
+                    return found_keys
+                params["ContinuationToken"] = response["NextContinuationToken"]
+
 
 class S3RequestParamsValidator(
     fastapi_rest_framework.BaseValidator[
@@ -5,11 +5,13 @@ from .repositories import (
     SqlAlchemyRepository,
     SqlAlchemyRepositoryT,
     SqlAlchemySoftDeleteRepository,
+    SqlAlchemyUniqueViolationError,
 )
 from .views import (
     CreateMixin,
     DeleteMixin,
     DetailMixin,
+    ExportMixin,
     ListMixin,
     SqlAlchemyView,
     UpdateMixin,
@@ -21,10 +23,12 @@ __all__ = (
     "SqlAlchemyRepository",
     "SqlAlchemyRepositoryT",
     "SqlAlchemySoftDeleteRepository",
+    "SqlAlchemyUniqueViolationError",
     "SQLAlchemyFilters",
     "CreateMixin",
     "DeleteMixin",
     "DetailMixin",
+    "ExportMixin",
     "ListMixin",
     "SqlAlchemyView",
     "UpdateMixin",
@@ -1,4 +1,6 @@
 import collections.abc
+import contextlib
+import inspect
 import typing
 
 import fastapi
@@ -34,3 +36,65 @@ def get_repository(
         return repository_class(db_session=session)
 
     return _get_repository
+
+
+def get_repository_opener(
+    repository_class: type[
+        saritasa_sqlalchemy_tools.BaseRepository[
+            saritasa_sqlalchemy_tools.BaseModelT
+        ]
+    ],
+    session_dependency: type[saritasa_sqlalchemy_tools.Session],
+) -> collections.abc.Callable[
+    ...,
+    collections.abc.Callable[
+        [],
+        contextlib.AbstractAsyncContextManager[
+            saritasa_sqlalchemy_tools.BaseRepository[
+                saritasa_sqlalchemy_tools.BaseModelT
+            ]
+        ],
+    ],
+]:
+    """Get dependency injection for opener of db repository.
+
+    Opened repository has its own db session, which is closed on exit from
+    opener instead of on end of request, so it could be used while response
+    is streamed. Session dependency (or its override) shouldn't have
+    parameters.
+
+    """
+
+    @metrics.tracker
+    def _get_repository_opener(
+        request: fastapi.Request,
+    ) -> collections.abc.Callable[
+        [],
+        contextlib.AbstractAsyncContextManager[
+            saritasa_sqlalchemy_tools.BaseRepository[
+                saritasa_sqlalchemy_tools.BaseModelT
+            ]
+        ],
+    ]:
+        dependency = request.app.dependency_overrides.get(
+            session_dependency,
+            session_dependency,
+        )
+
+        @contextlib.asynccontextmanager
+        async def open_repository() -> (
+            collections.abc.AsyncIterator[
+                saritasa_sqlalchemy_tools.BaseRepository[
+                    saritasa_sqlalchemy_tools.BaseModelT
+                ]
+            ]
+        ):
+            if not inspect.isasyncgenfunction(dependency):
+                yield repository_class(db_session=dependency())
+                return
+            async with contextlib.asynccontextmanager(dependency)() as session:
+                yield repository_class(db_session=session)
+
+        return open_repository
+
+    return _get_repository_opener
@@ -1,9 +1,148 @@
+import asyncio
+import collections.abc
+import contextlib
+import functools
+import json
+import re
 import typing
 
 import saritasa_sqlalchemy_tools
+import sqlalchemy
+import sqlalchemy.ext.compiler
+import sqlalchemy.orm
 
 from .. import repositories
 
+# SQLSTATE of unique violation in postgres
+UNIQUE_VIOLATION_SQLSTATE = "23505"
+_UNIQUE_VIOLATION_DETAIL = re.compile(
+    r"Key \((?P<columns>.+?)\)=\((?P<values>.*)\) already exists",
+)
+# Key of `Session.info`, under which callbacks to run after commit are
+# stored
+AFTER_COMMIT_CALLBACKS_KEY = "after_commit_callbacks"
+AfterCommitCallback: typing.TypeAlias = collections.abc.Callable[
+    [],
+    collections.abc.Awaitable[None],
+]
+# Tasks of callbacks, which are run after commit, reference is kept until
+# they are done
+_after_commit_tasks: set[asyncio.Task[None]] = set()
+
+
+class SqlAlchemyUniqueViolationError(
+    sqlalchemy.exc.IntegrityError,
+    repositories.UniqueViolationError,
+):
+    """Raise if flush violates unique constraint of model.
+
+    It's still `IntegrityError`, so existing handlers of it keep working.
+
+    """
+
+    def __init__(
+        self,
+        error: sqlalchemy.exc.IntegrityError,
+        constraint_name: str | None,
+        fields: collections.abc.Sequence[str],
+        values: collections.abc.Sequence[typing.Any] | None = None,
+    ) -> None:
+        sqlalchemy.exc.IntegrityError.__init__(
+            self,
+            statement=error.statement,
+            params=error.params,
+            orig=error.orig,
+            hide_parameters=error.hide_parameters,
+            code=error.code,
+            ismulti=error.ismulti,
+        )
+        self.constraint_name = constraint_name
+        self.fields = tuple(fields)
+        self.values = tuple(values) if values is not None else None
+
+
+class Explain(sqlalchemy.Executable, sqlalchemy.ClauseElement):
+    """Statement, which gets plan of statement in JSON format.
+
+    Values of statement are passed as bound parameters.
+
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: sqlalchemy.Select[typing.Any]) -> None:
+        self.statement = statement
+
+
+@sqlalchemy.ext.compiler.compiles(Explain, "postgresql")
+def _compile_explain(
+    element: Explain,
+    compiler: sqlalchemy.sql.compiler.SQLCompiler,
+    **kwargs: typing.Any,
+) -> str:
+    """Compile statement, which gets plan of statement."""
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(
+        element.statement,
+        **kwargs,
+    )
+
+
+@functools.cache
+def get_unique_constraints_fields(
+    model: type[typing.Any],
+) -> dict[str, tuple[str, ...]]:
+    """Get fields of named unique constraints and indexes of model."""
+    mapper = sqlalchemy.inspect(model)
+    constraints = [
+        *(
+            constraint
+            for constraint in mapper.local_table.constraints
+            if isinstance(
+                constraint,
+                sqlalchemy.UniqueConstraint | sqlalchemy.PrimaryKeyConstraint,
+            )
+        ),
+        *(index for index in mapper.local_table.indexes if index.unique),
+    ]
+    return {
+        str(constraint.name): tuple(
+            _get_column_field(mapper=mapper, column=column)
+            for column in constraint.columns
+        )
+        for constraint in constraints
+        if constraint.name
+    }
+
+
+def _get_column_field(
+    mapper: sqlalchemy.orm.Mapper[typing.Any],
+    column: sqlalchemy.ColumnElement[typing.Any],
+) -> str:
+    """Get name of attribute of model, which is mapped to column."""
+    try:
+        return mapper.get_property_by_column(column).key
+    except sqlalchemy.orm.exc.UnmappedColumnError:
+        return str(column.key)
+
+
+@sqlalchemy.event.listens_for(sqlalchemy.orm.Session, "after_commit")
+def _run_after_commit_callbacks(session: sqlalchemy.orm.Session) -> None:
+    """Run callbacks of committed transaction of session.
+
+    Events of session are sync, so callbacks are run as tasks.
+
+    """
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS_KEY, ()):
+        task = asyncio.get_running_loop().create_task(callback())
+        _after_commit_tasks.add(task)
+        task.add_done_callback(_after_commit_tasks.discard)
+
+
+@sqlalchemy.event.listens_for(sqlalchemy.orm.Session, "after_rollback")
+def _drop_after_commit_callbacks(session: sqlalchemy.orm.Session) -> None:
+    """Drop callbacks of rolled back transaction of session."""
+    session.info.pop(AFTER_COMMIT_CALLBACKS_KEY, None)
+
 
 class SqlAlchemyRepository(  # type: ignore[misc]
     saritasa_sqlalchemy_tools.BaseRepository[
@@ -23,6 +162,320 @@ class SqlAlchemyRepository(  # type: ignore[misc]
 ):
     """Repository for sqlalchemy."""
 
+    async def save(
+        self,
+        instance: saritasa_sqlalchemy_tools.BaseModelT,
+        refresh: bool = False,
+        attribute_names: collections.abc.Sequence[str] | None = None,
+    ) -> saritasa_sqlalchemy_tools.BaseModelT:
+        """Save model instance.
+
+        Raise `SqlAlchemyUniqueViolationError` if instance violates unique
+        constraint.
+
+        """
+        with self.raise_unique_violations():
+            return await super().save(
+                instance=instance,
+                refresh=refresh,
+                attribute_names=attribute_names,
+            )
+
+    async def insert_batch(
+        self,
+        objects: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.BaseModelT
+        ],
+        exclude_fields: collections.abc.Sequence[str] = (),
+    ) -> list[saritasa_sqlalchemy_tools.BaseModelT]:
+        """Create batch of objects.
+
+        Raise `SqlAlchemyUniqueViolationError` if objects violate unique
+        constraint.
+
+        """
+        with self.raise_unique_violations():
+            return await super().insert_batch(
+                objects=objects,
+                exclude_fields=exclude_fields,
+            )
+
+    async def update_batch(
+        self,
+        objects: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.BaseModelT
+        ],
+        exclude_fields: collections.abc.Sequence[str] = (),
+    ) -> None:
+        """Update batch of objects.
+
+        Raise `SqlAlchemyUniqueViolationError` if objects violate unique
+        constraint.
+
+        """
+        with self.raise_unique_violations():
+            await super().update_batch(
+                objects=objects,
+                exclude_fields=exclude_fields,
+            )
+
+    def run_after_commit(self, callback: AfterCommitCallback) -> None:
+        """Run callback once transaction of session is committed.
+
+        Callback is dropped, if transaction is rolled back.
+
+        """
+        self.db_session.sync_session.info.setdefault(
+            AFTER_COMMIT_CALLBACKS_KEY,
+            [],
+        ).append(callback)
+
+    @contextlib.contextmanager
+    def raise_unique_violations(self) -> collections.abc.Iterator[None]:
+        """Replace `IntegrityError` of unique violation with detailed one."""
+        try:
+            yield
+        except sqlalchemy.exc.IntegrityError as error:
+            unique_violation = self.get_unique_violation(error)
+            if unique_violation is None:
+                raise
+            raise unique_violation from error
+
+    def get_unique_violation(
+        self,
+        error: sqlalchemy.exc.IntegrityError,
+    ) -> SqlAlchemyUniqueViolationError | None:
+        """Get details of violation of unique constraint from error.
+
+        Violated fields are found by name of constraint, if constraint is
+        unnamed in model, they are taken from detail of error. Values are
+        reported only for constraints of single field, since values of
+        several fields can't be reliably split in detail of error.
+
+        """
+        orig = error.orig
+        sqlstate = getattr(orig, "sqlstate", None) or getattr(
+            orig,
+            "pgcode",
+            None,
+        )
+        if sqlstate != UNIQUE_VIOLATION_SQLSTATE:
+            return None
+        # Errors of asyncpg are wrapped by sqlalchemy, psycopg errors have
+        # diagnostics
+        driver_error = orig.__cause__ or orig
+        diagnostics = getattr(orig, "diag", None)
+        constraint_name = getattr(
+            driver_error,
+            "constraint_name",
+            None,
+        ) or getattr(diagnostics, "constraint_name", None)
+        detail = _UNIQUE_VIOLATION_DETAIL.search(
+            getattr(driver_error, "detail", None)
+            or getattr(diagnostics, "message_detail", None)
+            or "",
+        )
+        fields = get_unique_constraints_fields(self.model).get(
+            constraint_name or "",
+        )
+        if fields is None and detail:
+            columns = sqlalchemy.inspect(self.model).local_table.columns
+            fields = tuple(
+                _get_column_field(
+                    mapper=sqlalchemy.inspect(self.model),
+                    column=columns[name],
+                )
+                for name in detail["columns"].split(", ")
+                if name in columns
+            )
+        if not fields:
+            return None
+        return SqlAlchemyUniqueViolationError(
+            error=error,
+            constraint_name=constraint_name,
+            fields=fields,
+            values=(detail["values"],)
+            if detail and len(fields) == 1
+            else None,
+        )
+
+    async def stream_all(
+        self,
+        statement: saritasa_sqlalchemy_tools.SelectStatement[
+            saritasa_sqlalchemy_tools.BaseModelT
+        ],
+        chunk_size: int = 1000,
+    ) -> collections.abc.AsyncIterator[
+        collections.abc.Sequence[saritasa_sqlalchemy_tools.BaseModelT]
+    ]:
+        """Fetch entries in chunks using server-side cursor.
+
+        Note that joined loading of collections is not supported here.
+
+        """
+        result = await self.db_session.stream_scalars(
+            statement.execution_options(yield_per=chunk_size),
+        )
+        async for chunk in result.partitions():
+            yield chunk
+
+    async def count_capped(
+        self,
+        cap: int,
+        where: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.WhereFilter
+        ] = (),
+        **filters_by: typing.Any,
+    ) -> int:
+        """Get count of entries, but no more than `cap`.
+
+        Database stops scanning rows as soon as `cap` rows are found.
+
+        """
+        statement = self.get_fetch_statement(
+            limit=cap,
+            where=where,
+            **filters_by,
+        )
+        return (
+            await self.db_session.scalar(
+                sqlalchemy.select(sqlalchemy.func.count()).select_from(
+                    statement.subquery(),
+                ),
+            )
+            or 0
+        )
+
+    async def count_and_max(
+        self,
+        field: str,
+        where: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.WhereFilter
+        ] = (),
+        **filters_by: typing.Any,
+    ) -> tuple[int, typing.Any]:
+        """Get count of entries and max value of field among them.
+
+        Rows duplicated by joins of filters are counted once.
+
+        """
+        statement = (
+            self.get_fetch_statement(where=where, **filters_by)
+            .with_only_columns(
+                *sqlalchemy.inspect(self.model).primary_key,
+                getattr(self.model, field).label("value"),
+                maintain_column_froms=True,
+            )
+            .distinct()
+            .subquery()
+        )
+        count, value = (
+            await self.db_session.execute(
+                sqlalchemy.select(
+                    sqlalchemy.func.count(),
+                    sqlalchemy.func.max(statement.c.value),
+                ),
+            )
+        ).one()
+        return count, value
+
+    async def count_estimated(
+        self,
+        where: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.WhereFilter
+        ] = (),
+        **filters_by: typing.Any,
+    ) -> int:
+        """Get estimated count of entries.
+
+        For unfiltered queries `pg_class.reltuples` is used, otherwise
+        estimate of rows is taken from plan of query. If estimate is not
+        available (not postgres or table wasn't analyzed yet), exact count is
+        returned.
+
+        """
+        dialect = self.db_session.bind.dialect
+        if dialect.name != "postgresql":
+            return await self.count(where=where, **filters_by)
+        statement = self.get_fetch_statement(where=where, **filters_by)
+        if statement.whereclause is None:
+            estimate = await self.db_session.scalar(
+                sqlalchemy.select(sqlalchemy.column("reltuples"))
+                .select_from(sqlalchemy.table("pg_class"))
+                .where(
+                    sqlalchemy.column("oid")
+                    == sqlalchemy.func.to_regclass(
+                        self.model.__table__.fullname,
+                    ),
+                ),
+            )
+            if estimate is None or estimate < 0:
+                return await self.count(where=where, **filters_by)
+            return int(estimate)
+        plan = (await self.db_session.execute(Explain(statement))).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def fetch_existing_values(
+        self,
+        fields: collections.abc.Sequence[str],
+        values: collections.abc.Collection[tuple[typing.Any, ...]],
+        where: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.WhereFilter
+        ] = (),
+    ) -> set[tuple[typing.Any, ...]]:
+        """Get which of combinations of values of fields have entries.
+
+        All values are checked in one `IN` query.
+
+        """
+        if not values:
+            return set()
+        columns = [getattr(self.model, field) for field in fields]
+        if len(columns) == 1:
+            condition = columns[0].in_([value for (value,) in values])
+        else:
+            condition = sqlalchemy.tuple_(*columns).in_(list(values))
+        statement = (
+            self.get_fetch_statement(where=[condition, *where])
+            .with_only_columns(*columns, maintain_column_froms=True)
+            .distinct()
+        )
+        return {tuple(row) for row in await self.db_session.execute(statement)}
+
+    async def run_checks(
+        self,
+        checks: collections.abc.Sequence[repositories.RepositoryCheck],
+    ) -> list[int]:
+        """Run checks in one query.
+
+        Each check is represented as `EXISTS` or `COUNT` subquery, which are
+        selected together.
+
+        """
+        if not checks:
+            return []
+        columns: list[sqlalchemy.ColumnElement[typing.Any]] = []
+        for index, check in enumerate(checks):
+            statement = check.repository.get_fetch_statement(
+                where=check.where,
+                **check.filters_by,
+            )
+            if check.kind == repositories.RepositoryCheckKind.exists:
+                column = statement.exists()
+            else:
+                column = (
+                    sqlalchemy.select(sqlalchemy.func.count())
+                    .select_from(statement.subquery())
+                    .scalar_subquery()
+                )
+            columns.append(column.label(f"check_{index}"))
+        results = (
+            await self.db_session.execute(sqlalchemy.select(*columns))
+        ).one()
+        return [int(result or 0) for result in results]
+
 
 SqlAlchemyRepositoryT = typing.TypeVar(
     "SqlAlchemyRepositoryT",
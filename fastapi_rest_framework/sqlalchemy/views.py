@@ -1,14 +1,31 @@
+import asyncio
+import collections
 import collections.abc
+import contextlib
 import enum
 import typing
+import weakref
 
 import fastapi
+import pydantic
 import saritasa_sqlalchemy_tools
 import sqlalchemy
+import sqlalchemy.exc
+import sqlalchemy.orm
 
 from .. import metrics, permissions, views
+from ..views import cursor
 from . import dependencies, interactor, repositories
 
+# Cached fetch statements of views, they are stored per view class
+_statement_caches: weakref.WeakKeyDictionary[
+    type,
+    collections.OrderedDict[
+        collections.abc.Hashable,
+        sqlalchemy.Select[typing.Any] | None,
+    ],
+] = weakref.WeakKeyDictionary()
+
 
 class SqlAlchemyView(
     views.BaseAPIView[
@@ -31,6 +48,34 @@ class SqlAlchemyView(
 ):
     """Base view for sqlalchemy."""
 
+    # Read total count of paginated data from page query via
+    # `COUNT(*) OVER ()` instead of making separate COUNT query. It saves a
+    # round trip, but window is computed over whole filtered set before
+    # LIMIT is applied, which could be slower than separate COUNT on large
+    # tables, so it's opt-in.
+    window_count: bool = False
+    # Paginate in two steps if one-to-many or many-to-many relationship is
+    # joined loaded: load page of primary keys first, then load instances
+    # with their relationships by these keys. Otherwise LIMIT/OFFSET are
+    # applied to joined rows in subquery and then deduplicated.
+    two_phase_pagination: bool = True
+    # Make COUNT query of paginated data concurrently with page query on
+    # separate short-lived connection from pool of session's engine. Count
+    # query is built from page query, so filters values are prepared once.
+    # Note that count doesn't see uncommitted changes of request's session.
+    concurrent_count: bool = False
+    # Max number of fetch statements cached per view. Statements are cached
+    # by shape (action, loader options, annotations, ordering and fields),
+    # filters, offset and limit are applied to cached statement on each
+    # request and are passed to database as bound parameters. Hits and
+    # misses are counted via `metrics.counter`.
+    statement_cache_size: int = 0
+    # Serve stale cached responses if db is overloaded or unavailable
+    cache_stale_on_errors: tuple[type[Exception], ...] = (
+        sqlalchemy.exc.TimeoutError,
+        sqlalchemy.exc.OperationalError,
+    )
+
     @property
     def pk_attr_query_type(self) -> type[str] | type[int]:
         """Get query type for pk field."""
@@ -98,16 +143,773 @@ class SqlAlchemyView(
     ]:
         """Get default interactor class."""
 
-        class DefaultInteractor(
-            interactor.SqlAlchemyInteractor[
-                typing.Any,
-                self.repository_class,  # type: ignore
-                self.model,  # type: ignore
-            ],
+        def generate_interactor() -> (
+            type[
+                interactor.SqlAlchemyInteractor[
+                    typing.Any,
+                    repositories.SqlAlchemyRepositoryT,
+                    saritasa_sqlalchemy_tools.BaseModelT,
+                ]
+            ]
+        ):
+            class DefaultInteractor(
+                interactor.SqlAlchemyInteractor[
+                    typing.Any,
+                    self.repository_class,  # type: ignore
+                    self.model,  # type: ignore
+                ],
+            ):
+                model: type[saritasa_sqlalchemy_tools.BaseModelT] = self.model
+
+            return DefaultInteractor
+
+        return self.get_generated_type(  # type: ignore
+            key=("default_interactor", self.repository_class, self.model),
+            factory=generate_interactor,
+        )
+
+    @metrics.tracker
+    def is_sparse_loading_possible(
+        self,
+        fields: collections.abc.Collection[str] | None,
+    ) -> bool:
+        """Check if loading of data can be limited to requested fields.
+
+        It's possible only when all requested fields are mapped attributes of
+        model, since plain properties can use any other attribute.
+
+        """
+        if fields is None:
+            return False
+        mapper = sqlalchemy.inspect(self.model)
+        return all(field in mapper.attrs for field in fields)
+
+    @metrics.tracker
+    def prune_relationships(
+        self,
+        relationships: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ],
+        fields: collections.abc.Collection[str] | None,
+    ) -> collections.abc.Sequence[saritasa_sqlalchemy_tools.LazyLoaded]:
+        """Remove relationships of model which were not requested."""
+        if not self.is_sparse_loading_possible(fields):
+            return relationships
+        return [
+            relationship
+            for relationship in relationships
+            if getattr(relationship, "class_", None) is not self.model
+            or relationship.key in fields  # type: ignore
+        ]
+
+    @metrics.tracker
+    def prune_annotations(
+        self,
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ],
+        fields: collections.abc.Collection[str] | None,
+    ) -> collections.abc.Sequence[saritasa_sqlalchemy_tools.Annotation]:
+        """Remove annotations which were not requested."""
+        if not self.is_sparse_loading_possible(fields):
+            return annotations
+        return [
+            annotation
+            for annotation in annotations
+            if getattr(
+                annotation[0] if isinstance(annotation, tuple) else annotation,
+                "key",
+                None,
+            )
+            in fields  # type: ignore
+        ]
+
+    @metrics.tracker
+    def get_deferred_columns(
+        self,
+        fields: collections.abc.Collection[str] | None,
+    ) -> list[sqlalchemy.orm.InstrumentedAttribute[typing.Any]]:
+        """Get columns which are not needed for requested fields.
+
+        All column attributes (including heavy ones like JSON or ARRAY and
+        column properties with correlated subqueries) which were not
+        requested are deferred, except primary key and foreign keys of
+        requested relationships. Query expressions are controlled by
+        annotations.
+
+        """
+        if not self.is_sparse_loading_possible(fields):
+            return []
+        mapper = sqlalchemy.inspect(self.model)
+        required_columns = {*mapper.primary_key}
+        for field in fields:  # type: ignore
+            if field in mapper.relationships:
+                required_columns.update(
+                    mapper.relationships[field].local_columns,
+                )
+        return [
+            getattr(self.model, attr.key)
+            for attr in mapper.column_attrs
+            if attr.key not in fields  # type: ignore
+            and not dict(attr.strategy_key).get("query_expression")
+            and not required_columns.intersection(attr.columns)
+        ]
+
+    @metrics.tracker
+    def build_fetch_statement(
+        self,
+        repository: repositories.SqlAlchemyRepositoryT,
+        offset: int = 0,
+        limit: int = 0,
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ] = (),
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ] = (),
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        where: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.WhereFilter
+        ] = (),
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> saritasa_sqlalchemy_tools.SelectStatement[
+        saritasa_sqlalchemy_tools.BaseModelT
+    ]:
+        """Build fetch statement from prepared filters values.
+
+        If `fields` are set, annotations and relationships which were not
+        requested are not loaded and not requested columns are deferred.
+
+        """
+        annotations = self.prune_annotations(annotations, fields=fields)
+        joined_load = self.prune_relationships(joined_load, fields=fields)
+        select_in_load = self.prune_relationships(
+            select_in_load,
+            fields=fields,
+        )
+        if (
+            self.statement_cache_size
+            and (
+                statement := self.get_cached_fetch_statement(
+                    repository=repository,
+                    offset=offset,
+                    limit=limit,
+                    order_by=order_by,
+                    annotations=annotations,
+                    joined_load=joined_load,
+                    select_in_load=select_in_load,
+                    where=where,
+                    fields=fields,
+                    **filters_by,
+                )
+            )
+            is not None
+        ):
+            return statement  # type: ignore
+        statement = super().build_fetch_statement(
+            repository=repository,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            annotations=annotations,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            where=where,
+            fields=fields,
+            **filters_by,
+        )
+        if deferred_columns := self.get_deferred_columns(fields):
+            statement = statement.options(
+                *map(sqlalchemy.orm.defer, deferred_columns),
+            )
+        return statement
+
+    @metrics.tracker
+    def get_cached_fetch_statement(
+        self,
+        repository: repositories.SqlAlchemyRepositoryT,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ],
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ],
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ],
+        where: collections.abc.Sequence[saritasa_sqlalchemy_tools.WhereFilter],
+        fields: collections.abc.Collection[str] | None,
+        **filters_by,
+    ) -> sqlalchemy.Select[typing.Any] | None:
+        """Get fetch statement from cache of statements.
+
+        Filters are transformed by repository into separate statement, which
+        condition is applied to cached statement. If filters can't be
+        applied this way (they add joins) or repository adds own conditions
+        (for example soft delete), None is returned.
+
+        """
+        filters_statement = repository.get_fetch_statement(
+            where=where,
+            **filters_by,
+        )
+        froms = filters_statement.get_final_froms()
+        if len(froms) != 1 or froms[0] is not self.model.__table__:
+            metrics.counter("statement_cache.skip")
+            return None
+        cache = _statement_caches.setdefault(
+            self.__class__,
+            collections.OrderedDict(),
+        )
+        key = (
+            self.action,
+            repository.__class__,
+            tuple(order_by),
+            tuple(annotations),
+            tuple(joined_load),
+            tuple(select_in_load),
+            frozenset(fields) if fields is not None else None,
+        )
+        if key in cache:
+            metrics.counter("statement_cache.hit")
+            cache.move_to_end(key)
+            statement = cache[key]
+        else:
+            metrics.counter("statement_cache.miss")
+            statement = super().build_fetch_statement(
+                repository=repository,
+                order_by=order_by,
+                annotations=annotations,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+                fields=fields,
+            )
+            if deferred_columns := self.get_deferred_columns(fields):
+                statement = statement.options(
+                    *map(sqlalchemy.orm.defer, deferred_columns),
+                )
+            if statement.whereclause is not None:
+                statement = None
+            cache[key] = statement
+            if len(cache) > self.statement_cache_size:
+                cache.popitem(last=False)
+        if statement is None:
+            return None
+        if filters_statement.whereclause is not None:
+            statement = statement.where(filters_statement.whereclause)
+        if offset:
+            statement = statement.offset(offset)
+        if limit:
+            statement = statement.limit(limit)
+        return statement
+
+    @metrics.tracker
+    def is_two_phase_pagination_required(
+        self,
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ],
+    ) -> bool:
+        """Check if any collection is joined loaded."""
+        return self.two_phase_pagination and any(
+            getattr(getattr(relationship, "property", None), "uselist", False)
+            for relationship in joined_load
+        )
+
+    @metrics.tracker
+    async def prepare_page_pks_statement(
+        self,
+        user: permissions.UserT,
+        repository: repositories.SqlAlchemyRepositoryT,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ],
+        where: collections.abc.Sequence[saritasa_sqlalchemy_tools.WhereFilter]
+        | None = None,
+        **filters_by,
+    ) -> sqlalchemy.Select[typing.Any]:
+        """Prepare statement which selects primary keys of page.
+
+        Keys are grouped, since filters, which join collections, could
+        select same key several times. Note that ordering by annotations is
+        not supported here.
+
+        """
+        statement = await self.prepare_fetch_statement(
+            user=user,
+            repository=repository,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            where=where,
+            **filters_by,
+        )
+        pk = getattr(self.model, self.pk_attr)
+        return statement.with_only_columns(
+            pk,
+            maintain_column_froms=True,
+        ).group_by(pk)
+
+    @metrics.tracker
+    async def fetch_by_pks(
+        self,
+        user: permissions.UserT,
+        repository: repositories.SqlAlchemyRepositoryT,
+        pks: collections.abc.Sequence[typing.Any],
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ],
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        fields: collections.abc.Collection[str] | None = None,
+    ) -> list[saritasa_sqlalchemy_tools.BaseModelT]:
+        """Load instances by primary keys keeping order of keys."""
+        if not pks:
+            return []
+        objects = await repository.fetch_all(
+            statement=await self.prepare_fetch_statement(
+                user=user,
+                repository=repository,
+                where=[getattr(self.model, self.pk_attr).in_(pks)],
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+                annotations=annotations,
+                fields=fields,
+            ),
+        )
+        objects_by_pk = {
+            getattr(instance, self.pk_attr): instance for instance in objects
+        }
+        return [objects_by_pk[pk] for pk in pks if pk in objects_by_pk]
+
+    @metrics.tracker
+    async def fetch_page(
+        self,
+        user: permissions.UserT,
+        repository: repositories.SqlAlchemyRepositoryT,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ],
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        where: collections.abc.Sequence[saritasa_sqlalchemy_tools.WhereFilter]
+        | None = None,
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> collections.abc.Sequence[saritasa_sqlalchemy_tools.BaseModelT]:
+        """Load page of data from database."""
+        if not self.is_two_phase_pagination_required(
+            self.prune_relationships(joined_load, fields=fields),
         ):
-            model: type[saritasa_sqlalchemy_tools.BaseModelT] = self.model
+            return await super().fetch_page(
+                user=user,
+                repository=repository,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                annotations=annotations,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+                where=where,
+                fields=fields,
+                **filters_by,
+            )
+        statement = await self.prepare_page_pks_statement(
+            user=user,
+            repository=repository,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            where=where,
+            **filters_by,
+        )
+        return await self.fetch_by_pks(
+            user=user,
+            repository=repository,
+            pks=(await repository.db_session.scalars(statement)).all(),
+            annotations=annotations,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            fields=fields,
+        )
+
+    @metrics.tracker
+    async def paginate_page(
+        self,
+        user: permissions.UserT,
+        repository: repositories.SqlAlchemyRepositoryT,
+        context: views.Context,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ],
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        where: collections.abc.Sequence[saritasa_sqlalchemy_tools.WhereFilter]
+        | None = None,
+        count_strategy: views.CountStrategy = views.CountStrategy.exact,
+        count_cap: int = 1000,
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> tuple[
+        collections.abc.Sequence[saritasa_sqlalchemy_tools.BaseModelT],
+        views.PageInfo,
+    ]:
+        """Load paginated data from database.
+
+        For exact count strategy total is loaded along with page in one
+        query. Separate COUNT query is made only if page is empty.
+
+        """
+        if (
+            self.concurrent_count
+            and count_strategy == views.CountStrategy.exact
+            and repository.db_session.bind is not None
+        ):
+            return await self.paginate_data_with_concurrent_count(
+                user=user,
+                repository=repository,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                annotations=annotations,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+                where=where,
+                fields=fields,
+                **filters_by,
+            )
+        if not self.window_count or (
+            count_strategy != views.CountStrategy.exact
+        ):
+            return await super().paginate_page(
+                user=user,
+                repository=repository,
+                context=context,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                annotations=annotations,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+                where=where,
+                count_strategy=count_strategy,
+                count_cap=count_cap,
+                fields=fields,
+                **filters_by,
+            )
+        two_phase = self.is_two_phase_pagination_required(
+            self.prune_relationships(joined_load, fields=fields),
+        )
+        statement = await self.prepare_page_statement(
+            user=user,
+            repository=repository,
+            two_phase=two_phase,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            annotations=annotations,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            where=where,
+            fields=fields,
+            **filters_by,
+        )
+        rows = (
+            (
+                await repository.db_session.execute(
+                    statement.add_columns(
+                        sqlalchemy.func.count().over().label("total_count"),
+                    ),
+                )
+            )
+            .unique()
+            .all()
+        )
+        if rows:
+            objects = [row[0] for row in rows]
+            count = rows[0][-1]
+            if two_phase:
+                objects = await self.fetch_by_pks(
+                    user=user,
+                    repository=repository,
+                    pks=objects,
+                    annotations=annotations,
+                    joined_load=joined_load,
+                    select_in_load=select_in_load,
+                    fields=fields,
+                )
+            return objects, views.PageInfo(
+                count=count,
+                has_next=offset + len(rows) < count,
+            )
+        if not offset:
+            return [], views.PageInfo(count=0, has_next=False)
+        where_filter, filters_by = await self.get_filters_values(
+            user=user,
+            repository=repository,
+            where=where or [],
+            **filters_by,
+        )
+        return [], views.PageInfo(
+            count=await repository.count(
+                where=where_filter,
+                **filters_by,
+            ),
+            has_next=False,
+        )
+
+    @metrics.tracker
+    async def prepare_page_statement(
+        self,
+        user: permissions.UserT,
+        repository: repositories.SqlAlchemyRepositoryT,
+        two_phase: bool,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ],
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        where: collections.abc.Sequence[saritasa_sqlalchemy_tools.WhereFilter]
+        | None = None,
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> sqlalchemy.Select[typing.Any]:
+        """Prepare statement of page.
+
+        For two phase pagination only primary keys are selected.
+
+        """
+        if two_phase:
+            return await self.prepare_page_pks_statement(
+                user=user,
+                repository=repository,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                where=where,
+                **filters_by,
+            )
+        return await self.prepare_fetch_statement(
+            user=user,
+            repository=repository,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            where=where,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            annotations=annotations,
+            fields=fields,
+            **filters_by,
+        )
+
+    @metrics.tracker
+    async def paginate_data_with_concurrent_count(
+        self,
+        user: permissions.UserT,
+        repository: repositories.SqlAlchemyRepositoryT,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ],
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        where: collections.abc.Sequence[saritasa_sqlalchemy_tools.WhereFilter]
+        | None = None,
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> tuple[
+        collections.abc.Sequence[saritasa_sqlalchemy_tools.BaseModelT],
+        views.PageInfo,
+    ]:
+        """Load page and total count of data concurrently."""
+        two_phase = self.is_two_phase_pagination_required(
+            self.prune_relationships(joined_load, fields=fields),
+        )
+        statement = await self.prepare_page_statement(
+            user=user,
+            repository=repository,
+            two_phase=two_phase,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            annotations=annotations,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            where=where,
+            fields=fields,
+            **filters_by,
+        )
+        count_task = asyncio.create_task(
+            self.count_on_separate_connection(
+                repository=repository,
+                statement=statement,
+            ),
+        )
+        try:
+            if two_phase:
+                pks = (await repository.db_session.scalars(statement)).all()
+                rows_count = len(pks)
+                objects = await self.fetch_by_pks(
+                    user=user,
+                    repository=repository,
+                    pks=pks,
+                    annotations=annotations,
+                    joined_load=joined_load,
+                    select_in_load=select_in_load,
+                    fields=fields,
+                )
+            else:
+                objects = list(await repository.fetch_all(statement=statement))
+                rows_count = len(objects)
+        except BaseException:
+            count_task.cancel()
+            # Error of page is raised, connection of count is released first
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await count_task
+            raise
+        count = await count_task
+        return objects, views.PageInfo(
+            count=count,
+            has_next=offset + rows_count < count,
+        )
+
+    @metrics.tracker
+    async def count_on_separate_connection(
+        self,
+        repository: repositories.SqlAlchemyRepositoryT,
+        statement: sqlalchemy.Select[typing.Any],
+    ) -> int:
+        """Count rows of page statement without pagination.
 
-        return DefaultInteractor  # type: ignore
+        Connection is returned to pool as soon as count is loaded.
+
+        """
+        async with repository.db_session.bind.connect() as connection:
+            return (
+                await connection.scalar(self.get_count_statement(statement))
+                or 0
+            )
+
+    @metrics.tracker
+    def get_count_statement(
+        self,
+        statement: sqlalchemy.Select[typing.Any],
+    ) -> sqlalchemy.Select[tuple[int]]:
+        """Prepare statement, which counts rows of page statement.
+
+        Rows duplicated by joins are counted once.
+
+        """
+        return sqlalchemy.select(
+            sqlalchemy.func.count(),
+        ).select_from(
+            statement.limit(None)
+            .offset(None)
+            .order_by(None)
+            .with_only_columns(
+                *sqlalchemy.inspect(self.model).primary_key,
+                maintain_column_froms=True,
+            )
+            .distinct()
+            .subquery(),
+        )
+
+    @metrics.tracker
+    def get_cursor_filter(
+        self,
+        ordering: collections.abc.Sequence[cursor.CursorOrderingField],
+        values: collections.abc.Sequence[typing.Any],
+        reverse: bool = False,
+    ) -> saritasa_sqlalchemy_tools.WhereFilter:
+        """Prepare filter which selects rows located after cursor.
+
+        For ordering `(a, -b, id)` it's
+        `a > :a OR (a = :a AND b < :b) OR (a = :a AND b = :b AND id > :id)`.
+
+        """
+        columns = [getattr(self.model, field.field) for field in ordering]
+        try:
+            values = [
+                pydantic.TypeAdapter(
+                    column.type.python_type,
+                ).validate_python(value)
+                for column, value in zip(columns, values, strict=True)
+            ]
+        except (pydantic.ValidationError, NotImplementedError) as error:
+            raise cursor.get_invalid_cursor_error() from error
+        clauses = []
+        for index, field in enumerate(ordering):
+            if field.descending != reverse:
+                seek = columns[index] < values[index]
+            else:
+                seek = columns[index] > values[index]
+            clauses.append(
+                sqlalchemy.and_(
+                    *(
+                        column == value
+                        for column, value in zip(
+                            columns[:index],
+                            values[:index],
+                            strict=True,
+                        )
+                    ),
+                    seek,
+                ),
+            )
+        return sqlalchemy.or_(*clauses)
 
 
 class ListMixin(
@@ -141,11 +943,134 @@ class ListMixin(
         ordering_fields: collections.abc.Sequence[str],
     ) -> type[enum.StrEnum]:
         """Prepare ordering enum."""
-        return saritasa_sqlalchemy_tools.OrderingEnum(  # type: ignore
-            f"{self.__class__.__name__}OrderingEnum",
-            ordering_fields,
+        return self.get_generated_type(
+            key=("ordering_enum", tuple(ordering_fields)),
+            factory=lambda: saritasa_sqlalchemy_tools.OrderingEnum(  # type: ignore
+                f"{self.__class__.__name__}OrderingEnum",
+                ordering_fields,
+            ),
+        )
+
+
+class ExportMixin(
+    views.ExportMixin[
+        views.ListSchema,
+        views.FiltersT,
+        saritasa_sqlalchemy_tools.LazyLoaded,
+        saritasa_sqlalchemy_tools.SelectStatement[
+            saritasa_sqlalchemy_tools.BaseModelT
+        ],
+        saritasa_sqlalchemy_tools.Annotation,
+        saritasa_sqlalchemy_tools.WhereFilter,
+        saritasa_sqlalchemy_tools.OrderingClause,
+        permissions.UserT,
+        repositories.SqlAlchemyRepositoryT,
+        saritasa_sqlalchemy_tools.BaseModelT,
+    ],
+    typing.Generic[
+        views.ListSchema,
+        views.FiltersT,
+        permissions.UserT,
+        repositories.SqlAlchemyRepositoryT,
+        saritasa_sqlalchemy_tools.BaseModelT,
+    ],
+):
+    """Export mixin for sqlalchemy."""
+
+    @property
+    def export_repository_dependency(
+        self,
+    ) -> type[
+        collections.abc.Callable[
+            [],
+            contextlib.AbstractAsyncContextManager[
+                repositories.SqlAlchemyRepositoryT
+            ],
+        ]
+    ]:
+        """Prepare dependency, which opens repository for export."""
+        return typing.Annotated[  # type: ignore
+            collections.abc.Callable[
+                [],
+                contextlib.AbstractAsyncContextManager[self.repository_class],  # type: ignore
+            ],
+            fastapi.Depends(
+                dependencies.get_repository_opener(
+                    repository_class=self.repository_class,
+                    session_dependency=self.db_session_dependency,  # type: ignore
+                ),
+            ),
+        ]
+
+    @metrics.tracker
+    def get_ordering_enum(
+        self,
+        ordering_fields: collections.abc.Sequence[str],
+    ) -> type[enum.StrEnum]:
+        """Prepare ordering enum."""
+        return self.get_generated_type(
+            key=("ordering_enum", tuple(ordering_fields)),
+            factory=lambda: saritasa_sqlalchemy_tools.OrderingEnum(  # type: ignore
+                f"{self.__class__.__name__}OrderingEnum",
+                ordering_fields,
+            ),
         )
 
+    async def stream_data(
+        self,
+        user: permissions.UserT,
+        open_repository: collections.abc.Callable[
+            [],
+            contextlib.AbstractAsyncContextManager[
+                repositories.SqlAlchemyRepositoryT
+            ],
+        ],
+        order_by: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.OrderingClause | enum.StrEnum
+        ],
+        where: collections.abc.Sequence[saritasa_sqlalchemy_tools.WhereFilter],
+        chunk_size: int,
+        annotations: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.Annotation
+        ] = (),
+        joined_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+        select_in_load: collections.abc.Sequence[
+            saritasa_sqlalchemy_tools.LazyLoaded
+        ] = (),
+    ) -> collections.abc.AsyncIterator[
+        collections.abc.Sequence[saritasa_sqlalchemy_tools.BaseModelT]
+    ]:
+        """Load data from database in chunks.
+
+        Collections can't be joined loaded while rows are streamed, so they
+        are loaded via selectinload for each chunk instead.
+
+        """
+        scalars_load = []
+        collections_load = []
+        for relationship in joined_load:
+            if getattr(
+                getattr(relationship, "property", None),
+                "uselist",
+                False,
+            ):
+                collections_load.append(relationship)
+            else:
+                scalars_load.append(relationship)
+        async for chunk in super().stream_data(
+            user=user,
+            open_repository=open_repository,
+            order_by=order_by,
+            where=where,
+            chunk_size=chunk_size,
+            annotations=annotations,
+            joined_load=scalars_load,
+            select_in_load=[*select_in_load, *collections_load],
+        ):
+            yield chunk
+
 
 class DetailMixin(
     views.DetailMixin[
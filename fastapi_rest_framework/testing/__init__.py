@@ -1,4 +1,5 @@
 from .tools import (
+    extract_cursor_paginated_result_from_response,
     extract_error_from_response,
     extract_general_errors_from_response,
     extract_json_from_response,
@@ -19,6 +20,7 @@ from .types import AuthApiClientFactory, LazyUrl
 __all__ = (
     "AuthApiClientFactory",
     "LazyUrl",
+    "extract_cursor_paginated_result_from_response",
     "extract_error_from_response",
     "extract_general_errors_from_response",
     "extract_json_from_response",
@@ -63,6 +63,19 @@ def extract_paginated_result_from_response(
     )
 
 
+def extract_cursor_paginated_result_from_response(
+    response: httpx.Response,
+    schema: type[ResponseT],
+    expected_status: http.HTTPStatus = http.HTTPStatus.OK,
+) -> views.CursorPaginatedResult[ResponseT]:
+    """Extract cursor paginated result from response."""
+    return extract_schema_from_response(
+        response=response,
+        schema=views.CursorPaginatedResult[schema],
+        expected_status=expected_status,
+    )
+
+
 def extract_schema_list_from_response(
     response: httpx.Response,
     schema: type[ResponseT],
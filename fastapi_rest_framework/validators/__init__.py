@@ -1,8 +1,11 @@
 from .api_model import (
     BaseModelListValidator,
     BaseModelValidator,
+    LoweredValidators,
     UniqueConstraintType,
     ValidationMapType,
+    ValidationPlan,
+    compile_request_schema,
 )
 from .base import (
     DatetimeValidator,
@@ -12,13 +15,31 @@ from .base import (
 )
 from .core import (
     BaseListValidator,
+    BasePureValidator,
     BaseValidator,
     ValidationError,
+    ValidationErrors,
     ValidationErrorType,
+    ValidationLimits,
+    ValidatorBinding,
+)
+from .lookups import (
+    LOOKUP_CACHE_CONTEXT_KEY,
+    LookupCache,
+    LookupValue,
+    ValuesLookup,
+    get_lookup_cache,
 )
 from .repositories import (
+    BaseRepositoryValidator,
     ObjectPKValidator,
     UniqueByFieldValidator,
 )
 from .schemas import GenericError, ValidationErrorSchema
 from .types import AnyGenericInput, AnyGenericOutput, ApiDataType, LOCType
+from .unique_violations import (
+    UNIQUE_VIOLATIONS_CONTEXT_KEY,
+    UniqueViolation,
+    UniqueViolations,
+    get_unique_violations,
+)
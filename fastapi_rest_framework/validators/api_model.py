@@ -1,18 +1,33 @@
 import abc
+import collections
 import collections.abc
 import dataclasses
 import enum
+import functools
 import operator
 import typing
 
+import pydantic
+
 from .. import common_types, metrics, repositories
-from . import core, types
+from . import core, lookups, types, unique_violations
+from . import repositories as repository_validators
 
 UniqueConstraintType: typing.TypeAlias = tuple[str, ...]
 ValidationMapType: typing.TypeAlias = dict[
     str,
     tuple["core.BaseValidator[typing.Any, typing.Any]", ...],
 ]
+SchemaT = typing.TypeVar("SchemaT", bound=pydantic.BaseModel)
+# Attribute of request schema, which stores validators compiled into it
+LOWERED_VALIDATORS_ATTRIBUTE = "__lowered_validators__"
+AnyRepositoryValidator: typing.TypeAlias = (
+    repository_validators.BaseRepositoryValidator[
+        typing.Any,
+        typing.Any,
+        typing.Any,
+    ]
+)
 
 
 class ComparisonOperatorEnum(enum.Enum):
@@ -45,6 +60,132 @@ class UniqueCondition:
     operator: ComparisonOperatorEnum
 
 
+@dataclasses.dataclass
+class UniqueConstraintsPlan:
+    """Representation of unique constraints, which are checked in advance.
+
+    Checks of unique constraints are run in one query with checks of fields,
+    results are used only if values of fields weren't changed by
+    validators afterwards.
+
+    """
+
+    unique_constraints: collections.abc.Sequence[UniqueConstraintType]
+    extra_unique_conditions: collections.abc.Sequence[UniqueCondition]
+    results: dict[UniqueConstraintType, tuple[tuple[typing.Any, ...], int]] = (
+        dataclasses.field(default_factory=dict)
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationPlan:
+    """Representation of compiled validation plan of model validator.
+
+    Fields without validators are dropped. Validators, which don't depend on
+    state of validation, are shared by all validations, others are bound
+    to it on each validation.
+
+    """
+
+    validation_map: ValidationMapType
+    # Fields, which have validators depending on state of validation
+    bound_fields: tuple[str, ...]
+
+    @classmethod
+    def compile(cls, validation_map: ValidationMapType) -> typing.Self:
+        """Compile validation map."""
+        return cls(
+            validation_map={
+                field: tuple(validators)
+                for field, validators in validation_map.items()
+                if validators
+            },
+            bound_fields=tuple(
+                field
+                for field, validators in validation_map.items()
+                if any(validator.requires_binding for validator in validators)
+            ),
+        )
+
+    def bind(self, binding: core.ValidatorBinding) -> ValidationMapType:
+        """Get validation map with validators bound to binding."""
+        if not self.bound_fields:
+            return self.validation_map
+        validation_map = dict(self.validation_map)
+        for field in self.bound_fields:
+            validation_map[field] = tuple(
+                validator.bind(binding) for validator in validation_map[field]
+            )
+        return validation_map
+
+
+@dataclasses.dataclass(frozen=True)
+class LoweredValidators:
+    """Representation of validators, which were compiled into schema.
+
+    Number of leading validators of each field is stored, so that model
+    validator skips them on validation of data of schema.
+
+    """
+
+    validator: type[typing.Any]
+    counts: collections.abc.Mapping[str, int]
+
+
+@functools.cache
+def compile_request_schema(
+    validator: type["BaseModelValidator[typing.Any, typing.Any]"],
+    schema: type[SchemaT],
+) -> type[SchemaT]:
+    """Compile pure validators of validation plan into request schema.
+
+    Leading validators of field, which could be lowered into annotation of
+    field (see `BaseValidator.lower_annotation`), are run by pydantic-core
+    on validation of schema. Fields with aliases are skipped, so that errors
+    keep location of field. Schema is returned as is, if none of validators
+    could be compiled.
+
+    """
+    if (
+        validator._get_validation_map
+        is not BaseModelValidator._get_validation_map
+    ):
+        # Validation map is built on validation
+        return schema
+    validation_map = validator.compiled_validation_plan.validation_map
+    fields: dict[str, typing.Any] = {}
+    counts: dict[str, int] = {}
+    for name, field_info in schema.model_fields.items():
+        if name not in validation_map or {
+            field_info.alias,
+            field_info.validation_alias,
+        } - {None, name}:
+            continue
+        annotation = field_info.annotation
+        for field_validator in validation_map[name]:
+            lowered_annotation = field_validator.lower_annotation(annotation)
+            if lowered_annotation is None:
+                break
+            annotation = lowered_annotation
+            counts[name] = counts.get(name, 0) + 1
+        if name in counts:
+            fields[name] = (annotation, field_info)
+    if not fields:
+        return schema
+    request_schema = pydantic.create_model(  # type: ignore
+        schema.__name__,
+        __base__=schema,
+        __module__=schema.__module__,
+        **fields,
+    )
+    setattr(
+        request_schema,
+        LOWERED_VALIDATORS_ATTRIBUTE,
+        LoweredValidators(validator=validator, counts=counts),
+    )
+    return request_schema
+
+
 class BaseModelValidator(
     core.BaseValidator[types.ApiDataType, types.ApiDataType],
     typing.Generic[
@@ -54,6 +195,26 @@ class BaseModelValidator(
 ):
     """Base validator for models."""
 
+    # Skip checks of uniqueness (unique constraints and fields with
+    # `UniqueByFieldValidator`), since database enforces it. Errors are
+    # registered in context instead, so interactor raises them on unique
+    # violation
+    optimistic_unique: bool = False
+    # Validators of fields, which are declared once. Plan is compiled on
+    # class definition, validators which depend on repository or instance
+    # are bound to ones of model validator on validation
+    validation_plan: typing.ClassVar[ValidationMapType] = {}
+    compiled_validation_plan: typing.ClassVar[ValidationPlan] = (
+        ValidationPlan.compile({})
+    )
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        """Compile validation plan of class."""
+        super().__init_subclass__(**kwargs)
+        cls.compiled_validation_plan = ValidationPlan.compile(
+            cls.validation_plan,
+        )
+
     def __init__(
         self,
         repository: repositories.ApiRepositoryProtocolT,
@@ -63,14 +224,78 @@ class BaseModelValidator(
         self.instance = instance
         self.repository = repository
         self.pk_field: str = pk_field
+        # Cache of lookups, which is shared by validators of items of bulk
+        # payload
+        self.lookup_cache: lookups.LookupCache | None = None
+        # Validation plan, which is bound to repository and instance
+        self.bound_validation_map: ValidationMapType | None = None
+        # Number of leading validators of fields, which were already run on
+        # validation of request schema
+        self.lowered_validators: collections.abc.Mapping[str, int] = {}
+
+    @classmethod
+    def get_request_schema(cls, schema: type[SchemaT]) -> type[SchemaT]:
+        """Get request schema, which runs pure validators of validator.
+
+        See `compile_request_schema`.
+
+        """
+        return compile_request_schema(validator=cls, schema=schema)
+
+    @classmethod
+    def get_lowered_validators(
+        cls,
+        schema: type[pydantic.BaseModel],
+    ) -> collections.abc.Mapping[str, int]:
+        """Get number of validators of fields, which schema runs itself."""
+        lowered_validators = getattr(
+            schema,
+            LOWERED_VALIDATORS_ATTRIBUTE,
+            None,
+        )
+        if (
+            isinstance(lowered_validators, LoweredValidators)
+            and lowered_validators.validator is cls
+        ):
+            return lowered_validators.counts
+        return {}
+
+    @metrics.tracker
+    async def validate_schema(
+        self,
+        schema: pydantic.BaseModel,
+        context: common_types.ContextType,
+        loc: types.LOCType = ("body",),
+    ) -> types.ApiDataType | None:
+        """Validate data of request schema.
+
+        Validators, which were compiled into schema by `get_request_schema`,
+        are not run again.
+
+        """
+        self.lowered_validators = self.get_lowered_validators(type(schema))
+        return await self(value=dict(schema), context=context, loc=loc)
 
     def _get_validation_map(
         self,
         value: types.ApiDataType,
         context: common_types.ContextType,
     ) -> ValidationMapType:
-        """Get validation map/plan for model."""
-        return {}
+        """Get validation map/plan for model.
+
+        By default validators of `validation_plan` are used, they are bound
+        once per instance of model validator.
+
+        """
+        if self.bound_validation_map is None:
+            self.bound_validation_map = self.compiled_validation_plan.bind(
+                core.ValidatorBinding(
+                    repository=self.repository,
+                    instance=self.instance,
+                    context=context,
+                ),
+            )
+        return self.bound_validation_map
 
     def _get_extra_unique_conditions(self) -> list[UniqueCondition]:
         """Additional condition for checking unique constraints."""
@@ -80,12 +305,137 @@ class BaseModelValidator(
         """Get unique constraints for model."""
         return []
 
+    def _get_unique_constraints_checks(
+        self,
+        data: types.ApiDataType,
+        unique_constraints: collections.abc.Sequence[UniqueConstraintType],
+        extra_unique_conditions: collections.abc.Sequence[UniqueCondition],
+    ) -> list[repositories.RepositoryCheck]:
+        """Get checks of existence of entries with same values."""
+        extra_where_conditions = [
+            AVAILABLE_OPERATORS[condition.operator](
+                getattr(self.repository.model, condition.field_name),
+                condition.value,
+            )
+            for condition in extra_unique_conditions
+        ]
+        return [
+            repositories.RepositoryCheck(
+                repository=self.repository,
+                kind=repositories.RepositoryCheckKind.exists,
+                where=(
+                    getattr(self.repository.model, self.pk_field)
+                    != getattr(self.instance, self.pk_field, None),
+                    *extra_where_conditions,
+                ),
+                filters_by={
+                    field_name: data[field_name] for field_name in constraint
+                },
+            )
+            for constraint in unique_constraints
+        ]
+
+    def _get_unique_constraint_lookup(
+        self,
+        constraint: UniqueConstraintType,
+        extra_unique_conditions: collections.abc.Sequence[UniqueCondition],
+    ) -> lookups.ValuesLookup:
+        """Get lookup of present values of fields of constraint."""
+        pk = getattr(self.instance, self.pk_field, None)
+        return lookups.ValuesLookup(
+            repository=self.repository,
+            model=self.repository.model,
+            fields=constraint,
+            where_key=("unique", pk, tuple(extra_unique_conditions)),
+            where=(
+                *(
+                    (getattr(self.repository.model, self.pk_field) != pk,)
+                    if pk is not None
+                    else ()
+                ),
+                *(
+                    AVAILABLE_OPERATORS[condition.operator](
+                        getattr(self.repository.model, condition.field_name),
+                        condition.value,
+                    )
+                    for condition in extra_unique_conditions
+                ),
+            ),
+        )
+
+    def get_lookups(
+        self,
+        data: types.ApiDataType,
+        context: common_types.ContextType,
+    ) -> list[tuple[lookups.ValuesLookup, list[lookups.LookupValue], bool]]:
+        """Get lookups, which could be checked before validation.
+
+        Return lookups of repository validators and unique constraints,
+        values of lookups and whether values should be unique.
+
+        """
+        data_lookups = []
+        for field, validators in self._get_validation_map(
+            value=data,
+            context=context,
+        ).items():
+            if field not in data:
+                continue
+            for validator in validators:
+                if not isinstance(
+                    validator,
+                    repository_validators.BaseRepositoryValidator,
+                ) or self._skips_validator(validator):
+                    continue
+                if lookup_values := validator.get_lookup_request(data[field]):
+                    data_lookups.append(
+                        (*lookup_values, validator.has_unique_values),
+                    )
+        if self.optimistic_unique:
+            return data_lookups
+        extra_unique_conditions = self._get_extra_unique_conditions()
+        for constraint in self._get_unique_constraints():
+            values = tuple(data.get(field_name) for field_name in constraint)
+            if None in values:
+                continue
+            data_lookups.append(
+                (
+                    self._get_unique_constraint_lookup(
+                        constraint=constraint,
+                        extra_unique_conditions=extra_unique_conditions,
+                    ),
+                    [values],
+                    True,
+                ),
+            )
+        return data_lookups
+
+    def _get_cached_unique_constraint_result(
+        self,
+        data: types.ApiDataType,
+        constraint: UniqueConstraintType,
+        extra_unique_conditions: collections.abc.Sequence[UniqueCondition],
+    ) -> int | None:
+        """Get result of check of unique constraint from cache of lookups."""
+        values = tuple(data[field_name] for field_name in constraint)
+        if not self.lookup_cache or None in values:
+            return None
+        present = self.lookup_cache.get_present(
+            lookup=self._get_unique_constraint_lookup(
+                constraint=constraint,
+                extra_unique_conditions=extra_unique_conditions,
+            ),
+            values=[values],
+        )
+        return None if present is None else len(present)
+
     @metrics.tracker
     async def _validate_unique_constraints(
         self,
         data: types.ApiDataType,
         unique_constraints: collections.abc.Sequence[UniqueConstraintType],
         extra_unique_conditions: collections.abc.Sequence[UniqueCondition],
+        unique_constraints_plan: UniqueConstraintsPlan | None = None,
     ) -> types.ApiDataType:
         """Validate unique constraints for model.
 
@@ -103,33 +453,125 @@ class BaseModelValidator(
             )
         ```
 
+        All constraints are checked in one query, constraints which were
+        already checked in `_validate_data` are not checked again.
+
         """
-        extra_where_conditions = [
-            AVAILABLE_OPERATORS[condition.operator](
-                getattr(self.repository.model, condition.field_name),
-                condition.value,
+        planned_results = (
+            unique_constraints_plan.results if unique_constraints_plan else {}
+        )
+        results: dict[UniqueConstraintType, int] = {}
+        for constraint in unique_constraints:
+            values = tuple(data[field_name] for field_name in constraint)
+            if constraint in planned_results:
+                planned_values, result = planned_results[constraint]
+                if planned_values == values:
+                    results[constraint] = result
+                    continue
+            result = self._get_cached_unique_constraint_result(
+                data=data,
+                constraint=constraint,
+                extra_unique_conditions=extra_unique_conditions,
             )
-            for condition in extra_unique_conditions
+            if result is not None:
+                results[constraint] = result
+        not_checked = [
+            constraint
+            for constraint in unique_constraints
+            if constraint not in results
         ]
-
+        results.update(
+            zip(
+                not_checked,
+                await self.repository.run_checks(
+                    self._get_unique_constraints_checks(
+                        data=data,
+                        unique_constraints=not_checked,
+                        extra_unique_conditions=extra_unique_conditions,
+                    ),
+                )
+                if not_checked
+                else (),
+                strict=True,
+            ),
+        )
+        for constraint in not_checked:
+            self._remember_unique_constraint_result(
+                values=tuple(data[field_name] for field_name in constraint),
+                constraint=constraint,
+                extra_unique_conditions=extra_unique_conditions,
+                result=results[constraint],
+            )
         for constraint in unique_constraints:
-            if await self.repository.exists(
-                where=[
-                    getattr(self.repository.model, self.pk_field)
-                    != getattr(self.instance, self.pk_field, None),
-                    *extra_where_conditions,
-                ],
-                **{field_name: data[field_name] for field_name in constraint},
-            ):
+            if results[constraint]:
                 raise core.ValidationError(
-                    error_message=(
-                        f"Values of fields {constraint} should be unique "
-                        "together."
+                    error_message=self._get_unique_constraint_error_message(
+                        constraint,
                     ),
                     error_type=core.ValidationErrorType.unique,
                 )
         return data
 
+    def _get_unique_constraint_error_message(
+        self,
+        constraint: UniqueConstraintType,
+    ) -> str:
+        """Get message of error, which is reported on duplicate."""
+        return f"Values of fields {constraint} should be unique together."
+
+    def _register_unique_violations(
+        self,
+        data: types.ApiDataType,
+        loc: types.LOCType,
+        context: common_types.ContextType,
+    ) -> None:
+        """Register errors of unique constraints and fields of data."""
+        registry = unique_violations.get_unique_violations(context)
+        if registry is None:
+            return
+        for constraint in self._get_unique_constraints():
+            registry.register(
+                fields=constraint,
+                violation=unique_violations.UniqueViolation(
+                    loc=loc,
+                    error_message=self._get_unique_constraint_error_message(
+                        constraint,
+                    ),
+                    values={
+                        field_name: data.get(field_name)
+                        for field_name in constraint
+                    },
+                ),
+            )
+        for field, validators in self._get_validation_map(
+            value=data,
+            context=context,
+        ).items():
+            for validator in validators:
+                if not isinstance(
+                    validator,
+                    repository_validators.UniqueByFieldValidator,
+                ):
+                    continue
+                registry.register(
+                    fields=(validator.field,),
+                    violation=unique_violations.UniqueViolation(
+                        loc=(*loc, field),
+                        error_message=validator.error_message,
+                        values={validator.field: data.get(field)},
+                    ),
+                )
+
+    def _skips_validator(
+        self,
+        validator: core.BaseValidator[typing.Any, typing.Any],
+    ) -> bool:
+        """Check that validator is not run in optimistic mode."""
+        return self.optimistic_unique and isinstance(
+            validator,
+            repository_validators.UniqueByFieldValidator,
+        )
+
     @metrics.tracker
     async def _validate(
         self,
@@ -145,6 +587,21 @@ class BaseModelValidator(
         """
         if not value:
             return value
+        if self.lookup_cache is None:
+            # Lookups are shared with other validators of request
+            self.lookup_cache = (
+                lookups.get_lookup_cache(context) or lookups.LookupCache()
+            )
+        if self.optimistic_unique:
+            return await self._validate_optimistic(
+                value=value,
+                loc=loc,
+                context=context,
+            )
+        unique_constraints_plan = UniqueConstraintsPlan(
+            unique_constraints=self._get_unique_constraints(),
+            extra_unique_conditions=self._get_extra_unique_conditions(),
+        )
         value = await self._validate_data(
             data=value,
             validation_map=self._get_validation_map(
@@ -153,17 +610,53 @@ class BaseModelValidator(
             ),
             loc=loc,
             context=context,
+            unique_constraints_plan=unique_constraints_plan,
         )
         value = await self._validate_unique_constraints(
             data=value,
-            unique_constraints=self._get_unique_constraints(),
-            extra_unique_conditions=self._get_extra_unique_conditions(),
+            unique_constraints=unique_constraints_plan.unique_constraints,
+            extra_unique_conditions=(
+                unique_constraints_plan.extra_unique_conditions
+            ),
+            unique_constraints_plan=unique_constraints_plan,
         )
         return await self.validate_body(
             value=value,
             context=context,
         )
 
+    async def _validate_optimistic(
+        self,
+        value: types.ApiDataType,
+        loc: types.LOCType,
+        context: common_types.ContextType,
+    ) -> types.ApiDataType:
+        """Perform data validation without checks of uniqueness.
+
+        Errors of unique constraints and fields are registered, so that
+        interactor could raise them, when database rejects duplicate.
+
+        """
+        value = await self._validate_data(
+            data=value,
+            validation_map=self._get_validation_map(
+                value=value,
+                context=context,
+            ),
+            loc=loc,
+            context=context,
+        )
+        value = await self.validate_body(
+            value=value,
+            context=context,
+        )
+        self._register_unique_violations(
+            data=value,
+            loc=loc,
+            context=context,
+        )
+        return value
+
     @metrics.tracker
     async def validate_body(
         self,
@@ -180,29 +673,302 @@ class BaseModelValidator(
         validation_map: ValidationMapType,
         loc: types.LOCType,
         context: common_types.ContextType,
+        unique_constraints_plan: UniqueConstraintsPlan | None = None,
     ) -> types.ApiDataType:
-        """Validate data according to validation_map."""
-        errors: list[core.ValidationError] = []
-        for field, value in dict(data).items():
-            if field not in validation_map:
-                continue
-            for validator in validation_map[field]:
-                try:
-                    value = await validator(
+        """Validate data according to validation_map.
+
+        Validators of each field are run in order until validator which
+        checks data against repository. Checks of such validators of all
+        fields are run in one query, then validation continues. Checks of
+        unique constraints are run with last of such queries.
+
+        Once limit of errors is reached, validation stops without running
+        remaining checks.
+
+        """
+        errors = self.limits.get_errors()
+        # Index of next validator of field and current value of field
+        fields: dict[str, tuple[int, typing.Any]] = {
+            field: (index, data[field])
+            for field, validators in validation_map.items()
+            if field in data
+            and (index := self.lowered_validators.get(field, 0))
+            < len(validators)
+        }
+        while fields:
+            # Validators, which wait for results of checks, and results of
+            # checks (or their position in results of query)
+            waiting: list[
+                tuple[
+                    str,
+                    AnyRepositoryValidator,
+                    slice | collections.abc.Sequence[int],
+                ]
+            ] = []
+            checks: list[repositories.RepositoryCheck] = []
+            # Position of checks of lookups, which are already planned
+            planned_lookups: dict[collections.abc.Hashable, slice] = {}
+            for field, (index, value) in tuple(fields.items()):
+                index, value, validator = await self._run_field_validators(
+                    validators=validation_map[field],
+                    index=index,
+                    value=value,
+                    loc=(*loc, field),
+                    context=context,
+                    errors=errors,
+                )
+                fields[field] = (index, value)
+                if validator is None:
+                    data[field] = value
+                    del fields[field]
+                    continue
+                waiting.append(
+                    (
+                        field,
+                        validator,
+                        self._plan_validator(
+                            validator=validator,
+                            value=value,
+                            context=context,
+                            checks=checks,
+                            planned_lookups=planned_lookups,
+                        ),
+                    ),
+                )
+            if errors.is_full:
+                break
+            planned_constraints: list[
+                tuple[UniqueConstraintType, tuple[typing.Any, ...]]
+            ] = []
+            constraints_start = len(checks)
+            if (
+                checks
+                and unique_constraints_plan
+                and all(
+                    fields[field][0] == len(validation_map[field])
+                    for field, _, _ in waiting
+                )
+            ):
+                planned_constraints = self._plan_unique_constraints(
+                    data={
+                        **data,
+                        **{
+                            field: value
+                            for field, (_, value) in fields.items()
+                        },
+                    },
+                    unique_constraints_plan=unique_constraints_plan,
+                    checks=checks,
+                )
+            results = (
+                await self.repository.run_checks(checks) if checks else []
+            )
+            if unique_constraints_plan:
+                self._save_unique_constraints_results(
+                    planned_constraints=planned_constraints,
+                    results=results[constraints_start:],
+                    unique_constraints_plan=unique_constraints_plan,
+                )
+            for field, validator, validator_results in waiting:
+                index, value = fields[field]
+                if isinstance(validator_results, slice):
+                    validator_results = results[validator_results]
+                    if self.lookup_cache:
+                        validator.remember_results(
+                            value=value,
+                            results=validator_results,
+                            cache=self.lookup_cache,
+                        )
+                fields[field] = (
+                    index,
+                    await self._run_validator(
+                        validation=validator.resolve(
+                            value=value,
+                            results=validator_results,
+                            loc=(*loc, field),
+                            context=context,
+                        ),
                         value=value,
-                        loc=(*loc, field),
-                        context=context,
-                    )
-                except core.ValidationError as validation_error:
-                    if validation_error.all_errors:
-                        errors += validation_error.all_errors
-                    else:
-                        errors.append(validation_error)
-            data[field] = value
-        if errors:
-            raise core.ValidationError(all_errors=errors)
+                        errors=errors,
+                    ),
+                )
+        errors.raise_errors()
         return data
 
+    async def _run_field_validators(
+        self,
+        validators: collections.abc.Sequence[
+            core.BaseValidator[typing.Any, typing.Any]
+        ],
+        index: int,
+        value: typing.Any,
+        loc: types.LOCType,
+        context: common_types.ContextType,
+        errors: core.ValidationErrors,
+    ) -> tuple[int, typing.Any, AnyRepositoryValidator | None]:
+        """Run validators of field until one which needs checks.
+
+        Return index of next validator, value and validator which waits for
+        results of checks.
+
+        """
+        while index < len(validators) and not errors.is_full:
+            validator = validators[index]
+            index += 1
+            if self._skips_validator(validator):
+                continue
+            if isinstance(
+                validator,
+                repository_validators.BaseRepositoryValidator,
+            ):
+                return index, value, validator
+            value = await self._run_validator(
+                validation=validator(value=value, loc=loc, context=context),
+                value=value,
+                errors=errors,
+            )
+        return index, value, None
+
+    def _plan_validator(
+        self,
+        validator: AnyRepositoryValidator,
+        value: typing.Any,
+        context: common_types.ContextType,
+        checks: list[repositories.RepositoryCheck],
+        planned_lookups: dict[collections.abc.Hashable, slice],
+    ) -> slice | collections.abc.Sequence[int]:
+        """Add checks of validator to checks of fields.
+
+        Return results of checks from cache of lookups or position of checks
+        in results of query. Same lookups of different fields (for example,
+        same related object) are checked once.
+
+        """
+        lookup_request = validator.get_lookup_request(value)
+        lookup_key: collections.abc.Hashable | None = None
+        if lookup_request and self.lookup_cache:
+            cached_results = validator.get_cached_results(
+                value=value,
+                cache=self.lookup_cache,
+            )
+            if cached_results is not None:
+                return cached_results
+            lookup, values = lookup_request
+            try:
+                lookup_key = (lookup, frozenset(values))
+                if lookup_key in planned_lookups:
+                    return planned_lookups[lookup_key]
+            except TypeError:
+                # Values are not hashable
+                lookup_key = None
+        planned_checks = validator.plan(value=value, context=context)
+        position = slice(len(checks), len(checks) + len(planned_checks))
+        checks.extend(planned_checks)
+        if lookup_key is not None:
+            planned_lookups[lookup_key] = position
+        return position
+
+    def _save_unique_constraints_results(
+        self,
+        planned_constraints: collections.abc.Sequence[
+            tuple[UniqueConstraintType, tuple[typing.Any, ...]]
+        ],
+        results: collections.abc.Sequence[int],
+        unique_constraints_plan: UniqueConstraintsPlan,
+    ) -> None:
+        """Save results of checks of unique constraints."""
+        for (constraint, values), result in zip(
+            planned_constraints,
+            results,
+            strict=True,
+        ):
+            unique_constraints_plan.results[constraint] = (values, result)
+            self._remember_unique_constraint_result(
+                values=values,
+                constraint=constraint,
+                extra_unique_conditions=(
+                    unique_constraints_plan.extra_unique_conditions
+                ),
+                result=result,
+            )
+
+    def _remember_unique_constraint_result(
+        self,
+        values: tuple[typing.Any, ...],
+        constraint: UniqueConstraintType,
+        extra_unique_conditions: collections.abc.Sequence[UniqueCondition],
+        result: int,
+    ) -> None:
+        """Save result of check of unique constraint into cache of lookups."""
+        if not self.lookup_cache or None in values:
+            return
+        try:
+            self.lookup_cache.remember(
+                lookup=self._get_unique_constraint_lookup(
+                    constraint=constraint,
+                    extra_unique_conditions=extra_unique_conditions,
+                ),
+                values=[values],
+                present=[values] if result else [],
+            )
+        except TypeError:
+            # Values are not hashable
+            return
+
+    def _plan_unique_constraints(
+        self,
+        data: types.ApiDataType,
+        unique_constraints_plan: UniqueConstraintsPlan,
+        checks: list[repositories.RepositoryCheck],
+    ) -> list[tuple[UniqueConstraintType, tuple[typing.Any, ...]]]:
+        """Add checks of unique constraints to checks of fields.
+
+        Return planned constraints and values of their fields.
+
+        """
+        planned_constraints = [
+            constraint
+            for constraint in unique_constraints_plan.unique_constraints
+            if all(field_name in data for field_name in constraint)
+            and self._get_cached_unique_constraint_result(
+                data=data,
+                constraint=constraint,
+                extra_unique_conditions=(
+                    unique_constraints_plan.extra_unique_conditions
+                ),
+            )
+            is None
+        ]
+        checks.extend(
+            self._get_unique_constraints_checks(
+                data=data,
+                unique_constraints=planned_constraints,
+                extra_unique_conditions=(
+                    unique_constraints_plan.extra_unique_conditions
+                ),
+            ),
+        )
+        return [
+            (
+                constraint,
+                tuple(data[field_name] for field_name in constraint),
+            )
+            for constraint in planned_constraints
+        ]
+
+    async def _run_validator(
+        self,
+        validation: collections.abc.Awaitable[typing.Any],
+        value: typing.Any,
+        errors: core.ValidationErrors,
+    ) -> typing.Any:
+        """Get validated value, on fail collect errors and keep value."""
+        try:
+            return await validation
+        except core.ValidationError as validation_error:
+            errors.add(validation_error)
+            return value
+
 
 class BaseModelListValidator(
     core.BaseValidator[
@@ -228,6 +994,36 @@ class BaseModelListValidator(
     ) -> None:
         self.repository = repository
         self.instance_validator = instance_validator
+        # Number of leading validators of fields of items, which were already
+        # run on validation of request schema
+        self.lowered_validators: collections.abc.Mapping[str, int] = {}
+
+    @metrics.tracker
+    async def validate_schemas(
+        self,
+        schemas: collections.abc.Sequence[pydantic.BaseModel],
+        context: common_types.ContextType,
+        loc: types.LOCType = ("body",),
+    ) -> collections.abc.Sequence[types.ApiDataType] | None:
+        """Validate data of items of request schema.
+
+        Validators, which were compiled into schema of items by
+        `get_request_schema` of validator of items, are not run again.
+
+        """
+        schema_classes = {type(schema) for schema in schemas}
+        self.lowered_validators = (
+            self.instance_validator.get_lowered_validators(
+                schema_classes.pop(),
+            )
+            if len(schema_classes) == 1
+            else {}
+        )
+        return await self(
+            value=[dict(schema) for schema in schemas],
+            context=context,
+            loc=loc,
+        )
 
     @abc.abstractmethod
     @metrics.tracker
@@ -237,16 +1033,42 @@ class BaseModelListValidator(
         loc: types.LOCType,
         context: common_types.ContextType,
     ) -> collections.abc.Sequence[types.ApiDataType] | None:
-        """Validate sequence of api data."""
+        """Validate sequence of api data.
+
+        Lookups of all items (existence of related objects, uniqueness of
+        values) are checked in advance with one query per lookup. Unique
+        values of each item are marked as present after its validation, so
+        duplicates in following items are reported as not unique.
+
+        """
         if not value:
             return value
+        lookup_cache = lookups.LookupCache()
+        instance_validators = [
+            self.instance_validator(repository=self.repository) for _ in value
+        ]
+        unique_lookups = await self._prefetch_lookups(
+            instance_validators=instance_validators,
+            value=value,
+            lookup_cache=lookup_cache,
+            context=context,
+        )
         validated_data: list[types.ApiDataType] = []
-        errors: list[core.ValidationError] = []
-        for index, data in enumerate(value):
+        errors = self.limits.get_errors()
+        for index, (instance_validator, data) in enumerate(
+            zip(instance_validators, value, strict=True),
+        ):
+            if errors.is_full:
+                break
+            instance_validator.lookup_cache = lookup_cache
+            instance_validator.lowered_validators = self.lowered_validators
+            if errors.max_errors is not None:
+                # Items don't collect errors over limit of list
+                instance_validator.limits = core.ValidationLimits(
+                    max_errors=errors.remaining,
+                )
             try:
-                validated_value = await self.instance_validator(
-                    repository=self.repository,
-                )(
+                validated_value = await instance_validator(
                     value=data,
                     loc=(*loc, index),
                     context=context,
@@ -254,10 +1076,54 @@ class BaseModelListValidator(
                 if validated_value:
                     validated_data.append(validated_value)
             except core.ValidationError as validation_error:
-                if validation_error.all_errors:
-                    errors += validation_error.all_errors
-                else:
-                    errors.append(validation_error)
-        if errors:
-            raise core.ValidationError(all_errors=errors)
+                errors.add(validation_error)
+            for lookup, lookup_values in unique_lookups[index]:
+                lookup_cache.claim(lookup=lookup, values=lookup_values)
+        errors.raise_errors()
         return validated_data
+
+    async def _prefetch_lookups(
+        self,
+        instance_validators: collections.abc.Sequence[
+            BaseModelValidator[
+                repositories.ApiRepositoryProtocolT,
+                repositories.APIModelT,
+            ]
+        ],
+        value: collections.abc.Sequence[types.ApiDataType],
+        lookup_cache: lookups.LookupCache,
+        context: common_types.ContextType,
+    ) -> list[list[tuple[lookups.ValuesLookup, list[lookups.LookupValue]]]]:
+        """Check lookups of all items in advance.
+
+        Return lookups of unique values of each item.
+
+        """
+        lookup_values: collections.defaultdict[
+            lookups.ValuesLookup,
+            set[lookups.LookupValue],
+        ] = collections.defaultdict(set)
+        unique_lookups: list[
+            list[tuple[lookups.ValuesLookup, list[lookups.LookupValue]]]
+        ] = []
+        for instance_validator, data in zip(
+            instance_validators,
+            value,
+            strict=True,
+        ):
+            item_unique_lookups = []
+            for lookup, values, is_unique in instance_validator.get_lookups(
+                data=data,
+                context=context,
+            ):
+                try:
+                    lookup_values[lookup].update(values)
+                except TypeError:
+                    # Values are not hashable, they are checked by validator
+                    continue
+                if is_unique:
+                    item_unique_lookups.append((lookup, values))
+            unique_lookups.append(item_unique_lookups)
+        for lookup, values in lookup_values.items():
+            await lookup_cache.prefetch(lookup=lookup, values=values)
+        return unique_lookups
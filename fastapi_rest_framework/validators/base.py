@@ -9,7 +9,7 @@ from . import core, types
 
 
 class DatetimeValidator(
-    core.BaseValidator[
+    core.BasePureValidator[
         datetime.datetime,
         datetime.datetime,
     ],
@@ -17,11 +17,9 @@ class DatetimeValidator(
     """Validate datetime."""
 
     @metrics.tracker
-    async def _validate(
+    def _validate_value(
         self,
         value: datetime.datetime | None,
-        loc: types.LOCType,
-        context: dict[str, typing.Any],
     ) -> datetime.datetime | None:
         """Strip timezone info sqlalchemy doesn't do it for us."""
         if not value:
@@ -29,7 +27,7 @@ class DatetimeValidator(
         return value.replace(tzinfo=None)
 
 
-class RegexValidator(core.BaseValidator[str, str]):
+class RegexValidator(core.BasePureValidator[str, str]):
     """Validate string against regex."""
 
     def __init__(
@@ -39,18 +37,17 @@ class RegexValidator(core.BaseValidator[str, str]):
     ) -> None:
         super().__init__()
         self.pattern: str = pattern
+        self.regex = re.compile(pattern)
         self.human_error: str = human_error
 
     @metrics.tracker
-    async def _validate(
+    def _validate_value(
         self,
         value: str | None,
-        loc: types.LOCType,
-        context: dict[str, typing.Any],
     ) -> str | None:
         if not value:
             return value
-        if not re.match(pattern=self.pattern, string=value):
+        if not self.regex.match(value):
             raise core.ValidationError(
                 error_type=core.ValidationErrorType.invalid,
                 error_message=self.human_error,
@@ -58,15 +55,13 @@ class RegexValidator(core.BaseValidator[str, str]):
         return value
 
 
-class TimeZoneValidator(core.BaseValidator[str, str]):
+class TimeZoneValidator(core.BasePureValidator[str, str]):
     """Validate timezone."""
 
     @metrics.tracker
-    async def _validate(
+    def _validate_value(
         self,
         value: str | None,
-        loc: types.LOCType,
-        context: dict[str, typing.Any],
     ) -> str | None:
         if value is None:
             return value
@@ -81,7 +76,7 @@ class TimeZoneValidator(core.BaseValidator[str, str]):
 
 
 class NotEqualToValues(
-    core.BaseValidator[
+    core.BasePureValidator[
         types.AnyGenericInput,
         types.AnyGenericOutput,
     ],
@@ -102,11 +97,9 @@ class NotEqualToValues(
         self.human_msg: str | None = human_msg
 
     @metrics.tracker
-    async def _validate(
+    def _validate_value(
         self,
         value: types.AnyGenericInput | None,
-        loc: types.LOCType,
-        context: dict[str, typing.Any],
     ) -> types.AnyGenericOutput | None:
         if value is None:
             return value
@@ -1,11 +1,22 @@
 import abc
 import collections.abc
+import dataclasses
 import enum
+import functools
+import operator
 import typing
 
+import pydantic
+import pydantic_core
+
 from .. import common_types, metrics
 from . import schemas, types
 
+# Origins of union annotations (`typing.Optional[int]` and `int | None`)
+UNION_ORIGINS = (typing.Union, type(int | None))
+# Origins of list annotations, which list validators could be lowered into
+LIST_ORIGINS = (list, collections.abc.Sequence)
+
 
 class ValidationErrorType(enum.StrEnum):
     """Representation error types."""
@@ -16,6 +27,58 @@ class ValidationErrorType(enum.StrEnum):
     not_found = "not_found"
 
 
+@dataclasses.dataclass
+class ValidatorBinding:
+    """Representation of state of validation, which validators depend on.
+
+    Validators, which are declared once on class level, are bound to it
+    before validation.
+
+    """
+
+    repository: typing.Any
+    instance: typing.Any
+    context: common_types.ContextType
+    # Repositories of other classes, which are initialized from `repository`
+    repositories: dict[type[typing.Any], typing.Any] = dataclasses.field(
+        default_factory=dict,
+    )
+
+    def get_repository(
+        self,
+        repository_class: type[typing.Any] | None = None,
+    ) -> typing.Any:
+        """Get repository of class, it's initialized once per binding."""
+        if repository_class is None:
+            return self.repository
+        if repository_class not in self.repositories:
+            self.repositories[repository_class] = self.repository.init_other(
+                repository_class=repository_class,
+            )
+        return self.repositories[repository_class]
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationLimits:
+    """Representation of limits of errors of validation.
+
+    Validation stops once limit is reached, so invalid large payloads don't
+    cause checks against repository and huge responses with errors.
+
+    """
+
+    # Max number of reported errors
+    max_errors: int | None = None
+    # Whether validation stops on first error
+    fail_fast: bool = False
+
+    def get_errors(self) -> "ValidationErrors":
+        """Get accumulator of errors, which respects limits."""
+        return ValidationErrors(
+            max_errors=1 if self.fail_fast else self.max_errors,
+        )
+
+
 class BaseValidator(
     typing.Generic[
         types.AnyGenericInput,
@@ -24,6 +87,38 @@ class BaseValidator(
 ):
     """Base class for validations."""
 
+    # Limits of errors, which are collected by validator
+    limits: ValidationLimits = ValidationLimits()
+
+    @property
+    def requires_binding(self) -> bool:
+        """Check that validator depends on state of validation."""
+        return False
+
+    def bind(self, binding: ValidatorBinding) -> typing.Self:
+        """Get validator, which is bound to state of validation.
+
+        Validators, which don't depend on it, are shared.
+
+        """
+        return self
+
+    def lower_annotation(self, annotation: typing.Any) -> typing.Any | None:
+        """Get annotation of field, which also runs validator.
+
+        It's used to compile validator into validation of request schema.
+        Return None, if validator can't be compiled (for example, it checks
+        data against repository).
+
+        """
+        return None
+
+    def _replace(self, **changes: typing.Any) -> typing.Self:
+        """Get shallow copy of validator with changed attributes."""
+        replaced = object.__new__(type(self))
+        replaced.__dict__.update(self.__dict__, **changes)
+        return replaced
+
     @metrics.tracker
     async def __call__(
         self,
@@ -32,12 +127,23 @@ class BaseValidator(
         loc: types.LOCType = ("body",),
     ) -> types.AnyGenericOutput | None:
         """Validate data."""
-        try:
-            validated_value = await self._validate(
+        return await self._locate_errors(
+            validation=self._validate(
                 value=self._cast_input(value),
                 context=context,
                 loc=loc,
-            )
+            ),
+            loc=loc,
+        )
+
+    async def _locate_errors(
+        self,
+        validation: collections.abc.Awaitable[types.AnyGenericOutput | None],
+        loc: types.LOCType,
+    ) -> types.AnyGenericOutput | None:
+        """Await validation and set location of its errors."""
+        try:
+            validated_value = await validation
         except ValidationError as validation_error:
             validation_error.loc = loc
             if validation_error.all_errors:
@@ -95,27 +201,142 @@ class ValidationError(Exception):
                 "ValidationError has not errors",
             )
 
+    def iter_errors(self) -> collections.abc.Iterator[typing.Self]:
+        """Iterate over nested errors with messages in order.
+
+        Errors are traversed without recursion, so errors of large payloads
+        are flattened in linear time.
+
+        """
+        pending = [self]
+        while pending:
+            error = pending.pop()
+            if error.all_errors:
+                pending.extend(reversed(error.all_errors))
+            else:
+                yield error
+
     @metrics.tracker
     def get_schema(
         self,
     ) -> schemas.ValidationErrorSchema | list[schemas.ValidationErrorSchema]:
         """Transform validation error in schema."""
-        if self.error_message and self.error_type:
-            return schemas.ValidationErrorSchema(
-                field=".".join(map(str, self.loc or ())),
-                type=self.error_type,
-                detail=self.error_message,
-                context=self.context,
+        if not self.all_errors:
+            return self._get_error_schema()
+        return [error._get_error_schema() for error in self.iter_errors()]
+
+    def _get_error_schema(self) -> schemas.ValidationErrorSchema:
+        """Transform error with message in schema."""
+        if not self.error_message or not self.error_type:
+            raise ValueError(  # pragma: no cover
+                "ValidationError has not errors",
             )
-        if self.all_errors:
-            errors: list[schemas.ValidationErrorSchema] = []
-            for error in map(self.__class__.get_schema, self.all_errors):
-                if isinstance(error, list):
-                    errors += error
-                else:
-                    errors.append(error)
-            return errors
-        raise ValueError("ValidationError has not errors")  # pragma: no cover
+        return schemas.ValidationErrorSchema(
+            field=".".join(map(str, self.loc or ())),
+            type=self.error_type,
+            detail=self.error_message,
+            context=self.context,
+        )
+
+
+class ValidationErrors:
+    """Flat accumulator of errors of validation.
+
+    Nested errors are flattened on collection, so errors are collected in
+    linear time. Errors over `max_errors` are dropped, validators stop
+    validation once accumulator is full.
+
+    """
+
+    def __init__(self, max_errors: int | None = None) -> None:
+        self.max_errors = max_errors
+        self.errors: list[ValidationError] = []
+
+    def __bool__(self) -> bool:
+        """Check that there are collected errors."""
+        return bool(self.errors)
+
+    @property
+    def is_full(self) -> bool:
+        """Check that limit of errors is reached."""
+        return (
+            self.max_errors is not None and len(self.errors) >= self.max_errors
+        )
+
+    @property
+    def remaining(self) -> int | None:
+        """Get number of errors, which could be collected yet."""
+        if self.max_errors is None:
+            return None
+        return max(self.max_errors - len(self.errors), 0)
+
+    def add(self, error: ValidationError) -> None:
+        """Collect errors with messages of error."""
+        for nested_error in error.iter_errors():
+            if self.is_full:
+                return
+            self.errors.append(nested_error)
+
+    def raise_errors(self) -> None:
+        """Raise collected errors, if there are any."""
+        if self.errors:
+            raise ValidationError(all_errors=self.errors)
+
+
+class BasePureValidator(
+    BaseValidator[
+        types.AnyGenericInput,
+        types.AnyGenericOutput,
+    ],
+    typing.Generic[
+        types.AnyGenericInput,
+        types.AnyGenericOutput,
+    ],
+):
+    """Base class for pure validations.
+
+    Pure validators check value synchronously and don't depend on context,
+    so they could be compiled into validation of request schema by
+    pydantic-core. Errors are reported with same type, message and location.
+
+    """
+
+    @metrics.tracker
+    async def _validate(
+        self,
+        value: types.AnyGenericInput | None,
+        loc: types.LOCType,
+        context: common_types.ContextType,
+    ) -> types.AnyGenericOutput | None:
+        """Validate data with `_validate_value`."""
+        return self._validate_value(value)
+
+    @abc.abstractmethod
+    def _validate_value(
+        self,
+        value: types.AnyGenericInput | None,
+    ) -> types.AnyGenericOutput | None:
+        """Validate value and raise ValidationError on fail."""
+
+    def lower_annotation(self, annotation: typing.Any) -> typing.Any:
+        """Get annotation of field, which also runs validator."""
+        return typing.Annotated[
+            annotation,
+            pydantic.AfterValidator(self._validate_lowered),
+        ]
+
+    def _validate_lowered(
+        self,
+        value: typing.Any,
+    ) -> types.AnyGenericOutput | None:
+        """Validate value in validation of request schema."""
+        try:
+            return self._validate_value(self._cast_input(value))
+        except ValidationError as error:
+            raise pydantic_core.PydanticCustomError(
+                error.error_type or ValidationErrorType.invalid,
+                error.error_message or "",
+            ) from error
 
 
 class BaseListValidator(
@@ -136,8 +357,59 @@ class BaseListValidator(
             types.AnyGenericInput,
             types.AnyGenericOutput,
         ],
+        limits: ValidationLimits | None = None,
     ) -> None:
         self.instance_validator = instance_validator
+        if limits is not None:
+            self.limits = limits
+
+    @property
+    def requires_binding(self) -> bool:
+        """Check that validator of items depends on state of validation."""
+        return self.instance_validator.requires_binding
+
+    def bind(self, binding: ValidatorBinding) -> typing.Self:
+        """Get validator with validator of items bound to binding."""
+        if not self.requires_binding:
+            return self
+        return self._replace(
+            instance_validator=self.instance_validator.bind(binding),
+        )
+
+    def lower_annotation(self, annotation: typing.Any) -> typing.Any | None:
+        """Get annotation of list field, which also validates its items.
+
+        Empty validated items are dropped, as on validation of data.
+
+        """
+        origin = typing.get_origin(annotation)
+        arguments = typing.get_args(annotation)
+        if origin in UNION_ORIGINS:
+            lowered_arguments = [
+                argument
+                if argument is type(None)
+                else self.lower_annotation(argument)
+                for argument in arguments
+            ]
+            if None in lowered_arguments:
+                return None
+            return functools.reduce(operator.or_, lowered_arguments)
+        if origin not in LIST_ORIGINS or len(arguments) != 1:
+            return None
+        lowered_item = self.instance_validator.lower_annotation(arguments[0])
+        if lowered_item is None:
+            return None
+        return typing.Annotated[
+            origin[lowered_item],
+            pydantic.AfterValidator(self._drop_empty_items),
+        ]
+
+    def _drop_empty_items(
+        self,
+        value: collections.abc.Sequence[types.AnyGenericOutput],
+    ) -> list[types.AnyGenericOutput]:
+        """Drop empty items of validated list."""
+        return [item for item in value if item]
 
     @metrics.tracker
     async def _validate(
@@ -146,9 +418,13 @@ class BaseListValidator(
         loc: types.LOCType,
         context: common_types.ContextType,
     ) -> collections.abc.Sequence[types.AnyGenericOutput] | None:
-        """Validate sequence of api data."""
+        """Validate sequence of api data.
+
+        Validation stops once limit of errors is reached.
+
+        """
         validated_data: list[types.AnyGenericOutput] = []
-        errors: list[ValidationError] = []
+        errors = self.limits.get_errors()
         if value is None:
             return value
         for index, data in enumerate(value):
@@ -161,10 +437,8 @@ class BaseListValidator(
                 if validated_value:
                     validated_data.append(validated_value)
             except ValidationError as validation_error:
-                if validation_error.all_errors:
-                    errors += validation_error.all_errors
-                else:
-                    errors.append(validation_error)
-        if errors:
-            raise ValidationError(all_errors=errors)
+                errors.add(validation_error)
+                if errors.is_full:
+                    break
+        errors.raise_errors()
         return validated_data
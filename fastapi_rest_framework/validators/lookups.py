@@ -0,0 +1,123 @@
+import collections
+import collections.abc
+import dataclasses
+import typing
+
+from .. import common_types, repositories
+
+LookupValue: typing.TypeAlias = tuple[typing.Any, ...]
+# Key of context, under which cache of lookups of request is stored
+LOOKUP_CACHE_CONTEXT_KEY = "lookup_cache"
+
+
+@dataclasses.dataclass(frozen=True)
+class ValuesLookup:
+    """Representation of lookup of values of fields, which have entries.
+
+    Lookups are compared by model, fields and conditions, so values of same
+    lookup of different validators are checked together.
+
+    """
+
+    repository: repositories.AnyApiRepositoryProtocol = dataclasses.field(
+        compare=False,
+    )
+    model: type[typing.Any]
+    fields: tuple[str, ...]
+    # Key, which identifies `where` (for example conditions it's built from)
+    where_key: collections.abc.Hashable = ()
+    where: collections.abc.Sequence[typing.Any] = dataclasses.field(
+        default=(),
+        compare=False,
+    )
+
+
+class LookupCache:
+    """Storage of values of lookups, which were checked against repository.
+
+    It's used to check values of many validators (for example, of all items
+    of bulk payload) with one query per lookup. Cache of request is passed
+    in context, so values are checked once per request, interactors
+    invalidate lookups of models they change.
+
+    """
+
+    def __init__(self) -> None:
+        self.checked: collections.defaultdict[
+            ValuesLookup,
+            set[LookupValue],
+        ] = collections.defaultdict(set)
+        self.present: collections.defaultdict[
+            ValuesLookup,
+            set[LookupValue],
+        ] = collections.defaultdict(set)
+
+    async def prefetch(
+        self,
+        lookup: ValuesLookup,
+        values: collections.abc.Iterable[LookupValue],
+    ) -> None:
+        """Check values, which weren't checked yet, in one query."""
+        not_checked = set(values) - self.checked[lookup]
+        if not not_checked:
+            return
+        self.present[lookup] |= await lookup.repository.fetch_existing_values(
+            fields=lookup.fields,
+            values=not_checked,
+            where=lookup.where,
+        )
+        self.checked[lookup] |= not_checked
+
+    def get_present(
+        self,
+        lookup: ValuesLookup,
+        values: collections.abc.Collection[LookupValue],
+    ) -> set[LookupValue] | None:
+        """Get present values, if all values were checked."""
+        try:
+            if not self.checked[lookup].issuperset(values):
+                return None
+        except TypeError:
+            # Values are not hashable
+            return None
+        return self.present[lookup] & set(values)
+
+    def remember(
+        self,
+        lookup: ValuesLookup,
+        values: collections.abc.Iterable[LookupValue],
+        present: collections.abc.Iterable[LookupValue],
+    ) -> None:
+        """Save result of check of values, which was made elsewhere."""
+        self.checked[lookup].update(values)
+        self.present[lookup].update(present)
+
+    def invalidate(self, model: type[typing.Any]) -> None:
+        """Forget checked values of lookups of model."""
+        for lookup in tuple(self.checked):
+            if lookup.model is model:
+                del self.checked[lookup]
+                self.present.pop(lookup, None)
+
+    def claim(
+        self,
+        lookup: ValuesLookup,
+        values: collections.abc.Iterable[LookupValue],
+    ) -> None:
+        """Mark values as present.
+
+        It's used for unique values of items of bulk payload, so that
+        duplicates in following items are reported as not unique.
+
+        """
+        values = set(values)
+        self.checked[lookup] |= values
+        self.present[lookup] |= values
+
+
+def get_lookup_cache(
+    context: common_types.ContextType,
+) -> LookupCache | None:
+    """Get cache of lookups of request from context."""
+    lookup_cache = context.get(LOOKUP_CACHE_CONTEXT_KEY)
+    return lookup_cache if isinstance(lookup_cache, LookupCache) else None
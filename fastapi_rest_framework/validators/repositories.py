@@ -2,13 +2,215 @@ import collections.abc
 import typing
 
 from .. import common_types, metrics, repositories
-from . import core, types
+from . import core, lookups, types
 
 
-class ObjectPKValidator(
+class BaseRepositoryValidator(
     core.BaseValidator[
+        types.AnyGenericInput,
+        types.AnyGenericOutput,
+    ],
+    typing.Generic[
+        types.AnyGenericInput,
+        types.AnyGenericOutput,
+        repositories.ApiRepositoryProtocolT,
+    ],
+):
+    """Base class for validators, which check data against repository.
+
+    Instead of running queries, validators declare checks, so that
+    `BaseModelValidator` could run checks of all fields in one query and
+    then pass results back to validators.
+
+    Validators could be declared without repository (for example, in
+    `validation_plan` of model validator), then they are bound to repository
+    of model validator or to repository of `repository_class`, which is
+    initialized from it.
+
+    """
+
+    repository: repositories.ApiRepositoryProtocolT
+    repository_class: type[repositories.AnyApiRepositoryProtocol] | None = None
+    # Whether validated values should be unique, so that duplicates in bulk
+    # payload are reported
+    has_unique_values: bool = False
+
+    @property
+    def requires_binding(self) -> bool:
+        """Check that validator was declared without repository."""
+        return self.repository is None
+
+    def bind(self, binding: core.ValidatorBinding) -> typing.Self:
+        """Get validator, which is bound to repository of binding."""
+        if not self.requires_binding:
+            return self
+        return self._replace(
+            repository=binding.get_repository(self.repository_class),
+        )
+
+    def plan(
+        self,
+        value: typing.Any | None,
+        context: common_types.ContextType,
+    ) -> collections.abc.Sequence[repositories.RepositoryCheck]:
+        """Get checks, which are needed to validate value."""
+        value = self._cast_input(value)
+        if value is None:
+            return ()
+        return self._get_checks(value=value, context=context)
+
+    @metrics.tracker
+    async def resolve(
+        self,
+        value: typing.Any | None,
+        results: collections.abc.Sequence[int],
+        context: common_types.ContextType,
+        loc: types.LOCType = ("body",),
+    ) -> types.AnyGenericOutput | None:
+        """Validate value using results of checks from `plan`."""
+        value = self._cast_input(value)
+        if value is None:
+            return value
+        return await self._locate_errors(
+            validation=self._validate_results(
+                value=value,
+                results=results,
+                loc=loc,
+                context=context,
+            ),
+            loc=loc,
+        )
+
+    @metrics.tracker
+    async def _validate(
+        self,
+        value: types.AnyGenericInput | None,
+        loc: types.LOCType,
+        context: common_types.ContextType,
+    ) -> types.AnyGenericOutput | None:
+        if value is None:
+            return value
+        return await self._validate_results(
+            value=value,
+            results=await self.repository.run_checks(
+                self._get_checks(value=value, context=context),
+            ),
+            loc=loc,
+            context=context,
+        )
+
+    def get_cached_results(
+        self,
+        value: typing.Any | None,
+        cache: lookups.LookupCache,
+    ) -> collections.abc.Sequence[int] | None:
+        """Get results of checks from cache of lookups, if it has them."""
+        if (lookup_request := self.get_lookup_request(value)) is None:
+            return None
+        present = cache.get_present(*lookup_request)
+        if present is None:
+            return None
+        return self._get_lookup_results(
+            value=self._cast_input(value),
+            present=present,
+        )
+
+    def remember_results(
+        self,
+        value: typing.Any | None,
+        results: collections.abc.Sequence[int],
+        cache: lookups.LookupCache,
+    ) -> None:
+        """Save results of checks into cache of lookups.
+
+        Results are saved only if they show which values of lookup are
+        present, so other validators of request don't check them again.
+
+        """
+        if (lookup_request := self.get_lookup_request(value)) is None:
+            return
+        lookup, values = lookup_request
+        present = self._get_present_values(
+            values=values,
+            results=results,
+        )
+        if present is None:
+            return
+        try:
+            cache.remember(lookup=lookup, values=values, present=present)
+        except TypeError:
+            # Values are not hashable
+            return
+
+    def get_lookup_request(
+        self,
+        value: typing.Any | None,
+    ) -> tuple[lookups.ValuesLookup, list[lookups.LookupValue]] | None:
+        """Get lookup and its values, which are needed to validate value."""
+        value = self._cast_input(value)
+        if value is None or (lookup := self.get_lookup()) is None:
+            return None
+        return lookup, self.get_lookup_values(value)
+
+    def get_lookup(self) -> lookups.ValuesLookup | None:
+        """Get lookup, which could replace checks of validator.
+
+        Values of same lookup of many validators are checked in one query.
+
+        """
+        return None
+
+    def get_lookup_values(
+        self,
+        value: typing.Any,
+    ) -> list[lookups.LookupValue]:
+        """Get values of lookup, which are needed to validate value."""
+        raise NotImplementedError  # pragma: no cover
+
+    def _get_lookup_results(
+        self,
+        value: types.AnyGenericInput,
+        present: set[lookups.LookupValue],
+    ) -> collections.abc.Sequence[int]:
+        """Get results of checks from present values of lookup."""
+        raise NotImplementedError  # pragma: no cover
+
+    def _get_present_values(
+        self,
+        values: collections.abc.Sequence[lookups.LookupValue],
+        results: collections.abc.Sequence[int],
+    ) -> collections.abc.Collection[lookups.LookupValue] | None:
+        """Get present values of lookup from results of checks.
+
+        Return None, if results are not enough to tell.
+
+        """
+        return None
+
+    def _get_checks(
+        self,
+        value: types.AnyGenericInput,
+        context: common_types.ContextType,
+    ) -> collections.abc.Sequence[repositories.RepositoryCheck]:
+        """Get checks, which are needed to validate value."""
+        raise NotImplementedError  # pragma: no cover
+
+    async def _validate_results(
+        self,
+        value: types.AnyGenericInput,
+        results: collections.abc.Sequence[int],
+        loc: types.LOCType,
+        context: common_types.ContextType,
+    ) -> types.AnyGenericOutput | None:
+        """Validate value using results of checks."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class ObjectPKValidator(
+    BaseRepositoryValidator[
         int | collections.abc.Sequence[int],
         int | collections.abc.Sequence[int],
+        repositories.ApiRepositoryProtocolT,
     ],
     typing.Generic[
         repositories.ApiRepositoryProtocolT,
@@ -19,33 +221,80 @@ class ObjectPKValidator(
 
     def __init__(
         self,
-        repository: repositories.ApiRepositoryProtocolT,
-        human_name: str,
+        repository: repositories.ApiRepositoryProtocolT | None = None,
+        human_name: str = "object",
         pk_attr: str = "id",
+        repository_class: type[repositories.AnyApiRepositoryProtocol]
+        | None = None,
     ) -> None:
         super().__init__()
-        self.repository = repository
+        self.repository = repository  # type: ignore[assignment]
         self.human_name = human_name
         self.pk_attr = pk_attr
+        self.repository_class = repository_class
+
+    def _get_checks(
+        self,
+        value: int | collections.abc.Sequence[int],
+        context: common_types.ContextType,
+    ) -> collections.abc.Sequence[repositories.RepositoryCheck]:
+        return (
+            repositories.RepositoryCheck(
+                repository=self.repository,
+                kind=repositories.RepositoryCheckKind.count,
+                where=(
+                    getattr(self.repository.model, self.pk_attr).in_(
+                        self._get_value_set(value),
+                    ),
+                ),
+            ),
+        )
+
+    def get_lookup(self) -> lookups.ValuesLookup | None:
+        """Get lookup of present primary keys."""
+        return lookups.ValuesLookup(
+            repository=self.repository,
+            model=self.repository.model,
+            fields=(self.pk_attr,),
+        )
+
+    def get_lookup_values(
+        self,
+        value: typing.Any,
+    ) -> list[lookups.LookupValue]:
+        """Get primary keys to check."""
+        return [(pk,) for pk in self._get_value_set(value)]
+
+    def _get_lookup_results(
+        self,
+        value: int | collections.abc.Sequence[int],
+        present: set[lookups.LookupValue],
+    ) -> collections.abc.Sequence[int]:
+        return (len(present),)
+
+    def _get_present_values(
+        self,
+        values: collections.abc.Sequence[lookups.LookupValue],
+        results: collections.abc.Sequence[int],
+    ) -> collections.abc.Collection[lookups.LookupValue] | None:
+        (objs_count,) = results
+        if objs_count == len(values):
+            return values
+        if len(values) == 1:
+            return ()
+        # It's unknown which of ids are missing
+        return None
 
     @metrics.tracker
-    async def _validate(
+    async def _validate_results(
         self,
-        value: int | collections.abc.Sequence[int] | None,
+        value: int | collections.abc.Sequence[int],
+        results: collections.abc.Sequence[int],
         loc: types.LOCType,
         context: common_types.ContextType,
     ) -> int | collections.abc.Sequence[int] | None:
-        if value is None:
-            return value
-
-        value_set = set(
-            value if isinstance(value, collections.abc.Iterable) else [value],
-        )
-        objs_count = await self.repository.count(
-            where=[
-                getattr(self.repository.model, self.pk_attr).in_(value_set),
-            ],
-        )
+        value_set = self._get_value_set(value)
+        (objs_count,) = results
         if objs_count < len(value_set):
             raise core.ValidationError(
                 error_type=core.ValidationErrorType.not_found,
@@ -55,11 +304,20 @@ class ObjectPKValidator(
             return list(value_set)
         return value_set.pop()
 
+    def _get_value_set(
+        self,
+        value: int | collections.abc.Sequence[int],
+    ) -> set[int]:
+        return set(
+            value if isinstance(value, collections.abc.Iterable) else [value],
+        )
+
 
 class UniqueByFieldValidator(
-    core.BaseValidator[
+    BaseRepositoryValidator[
         types.AnyGenericInput,
         types.AnyGenericOutput,
+        repositories.ApiRepositoryProtocolT,
     ],
     typing.Generic[
         types.AnyGenericInput,
@@ -70,47 +328,112 @@ class UniqueByFieldValidator(
 ):
     """Check data is unique against a field."""
 
+    has_unique_values = True
+
     def __init__(
         self,
         field: str,
-        repository: repositories.ApiRepositoryProtocolT,
-        human_name: str,
-        instance: repositories.APIModelT | None,
+        repository: repositories.ApiRepositoryProtocolT | None = None,
+        human_name: str | None = None,
+        instance: repositories.APIModelT | None = None,
+        repository_class: type[repositories.AnyApiRepositoryProtocol]
+        | None = None,
     ) -> None:
         super().__init__()
         self.field = field
-        self.repository = repository
-        self.human_name = human_name
+        self.repository = repository  # type: ignore[assignment]
+        self.human_name = human_name or field
         self.instance = instance
+        self.repository_class = repository_class
+
+    def bind(self, binding: core.ValidatorBinding) -> typing.Self:
+        """Get validator, which is bound to repository and instance."""
+        if not self.requires_binding:
+            return self
+        return self._replace(
+            repository=binding.get_repository(self.repository_class),
+            instance=binding.instance,
+        )
+
+    def _get_checks(
+        self,
+        value: types.AnyGenericInput,
+        context: common_types.ContextType,
+    ) -> collections.abc.Sequence[repositories.RepositoryCheck]:
+        return (
+            repositories.RepositoryCheck(
+                repository=self.repository,
+                kind=repositories.RepositoryCheckKind.exists,
+                where=(
+                    getattr(
+                        self.repository.model,
+                        self.repository.model.pk_field,
+                    )
+                    != getattr(
+                        self.instance,
+                        self.repository.model.pk_field,
+                        None,
+                    ),
+                ),
+                filters_by={self.field: value},
+            ),
+        )
+
+    def get_lookup(self) -> lookups.ValuesLookup | None:
+        """Get lookup of present values of field (except instance)."""
+        pk_field = self.repository.model.pk_field
+        pk = getattr(self.instance, pk_field, None)
+        return lookups.ValuesLookup(
+            repository=self.repository,
+            model=self.repository.model,
+            fields=(self.field,),
+            where_key=("unique", pk),
+            where=(
+                (getattr(self.repository.model, pk_field) != pk,)
+                if pk is not None
+                else ()
+            ),
+        )
+
+    def get_lookup_values(
+        self,
+        value: typing.Any,
+    ) -> list[lookups.LookupValue]:
+        """Get value of field to check."""
+        return [(value,)]
+
+    def _get_lookup_results(
+        self,
+        value: types.AnyGenericInput,
+        present: set[lookups.LookupValue],
+    ) -> collections.abc.Sequence[int]:
+        return (len(present),)
+
+    def _get_present_values(
+        self,
+        values: collections.abc.Sequence[lookups.LookupValue],
+        results: collections.abc.Sequence[int],
+    ) -> collections.abc.Collection[lookups.LookupValue] | None:
+        (found,) = results
+        return values if found else ()
 
     @metrics.tracker
-    async def _validate(
+    async def _validate_results(
         self,
-        value: types.AnyGenericInput | None,
+        value: types.AnyGenericInput,
+        results: collections.abc.Sequence[int],
         loc: types.LOCType,
         context: common_types.ContextType,
     ) -> types.AnyGenericOutput | None:
-        if value is None:
-            return value
-        found_count = await self.repository.count(
-            where=[
-                getattr(
-                    self.repository.model,
-                    self.repository.model.pk_field,
-                )
-                != getattr(
-                    self.instance,
-                    self.repository.model.pk_field,
-                    None,
-                ),
-            ],
-            **{self.field: value},
-        )
-        if found_count:
+        (found,) = results
+        if found:
             raise core.ValidationError(
                 error_type=core.ValidationErrorType.unique,
-                error_message=(
-                    f"There is already an instance with same {self.human_name}"
-                ),
+                error_message=self.error_message,
             )
         return value
+
+    @property
+    def error_message(self) -> str:
+        """Get message of error, which is reported on duplicate."""
+        return f"There is already an instance with same {self.human_name}"
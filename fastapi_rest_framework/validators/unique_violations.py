@@ -0,0 +1,102 @@
+import collections
+import collections.abc
+import dataclasses
+import typing
+
+from .. import common_types, repositories
+from . import core, types
+
+# Key of context, under which registry of unique violations of request is
+# stored
+UNIQUE_VIOLATIONS_CONTEXT_KEY = "unique_violations"
+
+
+@dataclasses.dataclass(frozen=True)
+class UniqueViolation:
+    """Representation of error, which is reported on unique violation."""
+
+    loc: types.LOCType
+    error_message: str
+    # Values of fields of validated data, which are covered by constraint
+    values: collections.abc.Mapping[str, typing.Any]
+
+    def matches(self, error: repositories.UniqueViolationError) -> bool:
+        """Check that values of violation are values of validated data.
+
+        Values reported by data source are text, so they are compared as
+        text.
+
+        """
+        if error.values is None:
+            return False
+        return all(
+            str(self.values.get(field)) == str(value)
+            for field, value in zip(error.fields, error.values, strict=True)
+        )
+
+    def get_error(self) -> core.ValidationError:
+        """Get validation error of violation."""
+        return core.ValidationError(
+            all_errors=[
+                core.ValidationError(
+                    error_type=core.ValidationErrorType.unique,
+                    error_message=self.error_message,
+                    loc=self.loc,
+                ),
+            ],
+        )
+
+
+class UniqueViolations:
+    """Registry of errors, which validators report on unique violations.
+
+    Validators in optimistic mode don't check uniqueness of values, instead
+    they register errors here, so interactors could raise them, when data
+    source rejects changes.
+
+    """
+
+    def __init__(self) -> None:
+        self.violations: collections.defaultdict[
+            frozenset[str],
+            list[UniqueViolation],
+        ] = collections.defaultdict(list)
+
+    def register(
+        self,
+        fields: collections.abc.Iterable[str],
+        violation: UniqueViolation,
+    ) -> None:
+        """Register error of violation of uniqueness of fields."""
+        self.violations[frozenset(fields)].append(violation)
+
+    def get_error(
+        self,
+        error: repositories.UniqueViolationError,
+    ) -> core.ValidationError | None:
+        """Get validation error, which corresponds to unique violation.
+
+        Last registered data with violated values is reported (so for
+        duplicates in bulk payload, error of later item is raised). If data
+        source doesn't report values, error is reported only if single data
+        is registered for violated fields. Otherwise None is returned, so
+        that error of data source is raised as is.
+
+        """
+        violations = self.violations.get(frozenset(error.fields), [])
+        if error.values is None:
+            return violations[0].get_error() if len(violations) == 1 else None
+        for violation in reversed(violations):
+            if violation.matches(error):
+                return violation.get_error()
+        return None
+
+
+def get_unique_violations(
+    context: common_types.ContextType,
+) -> UniqueViolations | None:
+    """Get registry of unique violations of request from context."""
+    unique_violations = context.get(UNIQUE_VIOLATIONS_CONTEXT_KEY)
+    if isinstance(unique_violations, UniqueViolations):
+        return unique_violations
+    return None
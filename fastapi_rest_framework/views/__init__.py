@@ -3,23 +3,37 @@ from .base import (
     AnyBaseAPIView,
     BaseAPIView,
 )
-from .constants import DEFAULT_ERROR_RESPONSES
+from .constants import DEFAULT_ERROR_RESPONSES, CountStrategy
 from .core import (
     BaseAPIViewMeta,
     BaseAPIViewMixin,
+    include_views,
+    register_pending_views,
 )
 from .create import CreateMixin
 from .delete import DeleteMixin
 from .detail import DetailMixin
+from .export import ExportFormat, ExportMixin
 from .filters import AnyFilters, Filters, FiltersT
-from .list import ListMixin, PaginationParams
-from .schemas import PaginatedBaseModel, PaginatedResult
+from .list import (
+    CursorPaginationParams,
+    ListMixin,
+    PaginationMode,
+    PaginationParams,
+)
+from .schemas import (
+    CursorPaginatedResult,
+    PaginatedBaseModel,
+    PaginatedResult,
+)
 from .types import (
+    ActionPlan,
     ActionResponsesMap,
     Context,
     CreateSchema,
     DetailSchema,
     ListSchema,
+    PageInfo,
     ResponsesMap,
     UpdateSchema,
 )
@@ -6,8 +6,15 @@ import typing
 import fastapi
 import pydantic
 
-from .. import common_types, exceptions, permissions, repositories
-from . import core
+from .. import (
+    common_types,
+    exceptions,
+    metrics,
+    permissions,
+    repositories,
+    validators,
+)
+from . import core, types
 
 
 def action(
@@ -93,6 +100,22 @@ class ActionMixin(
         paginated: bool,
     ) -> type[pydantic.BaseModel]:
         """Prepare action context."""
+        return self.get_generated_type(
+            key=("action_context", self.action, func, detail, paginated),
+            factory=lambda: self.generate_action_context(
+                func=func,
+                detail=detail,
+                paginated=paginated,
+            ),
+        )
+
+    def generate_action_context(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        detail: bool,
+        paginated: bool,
+    ) -> type[pydantic.BaseModel]:
+        """Generate model of action context from signature of action."""
         action_dependencies = {}
         if paginated:
             action_dependencies["pagination_params"] = (
@@ -128,6 +151,7 @@ class ActionMixin(
                     "context",
                     "validator",
                     "interactor",
+                    "validation_limits",
                     "joined_load",
                     "select_in_load",
                     "annotations",
@@ -145,6 +169,57 @@ class ActionMixin(
         )
         return action_context_class
 
+    @metrics.tracker
+    def prepare_action_plan(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+    ) -> types.ActionPlan:
+        """Resolve config of action endpoint once on registration."""
+        parameters = inspect.signature(func).parameters
+        return types.ActionPlan(
+            permissions=tuple(self.get_permissions(action=self.action)),
+            validator=self.get_validator(action=self.action),
+            interactor=self.get_interactor(action=self.action),
+            joined_load=tuple(
+                self.get_joined_load_options(action=self.action),
+            ),
+            select_in_load=tuple(
+                self.get_select_in_load_options(action=self.action),
+            ),
+            annotations=tuple(self.get_annotations(action=self.action)),
+            use_reload_fetch_statement="reload_fetch_statement" in parameters,
+            validation_limits=self.get_validation_limits(action=self.action),
+            use_validation_limits="validation_limits" in parameters,
+        )
+
+    @metrics.tracker
+    async def get_reload_fetch_statement(
+        self,
+        plan: types.ActionPlan,
+        user: permissions.UserT,
+        repository: repositories.ApiRepositoryProtocolT,
+    ) -> repositories.SelectStatementT | None:
+        """Prepare statement for reloading of instance, if action uses it."""
+        if not plan.use_reload_fetch_statement:
+            return None
+        return await self.prepare_fetch_statement(
+            user=user,
+            repository=repository,
+            joined_load=plan.joined_load,
+            select_in_load=plan.select_in_load,
+            annotations=plan.annotations,
+        )
+
+    @metrics.tracker
+    def get_validation_limits_kwargs(
+        self,
+        plan: types.ActionPlan,
+    ) -> dict[str, validators.ValidationLimits | None]:
+        """Get validation limits argument, if action accepts it."""
+        if not plan.use_validation_limits:
+            return {}
+        return {"validation_limits": plan.validation_limits}
+
     def prepare_action(
         self,
         func: collections.abc.Callable[..., typing.Any],
@@ -158,6 +233,7 @@ class ActionMixin(
             paginated=paginated,
         )
         func_return = func.__annotations__["return"]
+        plan = self.prepare_action_plan(func)
 
         async def action(
             action_context: typing.Annotated[  # type: ignore
@@ -177,9 +253,7 @@ class ActionMixin(
                 request_data = dict(request_context_dump["request"])
             await self.check_permissions(
                 user=user,
-                permissions=self.get_permissions(
-                    action=self.action,
-                ),
+                permissions=plan.permissions,
                 context=context_dump,
                 request_data=request_data,
             )
@@ -188,34 +262,17 @@ class ActionMixin(
                 repository=repository,
                 context=context,
                 user=user,
-                validator=self.get_validator(
-                    action=self.action,
-                ),
-                interactor=self.get_interactor(
-                    action=self.action,
-                ),
-                joined_load=self.get_joined_load_options(
-                    action=self.action,
-                ),
-                select_in_load=self.get_select_in_load_options(
-                    action=self.action,
-                ),
-                annotations=self.get_annotations(
-                    action=self.action,
-                ),
-                reload_fetch_statement=await self.prepare_fetch_statement(
+                validator=plan.validator,
+                interactor=plan.interactor,
+                joined_load=plan.joined_load,
+                select_in_load=plan.select_in_load,
+                annotations=plan.annotations,
+                reload_fetch_statement=await self.get_reload_fetch_statement(
+                    plan=plan,
                     user=user,
                     repository=repository,
-                    joined_load=self.get_joined_load_options(
-                        action=self.action,
-                    ),
-                    select_in_load=self.get_select_in_load_options(
-                        action=self.action,
-                    ),
-                    annotations=self.get_annotations(
-                        action=self.action,
-                    ),
                 ),
+                **self.get_validation_limits_kwargs(plan),
                 **request_context_dump,
             )
 
@@ -243,24 +300,16 @@ class ActionMixin(
                 pk,
                 user=user,
                 repository=repository,
-                joined_load=self.get_joined_load_options(
-                    action=self.action,
-                ),
-                select_in_load=self.get_select_in_load_options(
-                    action=self.action,
-                ),
-                annotations=self.get_annotations(
-                    action=self.action,
-                ),
+                joined_load=plan.joined_load,
+                select_in_load=plan.select_in_load,
+                annotations=plan.annotations,
             )
             request_data: permissions.RequestData = None
             if "request" in request_context_dump:
                 request_data = dict(request_context_dump["request"])
             await self.check_permissions(
                 user=user,
-                permissions=self.get_permissions(
-                    action=self.action,
-                ),
+                permissions=plan.permissions,
                 instance=instance,
                 context=context_dump,
                 request_data=request_data,
@@ -273,34 +322,17 @@ class ActionMixin(
                 user=user,
                 instance=instance,
                 context=context,
-                validator=self.get_validator(
-                    action=self.action,
-                ),
-                interactor=self.get_interactor(
-                    action=self.action,
-                ),
-                joined_load=self.get_joined_load_options(
-                    action=self.action,
-                ),
-                select_in_load=self.get_select_in_load_options(
-                    action=self.action,
-                ),
-                annotations=self.get_annotations(
-                    action=self.action,
-                ),
-                reload_fetch_statement=await self.prepare_fetch_statement(
+                validator=plan.validator,
+                interactor=plan.interactor,
+                joined_load=plan.joined_load,
+                select_in_load=plan.select_in_load,
+                annotations=plan.annotations,
+                reload_fetch_statement=await self.get_reload_fetch_statement(
+                    plan=plan,
                     user=user,
                     repository=repository,
-                    joined_load=self.get_joined_load_options(
-                        action=self.action,
-                    ),
-                    select_in_load=self.get_select_in_load_options(
-                        action=self.action,
-                    ),
-                    annotations=self.get_annotations(
-                        action=self.action,
-                    ),
                 ),
+                **self.get_validation_limits_kwargs(plan),
                 **request_context_dump,
             )
 
@@ -1,3 +1,4 @@
+import enum
 import http
 
 from .. import validators
@@ -73,3 +74,16 @@ DEFAULT_ERROR_RESPONSES: types.ResponsesMap = {
         },
     },
 }
+
+
+class CountStrategy(enum.StrEnum):
+    """Representation of strategies of counting total for paginated data."""
+
+    # Run COUNT query over all matching rows
+    exact = "exact"
+    # Count matching rows, but stop at `count_cap`
+    capped = "capped"
+    # Use planner's estimate of rows count
+    estimated = "estimated"
+    # Don't count, only find out whether there is next page
+    none = "none"
@@ -1,12 +1,19 @@
 import collections.abc
 import enum
+import hashlib
 import http
+import os
+import time
 import typing
+import weakref
 
 import fastapi
+import fastapi.responses
 import pydantic
+import pydantic_core
 
 from .. import (
+    cache,
     common_types,
     interactors,
     metrics,
@@ -14,7 +21,20 @@ from .. import (
     repositories,
     validators,
 )
-from . import constants, types
+from ..permissions import core as permissions_core
+from . import constants, cursor, schemas, types
+
+GeneratedT = typing.TypeVar("GeneratedT")
+
+# Types which are generated by views (default validators, pagination params,
+# ordering enums and etc), they are stored per view class.
+_generated_types: weakref.WeakKeyDictionary[
+    type,
+    dict[collections.abc.Hashable, typing.Any],
+] = weakref.WeakKeyDictionary()
+
+# Views, registration of endpoints of which is deferred
+_pending_views: list[type["AnyBaseAPIViewMixin"]] = []
 
 
 class BaseAPIViewMeta(type):
@@ -77,10 +97,40 @@ class BaseAPIViewMeta(type):
             "router_kwargs_map",
             {},
         )
+        if obj_cls.lazy_registration:
+            _pending_views.append(obj_cls)
+            return obj_cls
         obj_cls.register_endpoints()
         return obj_cls
 
 
+def register_pending_views() -> None:
+    """Register endpoints of all views with deferred registration.
+
+    It should be called before routers of views are included, since
+    `include_router` copies routes which router has at the moment of call.
+
+    """
+    while _pending_views:
+        _pending_views[0].materialize_endpoints()
+
+
+def include_views(
+    router: fastapi.APIRouter,
+    *views: type["AnyBaseAPIViewMixin"],
+    **kwargs: typing.Any,
+) -> None:
+    """Include routers of views into router.
+
+    Endpoints of views with deferred registration are registered before
+    including, since `include_router` copies routes which router has at the
+    moment of call. Keyword arguments are passed to `include_router`.
+
+    """
+    for view in views:
+        router.include_router(view.get_router(), **kwargs)
+
+
 class BaseAPIViewMixin(
     typing.Generic[
         repositories.LazyLoadedT,
@@ -110,11 +160,48 @@ class BaseAPIViewMixin(
     responses_map: typing.ClassVar[types.ActionResponsesMap] = {
         "default": constants.DEFAULT_ERROR_RESPONSES,
     }
+    # Whether response of endpoint should be serialized straight to json,
+    # bypassing validation and serialization of response by fastapi. Note
+    # that `response_model_*` router arguments are ignored in this case.
+    # For example: {"list": True}
+    prerender_response_map: typing.ClassVar[typing.Mapping[str, bool]] = {
+        "default": False,
+    }
+    # How responses of endpoint are cached, it is supported by list and
+    # detail endpoints. For example: {"list": cache.CacheConfig(ttl=30)}
+    cache_config_map: typing.ClassVar[
+        typing.Mapping[str, cache.CacheConfig | None]
+    ] = {
+        "default": None,
+    }
+    # Models, changes of which invalidate cached responses besides model of
+    # view. For example, models of loaded relationships.
+    cache_models: collections.abc.Sequence[type[typing.Any]] = ()
+    # Errors of loading data, on which stale cached response is served
+    cache_stale_on_errors: tuple[type[Exception], ...] = ()
+    # Whether registration of endpoints (and generation of their schemas and
+    # dependencies) is deferred until router is mounted via `get_router` or
+    # `include_views`. So modules with views could be imported cheaply by
+    # workers and commands, which don't serve http. Default can be set via
+    # `FASTAPI_REST_FRAMEWORK_LAZY_REGISTRATION=1` env variable.
+    lazy_registration: typing.ClassVar[bool] = os.environ.get(
+        "FASTAPI_REST_FRAMEWORK_LAZY_REGISTRATION",
+        "",
+    ).lower() in ("1", "true")
     # Additional arguments for router endpoint registration
     router_kwargs_map: typing.Mapping[
         str,
         dict[str, typing.Any],
     ]
+    # Value of `Cache-Control` header, it is supported by list and detail
+    # endpoints. For example: {"detail": "private, max-age=60"}
+    cache_control_map: typing.ClassVar[typing.Mapping[str, str | None]] = {
+        "default": None,
+    }
+    # Field (for example `modified` timestamp or version column), which is
+    # used to generate ETags for list and detail endpoints. Requests with
+    # matching `If-None-Match` header are answered with 304.
+    etag_field: str | None = None
     # What should be join loaded for object/objects for endpoint
     joined_load_map: typing.Mapping[
         str,
@@ -159,6 +246,15 @@ class BaseAPIViewMixin(
             repositories.APIModelT,
         ],
     ]
+    # Limits of errors of validation of endpoint, validation of invalid
+    # large payloads stops once limit is reached. Actions get them as
+    # `validation_limits` argument. For example:
+    # {"create": validators.ValidationLimits(max_errors=100)}
+    validation_limits_map: typing.ClassVar[
+        typing.Mapping[str, validators.ValidationLimits | None]
+    ] = {
+        "default": None,
+    }
     # Interactors for each endpoint(usually create/update/delete)
     interactor: types.ActionInteractorType[
         permissions.UserT,
@@ -185,9 +281,42 @@ class BaseAPIViewMixin(
         """
         return cls.router.prefix.strip("/")
 
+    @classmethod
+    def materialize_endpoints(cls) -> None:
+        """Register endpoints of view, if registration was deferred."""
+        if cls in _pending_views:
+            _pending_views.remove(cls)
+            cls.register_endpoints()
+
+    @classmethod
+    def get_router(cls) -> fastapi.APIRouter:
+        """Get router of view with registered endpoints.
+
+        Routers of views with deferred registration should be mounted only
+        via it (or `include_views`), since `include_router` copies routes
+        which router has at the moment of call.
+
+        """
+        cls.materialize_endpoints()
+        return cls.router
+
     @classmethod
     def register_endpoints(cls) -> None:
         """Register endpoint in router."""
+        # Should be registered before detail, otherwise `export` will be
+        # treated as pk
+        if hasattr(cls, "export"):
+            endpoint = cls()
+            endpoint.action = "export"
+            cls.router.get(
+                "/export/",
+                name=f"{cls.get_basename()}-{endpoint.action}",
+                response_class=fastapi.responses.StreamingResponse,
+                responses=endpoint.get_responses(action=endpoint.action),
+                **endpoint.router_kwargs_map.get(endpoint.action, {}),
+            )(
+                endpoint.export(),  # type: ignore
+            )
         if hasattr(cls, "list"):
             endpoint = cls()
             endpoint.action = "list"
@@ -319,6 +448,24 @@ class BaseAPIViewMixin(
             return self.permission_map.get("default", ())
         return self.permission_map[action]
 
+    @metrics.tracker
+    def get_generated_type(
+        self,
+        key: collections.abc.Hashable,
+        factory: collections.abc.Callable[[], GeneratedT],
+    ) -> GeneratedT:
+        """Get type generated by factory, which is cached per view class.
+
+        `key` should include all inputs of factory (and action, if type
+        depends on it), so generated type is created once and reused by all
+        endpoints of view.
+
+        """
+        generated_types = _generated_types.setdefault(self.__class__, {})
+        if key not in generated_types:
+            generated_types[key] = factory()
+        return generated_types[key]
+
     @metrics.tracker
     def get_default_validator(
         self,
@@ -328,15 +475,26 @@ class BaseAPIViewMixin(
     ]:
         """Get default validator class."""
 
-        class DefaultValidator(
-            validators.BaseModelValidator[
-                self.repository_class,  # type: ignore
-                self.model,  # type: ignore
-            ],
+        def generate_validator() -> (
+            types.ActionValidatorType[
+                repositories.ApiRepositoryProtocolT,
+                repositories.APIModelT,
+            ]
         ):
-            model: type[repositories.APIModelT] = self.model
+            class DefaultValidator(
+                validators.BaseModelValidator[
+                    self.repository_class,  # type: ignore
+                    self.model,  # type: ignore
+                ],
+            ):
+                model: type[repositories.APIModelT] = self.model
 
-        return DefaultValidator
+            return DefaultValidator
+
+        return self.get_generated_type(
+            key=("default_validator", self.repository_class, self.model),
+            factory=generate_validator,
+        )
 
     @metrics.tracker
     def get_validator(
@@ -356,6 +514,16 @@ class BaseAPIViewMixin(
             )
         return self.validators_map[action]
 
+    @metrics.tracker
+    def get_validation_limits(
+        self,
+        action: str = "default",
+    ) -> validators.ValidationLimits | None:
+        """Get limits of errors of validation for endpoint."""
+        if action not in self.validation_limits_map:
+            return self.validation_limits_map.get("default")
+        return self.validation_limits_map[action]
+
     @metrics.tracker
     def get_default_interactor(
         self,
@@ -367,17 +535,30 @@ class BaseAPIViewMixin(
     ]:
         """Get default interactor class."""
 
-        class DefaultInteractor(
-            interactors.ApiDataInteractor[
-                typing.Any,
-                typing.Any,
-                self.repository_class,  # type: ignore
-                self.model,  # type: ignore
-            ],
+        def generate_interactor() -> (
+            types.ActionInteractorType[
+                permissions.UserT,
+                repositories.SelectStatementT,
+                repositories.ApiRepositoryProtocolT,
+                repositories.APIModelT,
+            ]
         ):
-            model: type[repositories.APIModelT] = self.model
+            class DefaultInteractor(
+                interactors.ApiDataInteractor[
+                    typing.Any,
+                    typing.Any,
+                    self.repository_class,  # type: ignore
+                    self.model,  # type: ignore
+                ],
+            ):
+                model: type[repositories.APIModelT] = self.model
 
-        return DefaultInteractor
+            return DefaultInteractor
+
+        return self.get_generated_type(
+            key=("default_interactor", self.repository_class, self.model),
+            factory=generate_interactor,
+        )
 
     @metrics.tracker
     def get_interactor(
@@ -409,6 +590,323 @@ class BaseAPIViewMixin(
             return self.responses_map.get("default", {})
         return self.responses_map[action]
 
+    @metrics.tracker
+    def get_fields_dependency(
+        self,
+        schema: type[pydantic.BaseModel],
+    ) -> type[list[enum.StrEnum] | None]:
+        """Prepare dependency for `fields` query param.
+
+        It allows client to request only some fields of schema.
+
+        """
+        fields_enum = self.get_generated_type(
+            key=("fields_enum", schema),
+            factory=lambda: enum.StrEnum(  # type: ignore
+                f"{schema.__name__}FieldsEnum",
+                list(schema.model_fields),
+            ),
+        )
+        return typing.Annotated[  # type: ignore
+            list[fields_enum] | None,
+            fastapi.Query(),
+        ]
+
+    @metrics.tracker
+    def prepare_sparse_response(
+        self,
+        data: pydantic.BaseModel,
+        include: typing.Any,
+    ) -> fastapi.Response:
+        """Prepare response which contains only requested fields."""
+        return fastapi.Response(
+            content=data.model_dump_json(by_alias=True, include=include),
+            media_type="application/json",
+        )
+
+    @metrics.tracker
+    def get_prerender_response(
+        self,
+        action: str = "default",
+    ) -> bool:
+        """Get whether response of endpoint should be prerendered."""
+        if action not in self.prerender_response_map:
+            return self.prerender_response_map.get("default", False)
+        return self.prerender_response_map[action]
+
+    @metrics.tracker
+    def prepare_prerendered_response(
+        self,
+        schema: type[pydantic.BaseModel],
+        data: typing.Any,
+        context: common_types.ContextType,
+        status_code: int = http.HTTPStatus.OK,
+    ) -> fastapi.Response:
+        """Serialize data straight to json response.
+
+        Data (instance or dict with instances) is validated against schema
+        only once and then dumped to json by pydantic-core, so fastapi
+        doesn't validate and serialize response again. Return annotation of
+        endpoint is left as is, so openapi schema stays the same.
+
+        """
+        adapter = schemas.get_type_adapter(schema)
+        return fastapi.Response(
+            content=adapter.dump_json(
+                adapter.validate_python(
+                    data,
+                    from_attributes=True,
+                    context=context,
+                ),
+                by_alias=True,
+            ),
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+    @metrics.tracker
+    def get_cache_config(
+        self,
+        action: str = "default",
+    ) -> cache.CacheConfig | None:
+        """Get response cache config for endpoint."""
+        if action not in self.cache_config_map:
+            return self.cache_config_map.get("default")
+        return self.cache_config_map[action]
+
+    @metrics.tracker
+    def get_cache_scope(
+        self,
+        user: permissions.UserT,
+    ) -> str:
+        """Get key of user, which is used to separate cached responses.
+
+        By default each user has own cache. Override it to share cache
+        between users, who get same responses (for example by role, if
+        permissions and filters of endpoint depend only on it).
+
+        """
+        if user is None:
+            return ""
+        if isinstance(user, pydantic.BaseModel):
+            return user.model_dump_json()
+        return str(user)
+
+    @metrics.tracker
+    def get_cache_key_context(
+        self,
+        context: common_types.ContextType,
+    ) -> typing.Mapping[str, typing.Any]:
+        """Get values of context, which responses depend on.
+
+        They are used in keys of cached responses and ETags, so they must be
+        stable between requests (for example, language of request). Context
+        holds state of request (clients, caches), so it's not used by
+        default.
+
+        """
+        return {}
+
+    @metrics.tracker
+    async def get_cache_key(
+        self,
+        user: permissions.UserT,
+        context: common_types.ContextType,
+        **params: typing.Any,
+    ) -> str:
+        """Prepare key of cached response.
+
+        Key contains current versions of models, so cached responses are
+        invalidated, once interactor changes any of them.
+
+        """
+        versions = await cache.get_cache_backend().get_versions(
+            [
+                cache.get_model_namespace(model)
+                for model in (self.model, *self.cache_models)
+            ],
+        )
+        payload = pydantic_core.to_json(
+            {
+                "view": f"{self.__module__}.{self.__class__.__qualname__}",
+                "action": self.action,
+                "scope": self.get_cache_scope(user),
+                "versions": versions,
+                "context": self.get_cache_key_context(context),
+                "params": params,
+            },
+            fallback=str,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    @metrics.tracker
+    async def get_cached_response(
+        self,
+        cache_config: cache.CacheConfig | None,
+        user: permissions.UserT,
+        context: common_types.ContextType,
+        fetch: collections.abc.Callable[
+            [],
+            collections.abc.Awaitable[pydantic.BaseModel | fastapi.Response],
+        ],
+        **params: typing.Any,
+    ) -> pydantic.BaseModel | fastapi.Response:
+        """Get response from cache or prepare and cache it via `fetch`.
+
+        `params` are parameters of request, which are used in cache key.
+        Stale entry is revalidated by only one request, others get it as is.
+
+        """
+        if cache_config is None:
+            return await fetch()
+        backend = cache.get_cache_backend()
+        key = await self.get_cache_key(user=user, context=context, **params)
+        entry = await backend.get(key)
+        if entry and entry.is_fresh(time.time()):
+            return self.prepare_cached_response(entry)
+        is_locked = False
+        if entry:
+            is_locked = await backend.acquire_lock(
+                key,
+                timeout=cache_config.stale_ttl,
+            )
+            if not is_locked:
+                return self.prepare_cached_response(entry)
+        try:
+            result = await fetch()
+        except self.cache_stale_on_errors:
+            if not entry:
+                raise
+            return self.prepare_cached_response(entry)
+        finally:
+            if is_locked:
+                await backend.release_lock(key)
+        if isinstance(result, fastapi.Response):
+            content = bytes(result.body)
+        else:
+            content = result.model_dump_json(by_alias=True).encode()
+        now = time.time()
+        entry = cache.CacheEntry(
+            content=content,
+            fresh_until=now + cache_config.ttl,
+            stale_until=now + cache_config.ttl + cache_config.stale_ttl,
+        )
+        await backend.set(key, entry)
+        return self.prepare_cached_response(entry)
+
+    @metrics.tracker
+    def prepare_cached_response(
+        self,
+        entry: cache.CacheEntry,
+    ) -> fastapi.Response:
+        """Prepare response from cached entry."""
+        return fastapi.Response(
+            content=entry.content,
+            media_type="application/json",
+        )
+
+    @metrics.tracker
+    def get_cache_control(
+        self,
+        action: str = "default",
+    ) -> str | None:
+        """Get value of `Cache-Control` header for endpoint."""
+        if action not in self.cache_control_map:
+            return self.cache_control_map.get("default")
+        return self.cache_control_map[action]
+
+    @metrics.tracker
+    async def get_etag(
+        self,
+        user: permissions.UserT,
+        repository: repositories.ApiRepositoryProtocolT,
+        context: common_types.ContextType,
+        params: typing.Mapping[str, typing.Any],
+        where: collections.abc.Sequence[repositories.WhereFilterT] = (),
+        skip_empty: bool = False,
+        **filters_by: typing.Any,
+    ) -> str | None:
+        """Prepare ETag of data matching filters.
+
+        ETag is computed from count and max value of `etag_field` of
+        matching entries, so it is loaded via cheap aggregate query before
+        loading of data itself. `params` are parameters of request
+        (pagination, fields, etc.), which affect response. If `skip_empty`
+        is set, None is returned, when there are no matching entries.
+
+        """
+        if self.etag_field is None:
+            raise ValueError(  # pragma: no cover
+                f"Please set `etag_field` for {self.__class__}",
+            )
+        where_filter, filters_by = await self.get_filters_values(
+            user=user,
+            repository=repository,
+            where=where,
+            **filters_by,
+        )
+        count, version = await repository.count_and_max(
+            field=self.etag_field,
+            where=where_filter,
+            **filters_by,
+        )
+        if skip_empty and not count:
+            return None
+        payload = pydantic_core.to_json(
+            {
+                "view": f"{self.__module__}.{self.__class__.__qualname__}",
+                "action": self.action,
+                "scope": self.get_cache_scope(user),
+                "context": self.get_cache_key_context(context),
+                "params": params,
+                "count": count,
+                "version": version,
+            },
+            fallback=str,
+        )
+        return f'"{hashlib.sha256(payload).hexdigest()}"'
+
+    @metrics.tracker
+    def is_not_modified(
+        self,
+        request: fastapi.Request,
+        etag: str,
+    ) -> bool:
+        """Check if `If-None-Match` header of request matches ETag."""
+        if not (if_none_match := request.headers.get("if-none-match")):
+            return False
+        return etag in {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+
+    @metrics.tracker
+    def prepare_not_modified_response(
+        self,
+        etag: str,
+        cache_control: str | None = None,
+    ) -> fastapi.Response:
+        """Prepare response for matched `If-None-Match` header."""
+        response = fastapi.Response(status_code=http.HTTPStatus.NOT_MODIFIED)
+        return self.set_conditional_headers(
+            response=response,
+            etag=etag,
+            cache_control=cache_control,
+        )
+
+    @metrics.tracker
+    def set_conditional_headers(
+        self,
+        response: fastapi.Response,
+        etag: str | None = None,
+        cache_control: str | None = None,
+    ) -> fastapi.Response:
+        """Set `ETag` and `Cache-Control` headers of response."""
+        if etag:
+            response.headers["ETag"] = etag
+        if cache_control:
+            response.headers["Cache-Control"] = cache_control
+        return response
+
     @metrics.tracker
     async def get_filters_values(
         self,
@@ -443,20 +941,59 @@ class BaseAPIViewMixin(
         ] = (),
         where: collections.abc.Sequence[repositories.WhereFilterT]
         | None = None,
+        fields: collections.abc.Collection[str] | None = None,
         **filters_by,
     ) -> repositories.SelectStatementT:
-        """Prepare fetch statement."""
+        """Prepare fetch statement.
+
+        `fields` are fields of instances which are going to be returned by
+        endpoint (None means all), implementations can use it to skip loading
+        of data which won't be used.
+
+        """
         where_filter, filters_by = await self.get_filters_values(
             user=user,
             repository=repository,
             where=where or [],
             **filters_by,
         )
+        return self.build_fetch_statement(
+            repository=repository,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            where=where_filter,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            annotations=annotations,
+            fields=fields,
+            **filters_by,
+        )
+
+    @metrics.tracker
+    def build_fetch_statement(
+        self,
+        repository: repositories.ApiRepositoryProtocolT,
+        offset: int = 0,
+        limit: int = 0,
+        order_by: collections.abc.Sequence[
+            repositories.OrderingClauseT | enum.StrEnum
+        ] = (),
+        annotations: collections.abc.Sequence[repositories.AnnotationT] = (),
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+        where: collections.abc.Sequence[repositories.WhereFilterT] = (),
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> repositories.SelectStatementT:
+        """Build fetch statement from prepared filters values."""
         return repository.get_fetch_statement(
             offset=offset,
             limit=limit,
             ordering_clauses=order_by,
-            where=where_filter,
+            where=where,
             joined_load=joined_load,
             select_in_load=select_in_load,
             annotations=annotations,
@@ -474,6 +1011,7 @@ class BaseAPIViewMixin(
         select_in_load: collections.abc.Sequence[
             repositories.LazyLoadedT
         ] = (),
+        fields: collections.abc.Collection[str] | None = None,
     ) -> repositories.APIModelT | None:
         """Load object from database."""
         return await repository.fetch_first(
@@ -484,6 +1022,44 @@ class BaseAPIViewMixin(
                 joined_load=joined_load,
                 select_in_load=select_in_load,
                 annotations=annotations,
+                fields=fields,
+            ),
+        )
+
+    @metrics.tracker
+    async def fetch_page(
+        self,
+        user: permissions.UserT,
+        repository: repositories.ApiRepositoryProtocolT,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            repositories.OrderingClauseT | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[repositories.AnnotationT],
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+        where: collections.abc.Sequence[repositories.WhereFilterT]
+        | None = None,
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> collections.abc.Sequence[repositories.APIModelT]:
+        """Load page of data from database."""
+        return await repository.fetch_all(
+            statement=await self.prepare_fetch_statement(
+                user=user,
+                repository=repository,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                where=where,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+                annotations=annotations,
+                fields=fields,
+                **filters_by,
             ),
         )
 
@@ -507,32 +1083,246 @@ class BaseAPIViewMixin(
         | None = None,
         **filters_by,
     ) -> tuple[collections.abc.Sequence[repositories.APIModelT], int]:
-        """Load paginated data from database."""
-        objects = await repository.fetch_all(
-            statement=await self.prepare_fetch_statement(
+        """Load paginated data from database along with exact total.
+
+        Use `paginate_page` for other count strategies and info about page.
+
+        """
+        objects, page_info = await self.paginate_page(
+            user=user,
+            repository=repository,
+            context=context,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            annotations=annotations,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            where=where,
+            **filters_by,
+        )
+        return objects, page_info.count or 0
+
+    @metrics.tracker
+    async def paginate_page(
+        self,
+        user: permissions.UserT,
+        repository: repositories.ApiRepositoryProtocolT,
+        context: types.Context,
+        offset: int,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            repositories.OrderingClauseT | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[repositories.AnnotationT],
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+        where: collections.abc.Sequence[repositories.WhereFilterT]
+        | None = None,
+        count_strategy: constants.CountStrategy = (
+            constants.CountStrategy.exact
+        ),
+        count_cap: int = 1000,
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> tuple[
+        collections.abc.Sequence[repositories.APIModelT],
+        types.PageInfo,
+    ]:
+        """Load paginated data from database along with info about page.
+
+        For all strategies except `exact` one extra row is loaded to find out
+        if there is next page.
+
+        """
+        exact = count_strategy == constants.CountStrategy.exact
+        objects = list(
+            await self.fetch_page(
                 user=user,
                 repository=repository,
                 offset=offset,
-                limit=limit,
+                limit=limit if exact else limit + 1,
                 order_by=order_by,
                 where=where,
                 joined_load=joined_load,
                 select_in_load=select_in_load,
                 annotations=annotations,
+                fields=fields,
                 **filters_by,
             ),
         )
+        if not exact:
+            has_next = len(objects) > limit
+            objects = objects[:limit]
+        if count_strategy == constants.CountStrategy.none:
+            return objects, types.PageInfo(count=None, has_next=has_next)
         where_filter, filters_by = await self.get_filters_values(
             user=user,
             repository=repository,
             where=where or [],
             **filters_by,
         )
+        match count_strategy:
+            case constants.CountStrategy.capped:
+                # One more row is counted to tell whether there are more
+                # rows than `count_cap`
+                count = await repository.count_capped(
+                    cap=count_cap + 1,
+                    where=where_filter,
+                    **filters_by,
+                )
+                return objects, types.PageInfo(
+                    count=max(min(count, count_cap), offset + len(objects)),
+                    has_next=has_next,
+                    count_is_lower_bound=count > count_cap,
+                )
+            case constants.CountStrategy.estimated:
+                count = await repository.count_estimated(
+                    where=where_filter,
+                    **filters_by,
+                )
+                return objects, types.PageInfo(
+                    count=max(count, offset + len(objects)),
+                    has_next=has_next,
+                    count_is_estimated=True,
+                )
         count = await repository.count(
             where=where_filter,
             **filters_by,
         )
-        return objects, count
+        return objects, types.PageInfo(
+            count=count,
+            has_next=offset + len(objects) < count,
+        )
+
+    @metrics.tracker
+    def get_cursor_ordering(
+        self,
+        order_by: collections.abc.Sequence[
+            repositories.OrderingClauseT | enum.StrEnum
+        ],
+    ) -> list[cursor.CursorOrderingField]:
+        """Get ordering for cursor pagination.
+
+        Primary key is always added as last field, so that each row would
+        have unique position.
+
+        """
+        ordering = [
+            cursor.CursorOrderingField.from_clause(clause)
+            for clause in order_by
+        ]
+        if self.pk_attr not in {field.field for field in ordering}:
+            ordering.append(cursor.CursorOrderingField(field=self.pk_attr))
+        return ordering
+
+    @metrics.tracker
+    def get_cursor_filter(
+        self,
+        ordering: collections.abc.Sequence[cursor.CursorOrderingField],
+        values: collections.abc.Sequence[typing.Any],
+        reverse: bool = False,
+    ) -> repositories.WhereFilterT:
+        """Prepare filter which selects rows located after cursor."""
+        raise NotImplementedError  # pragma: no cover
+
+    @metrics.tracker
+    async def paginate_data_by_cursor(
+        self,
+        user: permissions.UserT,
+        repository: repositories.ApiRepositoryProtocolT,
+        context: types.Context,
+        cursor_value: str | None,
+        limit: int,
+        order_by: collections.abc.Sequence[
+            repositories.OrderingClauseT | enum.StrEnum
+        ],
+        annotations: collections.abc.Sequence[repositories.AnnotationT],
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+        where: collections.abc.Sequence[repositories.WhereFilterT]
+        | None = None,
+        fields: collections.abc.Collection[str] | None = None,
+        **filters_by,
+    ) -> tuple[
+        collections.abc.Sequence[repositories.APIModelT],
+        str | None,
+        str | None,
+    ]:
+        """Load page of data from database using cursor(keyset) pagination.
+
+        Instead of skipping `offset` rows, we seek to the position encoded in
+        cursor, so the cost of loading page doesn't depend on how deep it
+        is. One extra row is loaded to find out if there is next page.
+
+        Returns objects, next cursor and previous cursor.
+
+        """
+        ordering = self.get_cursor_ordering(order_by)
+        position = (
+            cursor.decode_cursor(cursor_value, ordering=ordering)
+            if cursor_value
+            else None
+        )
+        reverse = bool(position and position.reverse)
+        seek_where = list(where or [])
+        if position:
+            seek_where.append(
+                self.get_cursor_filter(
+                    ordering=ordering,
+                    values=position.values,
+                    reverse=reverse,
+                ),
+            )
+        objects = list(
+            await self.fetch_page(
+                user=user,
+                repository=repository,
+                offset=0,
+                limit=limit + 1,
+                order_by=[
+                    field.to_clause(reverse=reverse) for field in ordering
+                ],
+                where=seek_where,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+                annotations=annotations,
+                # Values of ordering fields are needed to encode cursor
+                fields=(
+                    {*fields, *(field.field for field in ordering)}
+                    if fields is not None
+                    else None
+                ),
+                **filters_by,
+            ),
+        )
+        has_more = len(objects) > limit
+        objects = objects[:limit]
+        if reverse:
+            objects.reverse()
+        if not objects:
+            return objects, None, None
+        next_cursor = cursor.encode_cursor(objects[-1], ordering=ordering)
+        previous_cursor = cursor.encode_cursor(
+            objects[0],
+            ordering=ordering,
+            reverse=True,
+        )
+        if reverse:
+            return (
+                objects,
+                next_cursor,
+                previous_cursor if has_more else None,
+            )
+        return (
+            objects,
+            next_cursor if has_more else None,
+            previous_cursor if position else None,
+        )
 
     @metrics.tracker
     async def check_permissions(
@@ -548,23 +1338,59 @@ class BaseAPIViewMixin(
         request_data: permissions.RequestData,
         instance: repositories.APIModelT | None = None,
     ) -> None:
-        """Check permissions."""
-        for permission in self.base_permissions:
-            await permission(
-                user=user,
-                action=self.action,
-                instance=instance,
-                context=context,
-                request_data=request_data,
-            )
-        for permission in permissions:
-            await permission(
-                user=user,
-                action=self.action,
-                instance=instance,
-                context=context,
-                request_data=request_data,
+        """Check base and endpoint permissions.
+
+        Permission, which is present in both, is checked once.
+
+        """
+        await permissions_core.check_permissions(
+            permissions=(*self.base_permissions, *permissions),
+            user=user,
+            action=self.action,
+            instance=instance,
+            context=context,
+            request_data=request_data,
+        )
+
+    @metrics.tracker
+    def has_instance_permissions(
+        self,
+        permissions: collections.abc.Sequence[
+            permissions.BasePermission[
+                repositories.APIModelT,
+                permissions.UserT,
+            ]
+        ],
+    ) -> bool:
+        """Check that base or endpoint permissions check instances."""
+        return any(
+            permission.checks_instance
+            for permission in (*self.base_permissions, *permissions)
+        )
+
+    @metrics.tracker
+    async def get_permissions_filters(
+        self,
+        user: permissions.UserT,
+        permissions: collections.abc.Sequence[
+            permissions.BasePermission[
+                repositories.APIModelT,
+                permissions.UserT,
+            ]
+        ],
+        context: common_types.ContextType,
+    ) -> list[repositories.WhereFilterT]:
+        """Get filters of base and endpoint permissions."""
+        where = []
+        for permission in (*self.base_permissions, *permissions):
+            where.extend(
+                await permission.get_queryset_filters(
+                    user=user,
+                    action=self.action,
+                    context=context,
+                ),
             )
+        return where
 
     @metrics.tracker
     async def validate_data(
@@ -579,13 +1405,17 @@ class BaseAPIViewMixin(
         ],
         repository: repositories.ApiRepositoryProtocolT,
         instance: repositories.APIModelT | None = None,
+        limits: validators.ValidationLimits | None = None,
     ) -> validators.ApiDataType:
         """Validate data."""
-        validated_data = await validator(
+        model_validator = validator(
             repository=repository,
             instance=instance,
-        )(
-            value=dict(model),
+        )
+        if limits is not None:
+            model_validator.limits = limits
+        validated_data = await model_validator.validate_schema(
+            schema=model,
             context=context,
         )
         return validated_data or {}
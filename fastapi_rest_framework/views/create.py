@@ -1,6 +1,9 @@
 import collections.abc
+import http
 import typing
 
+import fastapi
+
 from .. import (
     common_types,
     exceptions,
@@ -94,6 +97,12 @@ class CreateMixin(
             select_in_load=self.get_select_in_load_options(
                 action=self.action,
             ),
+            prerender=self.get_prerender_response(
+                action=self.action,
+            ),
+            validation_limits=self.get_validation_limits(
+                action=self.action,
+            ),
         )
 
     def prepare_create(
@@ -128,6 +137,8 @@ class CreateMixin(
                 permissions.UserT,
             ]
         ] = (),
+        prerender: bool = False,
+        validation_limits: validators.ValidationLimits | None = None,
     ) -> collections.abc.Callable[
         ...,
         collections.abc.Coroutine[
@@ -137,9 +148,11 @@ class CreateMixin(
         ],
     ]:
         """Prepare create endpoint."""
+        # Pure validators of validator are run on validation of request
+        request_schema = validator.get_request_schema(create_schema)
 
         async def create(
-            request: create_schema,
+            request: request_schema,
             user: user_dependency,
             repository: repository_dependency,
             context: context_dependency,
@@ -156,6 +169,7 @@ class CreateMixin(
                 model=request,
                 validator=validator,
                 repository=repository,
+                limits=validation_limits,
             )
             return await self.perform_create(
                 user=user,
@@ -170,6 +184,7 @@ class CreateMixin(
                 annotations=annotations,
                 joined_load=joined_load,
                 select_in_load=select_in_load,
+                prerender=prerender,
             )
 
         return create
@@ -193,8 +208,14 @@ class CreateMixin(
         select_in_load: collections.abc.Sequence[
             repositories.LazyLoadedT
         ] = (),
-    ) -> types.DetailSchema:
-        """Perform create operation."""
+        prerender: bool = False,
+    ) -> types.DetailSchema | fastapi.Response:
+        """Perform create operation.
+
+        If `prerender` is set, instance is serialized straight to json
+        response.
+
+        """
         instance = await interactor.save(
             data=validated_data,
             context=context,
@@ -208,4 +229,11 @@ class CreateMixin(
         )
         if not instance:  # pragma: no cover
             raise exceptions.NotFoundException()
+        if prerender:
+            return self.prepare_prerendered_response(
+                schema=schema,
+                data=instance,
+                context=context,
+                status_code=http.HTTPStatus.CREATED,
+            )
         return schema.model_validate(instance, context=context)
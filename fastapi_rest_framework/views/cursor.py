@@ -0,0 +1,99 @@
+import base64
+import binascii
+import collections.abc
+import dataclasses
+import enum
+import json
+import typing
+
+import pydantic_core
+
+from .. import validators
+
+
+@dataclasses.dataclass(frozen=True)
+class CursorOrderingField:
+    """Representation of field which is used to build cursor."""
+
+    field: str
+    descending: bool = False
+
+    @classmethod
+    def from_clause(cls, clause: str | enum.StrEnum) -> typing.Self:
+        """Prepare field from ordering clause (`field` or `-field`)."""
+        clause = str(clause)
+        if clause.startswith("-"):
+            return cls(field=clause[1:], descending=True)
+        return cls(field=clause)
+
+    def to_clause(self, reverse: bool = False) -> str:
+        """Transform field back into ordering clause."""
+        if self.descending != reverse:
+            return f"-{self.field}"
+        return self.field
+
+
+@dataclasses.dataclass(frozen=True)
+class Cursor:
+    """Representation of decoded cursor.
+
+    `values` are values of ordering fields of row, which cursor points to.
+    `reverse` means that cursor is used to load previous page.
+
+    """
+
+    values: tuple[typing.Any, ...]
+    reverse: bool = False
+
+
+def get_invalid_cursor_error() -> validators.ValidationError:
+    """Prepare error for invalid cursor."""
+    return validators.ValidationError(
+        all_errors=[
+            validators.ValidationError(
+                error_type=validators.ValidationErrorType.invalid,
+                error_message="Invalid cursor.",
+                loc=("query", "cursor"),
+            ),
+        ],
+    )
+
+
+def encode_cursor(
+    instance: typing.Any,
+    ordering: collections.abc.Sequence[CursorOrderingField],
+    reverse: bool = False,
+) -> str:
+    """Encode position of instance into opaque cursor."""
+    payload = {
+        "o": [field.to_clause() for field in ordering],
+        "v": pydantic_core.to_jsonable_python(
+            [getattr(instance, field.field) for field in ordering],
+        ),
+        "r": reverse,
+    }
+    return base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(",", ":")).encode(),
+    ).decode()
+
+
+def decode_cursor(
+    cursor: str,
+    ordering: collections.abc.Sequence[CursorOrderingField],
+) -> Cursor:
+    """Decode cursor and check that it matches ordering."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError) as error:
+        raise get_invalid_cursor_error() from error
+    if (
+        not isinstance(payload, dict)
+        or payload.get("o") != [field.to_clause() for field in ordering]
+        or not isinstance(payload.get("v"), list)
+        or len(payload["v"]) != len(ordering)
+    ):
+        raise get_invalid_cursor_error()
+    return Cursor(
+        values=tuple(payload["v"]),
+        reverse=bool(payload.get("r")),
+    )
@@ -1,8 +1,17 @@
 import collections.abc
 import typing
 
-from .. import exceptions, metrics, permissions, repositories
-from . import core, types
+import fastapi
+
+from .. import (
+    cache,
+    common_types,
+    exceptions,
+    metrics,
+    permissions,
+    repositories,
+)
+from . import core, schemas, types
 
 
 class DetailMixin(
@@ -61,6 +70,15 @@ class DetailMixin(
             permissions=self.get_permissions(
                 action=self.action,
             ),
+            prerender=self.get_prerender_response(
+                action=self.action,
+            ),
+            cache_config=self.get_cache_config(
+                action=self.action,
+            ),
+            cache_control=self.get_cache_control(
+                action=self.action,
+            ),
         )
 
     def prepare_detail(
@@ -81,6 +99,9 @@ class DetailMixin(
                 permissions.UserT,
             ]
         ] = (),
+        prerender: bool = False,
+        cache_config: cache.CacheConfig | None = None,
+        cache_control: str | None = None,
     ) -> collections.abc.Callable[
         ...,
         collections.abc.Coroutine[
@@ -89,40 +110,142 @@ class DetailMixin(
             types.DetailSchema,
         ],
     ]:
-        """Prepare detail endpoint."""
+        """Prepare detail endpoint.
+
+        Permissions are checked before cached response is used or
+        `If-None-Match` header is matched. If permissions check instance,
+        responses are not cached and header is matched after load of
+        instance, since permissions could be checked only against it.
+
+        """
+        fields_dependency = self.get_fields_dependency(detail_schema)
+        has_instance_permissions = self.has_instance_permissions(permissions)
+        if has_instance_permissions:
+            cache_config = None
 
         async def detail(
+            request: fastapi.Request,
+            response: fastapi.Response,
             pk: pk_query,
             user: user_dependency,
             repository: repository_dependency,
             context: context_dependency,
+            fields: fields_dependency = None,  # type: ignore
         ) -> detail_schema:
-            instance = await self.get_object(
+            if not has_instance_permissions:
+                await self.check_permissions(
+                    user=user,
+                    permissions=permissions,
+                    context=dict(context),
+                    request_data=None,
+                )
+            etag = await self.get_detail_etag(
                 user=user,
-                pk=pk,
                 repository=repository,
-                joined_load=joined_load,
-                select_in_load=select_in_load,
-                annotations=annotations,
+                context=dict(context),
+                pk=pk,
+                fields=fields,
             )
-            await self.check_permissions(
+            if (
+                etag
+                and not has_instance_permissions
+                and self.is_not_modified(request=request, etag=etag)
+            ):
+                return self.prepare_not_modified_response(  # type: ignore
+                    etag=etag,
+                    cache_control=cache_control,
+                )
+
+            async def fetch() -> typing.Any:
+                instance = await self.get_object(
+                    user=user,
+                    pk=pk,
+                    repository=repository,
+                    joined_load=joined_load,
+                    select_in_load=select_in_load,
+                    annotations=annotations,
+                    fields=fields,
+                )
+                if has_instance_permissions:
+                    await self.check_permissions(
+                        user=user,
+                        permissions=permissions,
+                        instance=instance,
+                        context=dict(context),
+                        request_data=None,
+                    )
+                if not instance:
+                    raise exceptions.NotFoundException()
+                result = await self.perform_detail(
+                    user=user,
+                    detail_schema=detail_schema,
+                    instance=instance,
+                    context=context,
+                    fields=fields,
+                    prerender=prerender and fields is None,
+                )
+                if fields is None:
+                    return result
+                return self.prepare_sparse_response(  # type: ignore
+                    data=result,
+                    include=set(fields),
+                )
+
+            result = await self.get_cached_response(
+                cache_config=cache_config,
                 user=user,
-                permissions=permissions,
-                instance=instance,
                 context=dict(context),
-                request_data=None,
+                fetch=fetch,
+                pk=pk,
+                fields=fields,
             )
-            if not instance:
-                raise exceptions.NotFoundException()
-            return await self.perform_detail(
-                user=user,
-                detail_schema=detail_schema,
-                instance=instance,
-                context=context,
+            if (
+                etag
+                and has_instance_permissions
+                and self.is_not_modified(request=request, etag=etag)
+            ):
+                return self.prepare_not_modified_response(  # type: ignore
+                    etag=etag,
+                    cache_control=cache_control,
+                )
+            self.set_conditional_headers(
+                response=(
+                    result
+                    if isinstance(result, fastapi.Response)
+                    else response
+                ),
+                etag=etag,
+                cache_control=cache_control,
             )
+            return result  # type: ignore
 
         return detail
 
+    @metrics.tracker
+    async def get_detail_etag(
+        self,
+        user: permissions.UserT,
+        repository: repositories.ApiRepositoryProtocolT,
+        context: common_types.ContextType,
+        pk: int | str,
+        fields: collections.abc.Collection[str] | None = None,
+    ) -> str | None:
+        """Prepare ETag of instance.
+
+        It's None, if `etag_field` is not set or instance is not found.
+
+        """
+        if not self.etag_field:
+            return None
+        return await self.get_etag(
+            user=user,
+            repository=repository,
+            context=context,
+            params={"fields": fields},
+            skip_empty=True,
+            pk=pk,
+        )
+
     @metrics.tracker
     async def perform_detail(
         self,
@@ -130,6 +253,37 @@ class DetailMixin(
         detail_schema: type[types.DetailSchema],
         instance: repositories.APIModelT,
         context: types.Context,
-    ) -> types.DetailSchema:
-        """Prepare instance to be returned in api."""
-        return detail_schema.model_validate(instance, context=dict(context))
+        fields: collections.abc.Collection[str] | None = None,
+        prerender: bool = False,
+    ) -> types.DetailSchema | fastapi.Response:
+        """Prepare instance to be returned in api.
+
+        If `fields` are set, only they are loaded from instance. If
+        `prerender` is set, instance is serialized straight to json response.
+
+        """
+        if prerender:
+            return self.prepare_prerendered_response(
+                schema=detail_schema,
+                data=instance,
+                context=dict(context),
+            )
+        if fields is None:
+            return detail_schema.model_validate(
+                instance,
+                context=dict(context),
+            )
+        return schemas.get_sparse_schema(
+            detail_schema,
+            frozenset(fields),
+        ).model_validate(
+            {
+                attribute: getattr(instance, attribute)
+                for attribute in schemas.get_sparse_attributes(
+                    detail_schema,
+                    frozenset(fields),
+                )
+            },
+            from_attributes=True,
+            context=dict(context),
+        )
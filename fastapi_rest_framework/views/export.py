@@ -0,0 +1,409 @@
+import collections.abc
+import contextlib
+import csv
+import enum
+import io
+import json
+import typing
+
+import fastapi
+import fastapi.responses
+
+from .. import metrics, permissions, repositories
+from . import core, filters, types
+
+
+class ExportFormat(enum.StrEnum):
+    """Representation of formats of export endpoint."""
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+class ExportMixin(
+    core.BaseAPIViewMixin[
+        repositories.LazyLoadedT,
+        repositories.SelectStatementT,
+        repositories.AnnotationT,
+        repositories.WhereFilterT,
+        repositories.OrderingClauseT,
+        permissions.UserT,
+        repositories.ApiRepositoryProtocolT,
+        repositories.APIModelT,
+    ],
+    typing.Generic[
+        types.ListSchema,
+        filters.FiltersT,
+        repositories.LazyLoadedT,
+        repositories.SelectStatementT,
+        repositories.AnnotationT,
+        repositories.WhereFilterT,
+        repositories.OrderingClauseT,
+        permissions.UserT,
+        repositories.ApiRepositoryProtocolT,
+        repositories.APIModelT,
+    ],
+):
+    """Add export endpoint to api.
+
+    Export endpoint streams all instances matching filters in NDJSON or CSV
+    format. Instances are loaded from database in chunks, so memory usage
+    depends on `export_chunk_size` instead of size of result set.
+
+    Repository is opened via `export_repository_dependency` while response
+    is streamed and closed after it is sent, so export doesn't depend on when
+    fastapi closes dependencies with yield (before response is sent in
+    versions prior to 0.118).
+
+    """
+
+    filter: type[filters.FiltersT]
+    list_schema: type[types.ListSchema]
+    ordering_fields: collections.abc.Sequence[str]
+    export_chunk_size: int = 1000
+
+    @property
+    def filters_dependency(
+        self,
+    ) -> type[filters.FiltersT]:
+        """Prepare filters dependency.
+
+        It's generated once per view class, since it's a part of keys of
+        other generated types.
+
+        """
+        return self.get_generated_type(
+            key=("filters_dependency", self.filter),
+            factory=lambda: typing.Annotated[  # type: ignore
+                self.filter,
+                fastapi.Depends(),
+            ],
+        )
+
+    @property
+    def export_repository_dependency(
+        self,
+    ) -> type[
+        collections.abc.Callable[
+            [],
+            contextlib.AbstractAsyncContextManager[
+                repositories.ApiRepositoryProtocolT
+            ],
+        ]
+    ]:
+        """Prepare dependency, which opens repository for export."""
+        raise NotImplementedError  # pragma: no cover
+
+    def export(
+        self,
+    ) -> collections.abc.Callable[
+        ...,
+        collections.abc.Coroutine[
+            typing.Any,
+            typing.Any,
+            fastapi.responses.StreamingResponse,
+        ],
+    ]:
+        """Prepare export endpoint."""
+        return self.prepare_export(
+            user_dependency=self.user_dependency,
+            open_repository_dependency=self.export_repository_dependency,
+            context_dependency=self.context_dependency,
+            filters_dependency=self.filters_dependency,
+            ordering_enum=self.get_ordering_enum(self.ordering_fields),
+            export_schema=self.list_schema,
+            annotations=self.get_annotations(
+                action=self.action,
+            ),
+            joined_load=self.get_joined_load_options(
+                action=self.action,
+            ),
+            select_in_load=self.get_select_in_load_options(
+                action=self.action,
+            ),
+            permissions=self.get_permissions(
+                action=self.action,
+            ),
+        )
+
+    def prepare_export(
+        self,
+        export_schema: type[types.ListSchema],
+        user_dependency: type[permissions.UserT],
+        open_repository_dependency: type[
+            collections.abc.Callable[
+                [],
+                contextlib.AbstractAsyncContextManager[
+                    repositories.ApiRepositoryProtocolT
+                ],
+            ]
+        ],
+        context_dependency: type[types.Context],
+        filters_dependency: type[filters.FiltersT],
+        ordering_enum: type[enum.StrEnum],
+        annotations: collections.abc.Sequence[repositories.AnnotationT] = (),
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+        permissions: collections.abc.Sequence[
+            permissions.BasePermission[
+                repositories.APIModelT,
+                permissions.UserT,
+            ]
+        ] = (),
+    ) -> collections.abc.Callable[
+        ...,
+        collections.abc.Coroutine[
+            typing.Any,
+            typing.Any,
+            fastapi.responses.StreamingResponse,
+        ],
+    ]:
+        """Prepare export endpoint."""
+
+        async def export(
+            user: user_dependency,
+            open_repository: open_repository_dependency,
+            filters: filters_dependency,
+            context: context_dependency,
+            order_by: typing.Annotated[
+                list[ordering_enum],  # type: ignore
+                fastapi.Query(default_factory=list),
+            ],
+            export_format: typing.Annotated[
+                ExportFormat,
+                fastapi.Query(alias="format"),
+            ] = ExportFormat.ndjson,
+        ) -> fastapi.responses.StreamingResponse:
+            await self.check_permissions(
+                user=user,
+                permissions=permissions,
+                context=dict(context),
+                request_data=None,
+            )
+            return await self.perform_export(
+                user=user,
+                export_schema=export_schema,
+                open_repository=open_repository,
+                context=context,
+                export_format=export_format,
+                order_by=order_by,
+                where=[
+                    *await filters.to_filters(
+                        user=user,
+                        context=dict(context),
+                    ),
+                    *await self.get_permissions_filters(
+                        user=user,
+                        permissions=permissions,
+                        context=dict(context),
+                    ),
+                ],
+                annotations=annotations,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+            )
+
+        return export
+
+    @metrics.tracker
+    async def perform_export(
+        self,
+        user: permissions.UserT,
+        export_schema: type[types.ListSchema],
+        open_repository: collections.abc.Callable[
+            [],
+            contextlib.AbstractAsyncContextManager[
+                repositories.ApiRepositoryProtocolT
+            ],
+        ],
+        context: types.Context,
+        export_format: ExportFormat,
+        order_by: collections.abc.Sequence[
+            repositories.OrderingClauseT | enum.StrEnum
+        ],
+        where: collections.abc.Sequence[repositories.WhereFilterT],
+        annotations: collections.abc.Sequence[repositories.AnnotationT] = (),
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+    ) -> fastapi.responses.StreamingResponse:
+        """Prepare streaming response with exported instances."""
+        chunks = self.stream_data(
+            user=user,
+            open_repository=open_repository,
+            order_by=order_by,
+            where=where,
+            annotations=annotations,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            chunk_size=self.export_chunk_size,
+        )
+        match export_format:
+            case ExportFormat.csv:
+                content = self.serialize_csv(
+                    chunks=chunks,
+                    export_schema=export_schema,
+                    context=context,
+                )
+            case _:
+                content = self.serialize_ndjson(
+                    chunks=chunks,
+                    export_schema=export_schema,
+                    context=context,
+                )
+        return fastapi.responses.StreamingResponse(
+            content=content,
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={
+                "Content-Disposition": (
+                    "attachment; "
+                    f'filename="{self.get_basename()}.{export_format}"'
+                ),
+            },
+        )
+
+    async def stream_data(
+        self,
+        user: permissions.UserT,
+        open_repository: collections.abc.Callable[
+            [],
+            contextlib.AbstractAsyncContextManager[
+                repositories.ApiRepositoryProtocolT
+            ],
+        ],
+        order_by: collections.abc.Sequence[
+            repositories.OrderingClauseT | enum.StrEnum
+        ],
+        where: collections.abc.Sequence[repositories.WhereFilterT],
+        chunk_size: int,
+        annotations: collections.abc.Sequence[repositories.AnnotationT] = (),
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+    ) -> collections.abc.AsyncIterator[
+        collections.abc.Sequence[repositories.APIModelT]
+    ]:
+        """Load data from database in chunks.
+
+        Repository is opened only for time of loading.
+
+        """
+        async with open_repository() as repository:
+            statement = await self.prepare_fetch_statement(
+                user=user,
+                repository=repository,
+                order_by=order_by,
+                where=where,
+                annotations=annotations,
+                joined_load=joined_load,
+                select_in_load=select_in_load,
+            )
+            async for chunk in repository.stream_all(
+                statement=statement,
+                chunk_size=chunk_size,
+            ):
+                yield chunk
+
+    async def serialize_ndjson(
+        self,
+        chunks: collections.abc.AsyncIterator[
+            collections.abc.Sequence[repositories.APIModelT]
+        ],
+        export_schema: type[types.ListSchema],
+        context: types.Context,
+    ) -> collections.abc.AsyncIterator[str]:
+        """Serialize chunks of instances to NDJSON."""
+        async for chunk in chunks:
+            yield "".join(
+                export_schema.model_validate(
+                    instance,
+                    context=dict(context),
+                ).model_dump_json(by_alias=True)
+                + "\n"
+                for instance in chunk
+            )
+
+    async def serialize_csv(
+        self,
+        chunks: collections.abc.AsyncIterator[
+            collections.abc.Sequence[repositories.APIModelT]
+        ],
+        export_schema: type[types.ListSchema],
+        context: types.Context,
+    ) -> collections.abc.AsyncIterator[str]:
+        """Serialize chunks of instances to CSV.
+
+        Nested values (lists and objects) are written as JSON.
+
+        """
+        columns = self.get_csv_columns(export_schema)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        async for chunk in chunks:
+            for instance in chunk:
+                data = export_schema.model_validate(
+                    instance,
+                    context=dict(context),
+                ).model_dump(mode="json", by_alias=True)
+                writer.writerow(
+                    (
+                        json.dumps(value)
+                        if isinstance(value, dict | list)
+                        else value
+                    )
+                    for value in map(data.__getitem__, columns)
+                )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        # Header of empty export
+        if remaining := buffer.getvalue():
+            yield remaining
+
+    @metrics.tracker
+    def get_csv_columns(
+        self,
+        export_schema: type[types.ListSchema],
+    ) -> tuple[str, ...]:
+        """Get columns of CSV export.
+
+        They are keys of dumped schema: serialization aliases of fields, which
+        are not excluded, and of computed fields.
+
+        """
+        return (
+            *(
+                field.serialization_alias or name
+                for name, field in export_schema.model_fields.items()
+                if not field.exclude
+            ),
+            *(
+                field.alias or name
+                for name, field in export_schema.model_computed_fields.items()
+            ),
+        )
+
+    @metrics.tracker
+    def get_ordering_enum(
+        self,
+        ordering_fields: collections.abc.Sequence[str],
+    ) -> type[enum.StrEnum]:
+        """Prepare ordering enum."""
+        return self.get_generated_type(  # pragma: no cover
+            key=("ordering_enum", tuple(ordering_fields)),
+            factory=lambda: enum.StrEnum(  # type: ignore
+                "OrderingEnum",
+                ordering_fields,
+            ),
+        )
@@ -6,8 +6,8 @@ import typing
 import fastapi
 import pydantic
 
-from .. import metrics, permissions, repositories
-from . import core, filters, schemas, types
+from .. import cache, common_types, metrics, permissions, repositories
+from . import constants, core, filters, schemas, types
 
 
 class PaginationParams(
@@ -27,6 +27,32 @@ class PaginationParams(
     limit: int
 
 
+class CursorPaginationParams(
+    pydantic.BaseModel,
+    typing.Generic[filters.FiltersT],
+):
+    """Define base cursor pagination params."""
+
+    filters: filters.FiltersT
+    order_by: list[enum.StrEnum]
+    cursor: str | None = pydantic.Field(
+        fastapi.Query(
+            default=None,
+        ),
+    )
+    limit: int
+
+
+class PaginationMode(enum.StrEnum):
+    """Representation of pagination modes for list endpoints."""
+
+    # Use limit and offset, total count of entries is returned
+    offset = "offset"
+    # Use opaque cursor, which points to the last row of the page, works well
+    # on large tables since page is loaded via seek instead of offset scan
+    cursor = "cursor"
+
+
 class ListMixin(
     core.BaseAPIViewMixin[
         repositories.LazyLoadedT,
@@ -58,16 +84,36 @@ class ListMixin(
     list_limit_default: int = 25
     list_limit_max: int = 100
     ordering_fields: collections.abc.Sequence[str]
+    # How list endpoint and paginated actions are paginated. Note that in
+    # cursor mode fields from `ordering_fields` should not be nullable.
+    pagination_mode: PaginationMode = PaginationMode.offset
+    # How total count is calculated for list endpoint and paginated actions
+    # in offset mode. For example: {"list": CountStrategy.capped}
+    count_strategy_map: typing.ClassVar[
+        typing.Mapping[str, constants.CountStrategy]
+    ] = {
+        "default": constants.CountStrategy.exact,
+    }
+    # Max count which is calculated by `capped` count strategy
+    count_cap: int = 1000
 
     @property
     def filters_dependency(
         self,
     ) -> type[filters.FiltersT]:
-        """Prepare filters dependency."""
-        return typing.Annotated[  # type: ignore
-            self.filter,
-            fastapi.Depends(),
-        ]
+        """Prepare filters dependency.
+
+        It's generated once per view class, since it's a part of keys of
+        other generated types.
+
+        """
+        return self.get_generated_type(
+            key=("filters_dependency", self.filter),
+            factory=lambda: typing.Annotated[  # type: ignore
+                self.filter,
+                fastapi.Depends(),
+            ],
+        )
 
     def list(
         self,
@@ -76,7 +122,8 @@ class ListMixin(
         collections.abc.Coroutine[
             typing.Any,
             typing.Any,
-            schemas.PaginatedResult[types.ListSchema],
+            schemas.PaginatedResult[types.ListSchema]
+            | schemas.CursorPaginatedResult[types.ListSchema],
         ],
     ]:
         """Prepare list endpoint."""
@@ -101,6 +148,15 @@ class ListMixin(
             permissions=self.get_permissions(
                 action=self.action,
             ),
+            prerender=self.get_prerender_response(
+                action=self.action,
+            ),
+            cache_config=self.get_cache_config(
+                action=self.action,
+            ),
+            cache_control=self.get_cache_control(
+                action=self.action,
+            ),
         )
 
     def prepare_list(
@@ -109,7 +165,10 @@ class ListMixin(
         user_dependency: type[permissions.UserT],
         repository_dependency: type[repositories.ApiRepositoryProtocolT],
         context_dependency: type[types.Context],
-        pagination_dependency: type[PaginationParams[filters.FiltersT]],
+        pagination_dependency: type[
+            PaginationParams[filters.FiltersT]
+            | CursorPaginationParams[filters.FiltersT]
+        ],
         annotations: collections.abc.Sequence[repositories.AnnotationT] = (),
         joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
         select_in_load: collections.abc.Sequence[
@@ -121,80 +180,359 @@ class ListMixin(
                 permissions.UserT,
             ]
         ] = (),
+        prerender: bool = False,
+        cache_config: cache.CacheConfig | None = None,
+        cache_control: str | None = None,
     ) -> collections.abc.Callable[
         ...,
         collections.abc.Coroutine[
             typing.Any,
             typing.Any,
-            schemas.PaginatedResult[types.ListSchema],
+            schemas.PaginatedResult[types.ListSchema]
+            | schemas.CursorPaginatedResult[types.ListSchema],
         ],
     ]:
         """Prepare list endpoint."""
+        result_schema = self.get_paginated_result_schema(list_schema)
+        fields_dependency = self.get_fields_dependency(list_schema)
 
         async def _list(
+            request: fastapi.Request,
+            response: fastapi.Response,
             user: user_dependency,
             repository: repository_dependency,
             pagination_params: pagination_dependency,
             context: context_dependency,
-        ) -> schemas.PaginatedResult[list_schema]:
+            fields: fields_dependency = None,  # type: ignore
+        ) -> result_schema:  # type: ignore
             await self.check_permissions(
                 user=user,
                 permissions=permissions,
                 context=dict(context),
                 request_data=None,
             )
-            return await self.perform_list(
+            etag = None
+            if self.etag_field:
+                etag = await self.get_etag(
+                    user=user,
+                    repository=repository,
+                    context=dict(context),
+                    params={
+                        "pagination_params": pagination_params,
+                        "fields": fields,
+                    },
+                    where=await self.get_list_filters(
+                        user=user,
+                        pagination_params=pagination_params,
+                        permissions=permissions,
+                        context=dict(context),
+                    ),
+                )
+                if self.is_not_modified(request=request, etag=etag):
+                    return self.prepare_not_modified_response(
+                        etag=etag,
+                        cache_control=cache_control,
+                    )
+
+            async def fetch() -> typing.Any:
+                result = await self.perform_list(
+                    user=user,
+                    list_schema=list_schema,
+                    repository=repository,
+                    context=context,
+                    joined_load=joined_load,
+                    select_in_load=select_in_load,
+                    annotations=annotations,
+                    pagination_params=pagination_params,
+                    permissions=permissions,
+                    fields=fields,
+                    prerender=prerender and fields is None,
+                )
+                if fields is None:
+                    return result
+                return self.prepare_sparse_response(
+                    data=result,  # type: ignore
+                    include={
+                        **{
+                            field: True
+                            for field in result.model_fields
+                            if field != "results"
+                        },
+                        "results": {"__all__": set(fields)},
+                    },
+                )
+
+            result = await self.get_cached_response(
+                cache_config=cache_config,
+                user=user,
+                context=dict(context),
+                fetch=fetch,
+                pagination_params=pagination_params,
+                fields=fields,
+            )
+            self.set_conditional_headers(
+                response=(
+                    result
+                    if isinstance(result, fastapi.Response)
+                    else response
+                ),
+                etag=etag,
+                cache_control=cache_control,
+            )
+            return result
+
+        return _list
+
+    @metrics.tracker
+    def get_count_strategy(
+        self,
+        action: str = "default",
+    ) -> constants.CountStrategy:
+        """Get count strategy for endpoint."""
+        if action not in self.count_strategy_map:
+            return self.count_strategy_map.get(
+                "default",
+                constants.CountStrategy.exact,
+            )
+        return self.count_strategy_map[action]
+
+    @metrics.tracker
+    def get_paginated_result_schema(
+        self,
+        list_schema: type[types.ListSchema],
+    ) -> type[
+        schemas.PaginatedResult[types.ListSchema]
+        | schemas.CursorPaginatedResult[types.ListSchema]
+    ]:
+        """Get schema of list endpoint response."""
+        if self.pagination_mode == PaginationMode.cursor:
+            return schemas.CursorPaginatedResult[list_schema]  # type: ignore
+        return schemas.PaginatedResult[list_schema]  # type: ignore
+
+    @metrics.tracker
+    async def perform_list(
+        self,
+        user: permissions.UserT,
+        list_schema: type[types.ListSchema],
+        repository: repositories.ApiRepositoryProtocolT,
+        context: types.Context,
+        pagination_params: PaginationParams[filters.FiltersT]
+        | CursorPaginationParams[filters.FiltersT],
+        annotations: collections.abc.Sequence[repositories.AnnotationT] = (),
+        joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
+        select_in_load: collections.abc.Sequence[
+            repositories.LazyLoadedT
+        ] = (),
+        permissions: collections.abc.Sequence[
+            permissions.BasePermission[
+                repositories.APIModelT,
+                permissions.UserT,
+            ]
+        ] = (),
+        fields: collections.abc.Collection[str] | None = None,
+        prerender: bool = False,
+    ) -> (
+        schemas.PaginatedResult[types.ListSchema]
+        | schemas.CursorPaginatedResult[types.ListSchema]
+        | fastapi.Response
+    ):
+        """Prepare  list of instances to be returned in api.
+
+        If `fields` are set, only they are loaded from instances. If
+        `prerender` is set, instances are serialized straight to json
+        response.
+
+        """
+        if isinstance(pagination_params, CursorPaginationParams):
+            return await self.perform_cursor_list(
                 user=user,
                 list_schema=list_schema,
                 repository=repository,
                 context=context,
+                pagination_params=pagination_params,
+                annotations=annotations,
                 joined_load=joined_load,
                 select_in_load=select_in_load,
-                annotations=annotations,
+                permissions=permissions,
+                fields=fields,
+                prerender=prerender,
+            )
+        results, page_info = await self.paginate_page(
+            user=user,
+            repository=repository,
+            context=context,
+            offset=pagination_params.offset,
+            limit=pagination_params.limit,
+            order_by=pagination_params.order_by,
+            annotations=annotations,
+            joined_load=joined_load,
+            select_in_load=select_in_load,
+            where=await self.get_list_filters(
+                user=user,
                 pagination_params=pagination_params,
+                permissions=permissions,
+                context=dict(context),
+            ),
+            count_strategy=self.get_count_strategy(self.action),
+            count_cap=self.count_cap,
+            fields=fields,
+        )
+        if prerender:
+            return self.prepare_prerendered_response(
+                schema=self.get_paginated_result_schema(list_schema),
+                data={
+                    "count": page_info.count,
+                    "count_is_lower_bound": page_info.count_is_lower_bound,
+                    "count_is_estimated": page_info.count_is_estimated,
+                    "has_next": page_info.has_next,
+                    "results": results,
+                },
+                context=dict(context),
             )
-
-        return _list
+        return schemas.PaginatedResult[types.ListSchema](
+            count=page_info.count,
+            count_is_lower_bound=page_info.count_is_lower_bound,
+            count_is_estimated=page_info.count_is_estimated,
+            has_next=page_info.has_next,
+            results=self.validate_list_results(
+                list_schema=list_schema,
+                results=results,
+                context=context,
+                fields=fields,
+            ),
+        )
 
     @metrics.tracker
-    async def perform_list(
+    async def perform_cursor_list(
         self,
         user: permissions.UserT,
         list_schema: type[types.ListSchema],
         repository: repositories.ApiRepositoryProtocolT,
         context: types.Context,
-        pagination_params: PaginationParams[filters.FiltersT],
+        pagination_params: CursorPaginationParams[filters.FiltersT],
         annotations: collections.abc.Sequence[repositories.AnnotationT] = (),
         joined_load: collections.abc.Sequence[repositories.LazyLoadedT] = (),
         select_in_load: collections.abc.Sequence[
             repositories.LazyLoadedT
         ] = (),
-    ) -> schemas.PaginatedResult[types.ListSchema]:
-        """Prepare  list of instances to be returned in api."""
-        results, count = await self.paginate_data(
+        permissions: collections.abc.Sequence[
+            permissions.BasePermission[
+                repositories.APIModelT,
+                permissions.UserT,
+            ]
+        ] = (),
+        fields: collections.abc.Collection[str] | None = None,
+        prerender: bool = False,
+    ) -> schemas.CursorPaginatedResult[types.ListSchema] | fastapi.Response:
+        """Prepare cursor paginated list of instances to be returned in api."""
+        (
+            results,
+            next_cursor,
+            previous_cursor,
+        ) = await self.paginate_data_by_cursor(
             user=user,
             repository=repository,
             context=context,
-            offset=pagination_params.offset,
+            cursor_value=pagination_params.cursor,
             limit=pagination_params.limit,
             order_by=pagination_params.order_by,
             annotations=annotations,
             joined_load=joined_load,
             select_in_load=select_in_load,
-            where=await pagination_params.filters.to_filters(
+            where=await self.get_list_filters(
                 user=user,
+                pagination_params=pagination_params,
+                permissions=permissions,
                 context=dict(context),
             ),
+            fields=fields,
         )
+        if prerender:
+            return self.prepare_prerendered_response(
+                schema=self.get_paginated_result_schema(list_schema),
+                data={
+                    "next": next_cursor,
+                    "previous": previous_cursor,
+                    "results": results,
+                },
+                context=dict(context),
+            )
+        return schemas.CursorPaginatedResult[types.ListSchema](
+            next=next_cursor,
+            previous=previous_cursor,
+            results=self.validate_list_results(
+                list_schema=list_schema,
+                results=results,
+                context=context,
+                fields=fields,
+            ),
+        )
+
+    @metrics.tracker
+    async def get_list_filters(
+        self,
+        user: permissions.UserT,
+        pagination_params: PaginationParams[filters.FiltersT]
+        | CursorPaginationParams[filters.FiltersT],
+        permissions: collections.abc.Sequence[
+            permissions.BasePermission[
+                repositories.APIModelT,
+                permissions.UserT,
+            ]
+        ],
+        context: common_types.ContextType,
+    ) -> collections.abc.Sequence[repositories.WhereFilterT]:
+        """Get filters of query params and permissions for list."""
+        return [
+            *await pagination_params.filters.to_filters(
+                user=user,
+                context=context,
+            ),
+            *await self.get_permissions_filters(
+                user=user,
+                permissions=permissions,
+                context=context,
+            ),
+        ]
+
+    @metrics.tracker
+    def validate_list_results(
+        self,
+        list_schema: type[types.ListSchema],
+        results: collections.abc.Sequence[repositories.APIModelT],
+        context: types.Context,
+        fields: collections.abc.Collection[str] | None = None,
+    ) -> collections.abc.Sequence[types.ListSchema]:
+        """Validate instances against list schema.
+
+        If `fields` are set, only they are loaded from instances.
 
-        model_validate = functools.partial(
-            list_schema.model_validate,
-            context=dict(context),
+        """
+        if fields is None:
+            model_validate = functools.partial(
+                list_schema.model_validate,
+                context=dict(context),
+            )
+            return list(map(model_validate, results))
+        sparse_schema = schemas.get_sparse_schema(
+            list_schema,
+            frozenset(fields),
         )
-        return schemas.PaginatedResult[types.ListSchema](
-            count=count,
-            results=list(map(model_validate, results)),
+        attributes = schemas.get_sparse_attributes(
+            list_schema,
+            frozenset(fields),
         )
+        return [
+            sparse_schema.model_validate(
+                {
+                    attribute: getattr(instance, attribute)
+                    for attribute in attributes
+                },
+                from_attributes=True,
+                context=dict(context),
+            )
+            for instance in results
+        ]
 
     @metrics.tracker
     def get_ordering_enum(
@@ -202,9 +540,12 @@ class ListMixin(
         ordering_fields: collections.abc.Sequence[str],
     ) -> type[enum.StrEnum]:
         """Prepare ordering enum."""
-        return enum.StrEnum(  # type: ignore # pragma: no cover
-            "OrderingEnum",
-            ordering_fields,
+        return self.get_generated_type(  # pragma: no cover
+            key=("ordering_enum", tuple(ordering_fields)),
+            factory=lambda: enum.StrEnum(  # type: ignore
+                "OrderingEnum",
+                ordering_fields,
+            ),
         )
 
     @metrics.tracker
@@ -212,8 +553,46 @@ class ListMixin(
         self,
         ordering_enum: type[enum.StrEnum],
         filters_dependency: type[filters.FiltersT],
-    ) -> type[PaginationParams[filters.FiltersT]]:
-        """Prepare pagination parameters."""
+    ) -> type[
+        PaginationParams[filters.FiltersT]
+        | CursorPaginationParams[filters.FiltersT]
+    ]:
+        """Prepare pagination parameters.
+
+        Generated params are reused by list endpoint and paginated actions of
+        view.
+
+        """
+        return self.get_generated_type(
+            key=(
+                "pagination_params",
+                self.pagination_mode,
+                ordering_enum,
+                filters_dependency,
+                self.list_limit_default,
+                self.list_limit_max,
+            ),
+            factory=lambda: self.generate_pagination_params(
+                ordering_enum=ordering_enum,
+                filters_dependency=filters_dependency,
+            ),
+        )
+
+    @metrics.tracker
+    def generate_pagination_params(
+        self,
+        ordering_enum: type[enum.StrEnum],
+        filters_dependency: type[filters.FiltersT],
+    ) -> type[
+        PaginationParams[filters.FiltersT]
+        | CursorPaginationParams[filters.FiltersT]
+    ]:
+        """Generate pagination parameters."""
+        if self.pagination_mode == PaginationMode.cursor:
+            return self.prepare_cursor_pagination_params(
+                ordering_enum=ordering_enum,
+                filters_dependency=filters_dependency,
+            )
 
         class GeneratedPaginationParams(
             PaginationParams[filters.FiltersT],  # type: ignore
@@ -234,12 +613,42 @@ class ListMixin(
 
         return GeneratedPaginationParams
 
+    @metrics.tracker
+    def prepare_cursor_pagination_params(
+        self,
+        ordering_enum: type[enum.StrEnum],
+        filters_dependency: type[filters.FiltersT],
+    ) -> type[CursorPaginationParams[filters.FiltersT]]:
+        """Prepare cursor pagination parameters."""
+
+        class GeneratedCursorPaginationParams(
+            CursorPaginationParams[filters.FiltersT],  # type: ignore
+        ):
+            """Generated cursor params for list endpoint."""
+
+            filters: filters_dependency
+            order_by: list[ordering_enum] = pydantic.Field(
+                fastapi.Query(default_factory=list),
+            )
+            limit: int = pydantic.Field(
+                fastapi.Query(
+                    default=self.list_limit_default,
+                    ge=1,
+                    le=self.list_limit_max,
+                ),
+            )
+
+        return GeneratedCursorPaginationParams
+
     @metrics.tracker
     def get_pagination_dependency(
         self,
         ordering_enum: type[enum.StrEnum],
         filters_dependency: type[filters.FiltersT],
-    ) -> type[PaginationParams[filters.FiltersT]]:
+    ) -> type[
+        PaginationParams[filters.FiltersT]
+        | CursorPaginationParams[filters.FiltersT]
+    ]:
         """Prepare pagination params dependency."""
         return typing.Annotated[  # type: ignore
             self.prepare_pagination_params(
@@ -1,3 +1,4 @@
+import functools
 import typing
 
 import pydantic
@@ -16,7 +17,77 @@ PaginatedBaseModel = typing.TypeVar(
 
 
 class PaginatedResult(BaseModel, typing.Generic[PaginatedBaseModel]):
-    """Representation of paginated result."""
+    """Representation of paginated result.
 
-    count: int
+    Depending on count strategy of endpoint `count` can be exact, estimated,
+    lower bound of actual count or not present at all.
+
+    """
+
+    count: int | None = None
+    count_is_lower_bound: bool = False
+    count_is_estimated: bool = False
+    has_next: bool = False
     results: list[PaginatedBaseModel]
+
+
+class CursorPaginatedResult(BaseModel, typing.Generic[PaginatedBaseModel]):
+    """Representation of cursor paginated result."""
+
+    next: str | None = None
+    previous: str | None = None
+    results: list[PaginatedBaseModel]
+
+
+@functools.cache
+def get_sparse_schema(
+    schema: type[PaginatedBaseModel],
+    fields: frozenset[str],
+) -> type[PaginatedBaseModel]:
+    """Prepare version of schema which requires only `fields`.
+
+    Other fields are made optional, so instance could be validated without
+    loading of data which wasn't requested.
+
+    """
+    return pydantic.create_model(  # type: ignore
+        f"Sparse{schema.__name__}",
+        __base__=schema,
+        __module__=schema.__module__,
+        **{
+            name: (typing.Any, None)
+            for name in schema.model_fields
+            if name not in fields
+        },
+    )
+
+
+@functools.cache
+def get_sparse_attributes(
+    schema: type[pydantic.BaseModel],
+    fields: frozenset[str],
+) -> tuple[str, ...]:
+    """Get attributes of instance which are read for `fields` of schema.
+
+    Fields are validated from attributes named by their validation alias, so
+    aliased fields are read by alias.
+
+    """
+    attributes = []
+    for field in fields:
+        alias = schema.model_fields[field].validation_alias
+        attributes.append(alias if isinstance(alias, str) else field)
+    return tuple(attributes)
+
+
+@functools.cache
+def get_type_adapter(
+    schema: type[PaginatedBaseModel],
+) -> pydantic.TypeAdapter[PaginatedBaseModel]:
+    """Get type adapter for schema.
+
+    Type adapter is cached, so its validator and serializer are built only
+    once per schema.
+
+    """
+    return pydantic.TypeAdapter(schema)
@@ -1,5 +1,7 @@
+import dataclasses
 import typing
 
+import fastapi
 import pydantic
 
 from .. import interactors, permissions, repositories, validators
@@ -56,3 +58,57 @@ class Context(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
     )
+
+    # Cache of lookups of repository validators, which is created per request
+    lookup_cache: typing.Annotated[
+        validators.LookupCache,
+        fastapi.Depends(validators.LookupCache),
+    ] = pydantic.Field(default_factory=validators.LookupCache)
+    # Errors of unique violations, which are registered by validators in
+    # optimistic mode, it's created per request
+    unique_violations: typing.Annotated[
+        validators.UniqueViolations,
+        fastapi.Depends(validators.UniqueViolations),
+    ] = pydantic.Field(default_factory=validators.UniqueViolations)
+
+
+@dataclasses.dataclass(frozen=True)
+class PageInfo:
+    """Representation of info about loaded page.
+
+    `count` is None if it wasn't calculated.
+
+    """
+
+    count: int | None
+    has_next: bool
+    count_is_lower_bound: bool = False
+    count_is_estimated: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class ActionPlan:
+    """Representation of action endpoint config, resolved on registration.
+
+    `reload_fetch_statement` is prepared on request and `validation_limits`
+    are passed only if action accepts them explicitly.
+
+    """
+
+    permissions: tuple[
+        permissions.BasePermission[typing.Any, typing.Any],
+        ...,
+    ]
+    validator: ActionValidatorType[typing.Any, typing.Any]
+    interactor: ActionInteractorType[
+        typing.Any,
+        typing.Any,
+        typing.Any,
+        typing.Any,
+    ]
+    joined_load: tuple[typing.Any, ...]
+    select_in_load: tuple[typing.Any, ...]
+    annotations: tuple[typing.Any, ...]
+    use_reload_fetch_statement: bool
+    validation_limits: validators.ValidationLimits | None = None
+    use_validation_limits: bool = False
@@ -1,6 +1,8 @@
 import collections.abc
 import typing
 
+import fastapi
+
 from .. import (
     common_types,
     exceptions,
@@ -97,6 +99,12 @@ class UpdateMixin(
             select_in_load=self.get_select_in_load_options(
                 action=self.action,
             ),
+            prerender=self.get_prerender_response(
+                action=self.action,
+            ),
+            validation_limits=self.get_validation_limits(
+                action=self.action,
+            ),
         )
 
     @metrics.tracker
@@ -133,6 +141,8 @@ class UpdateMixin(
                 permissions.UserT,
             ]
         ] = (),
+        prerender: bool = False,
+        validation_limits: validators.ValidationLimits | None = None,
     ) -> collections.abc.Callable[
         ...,
         collections.abc.Coroutine[
@@ -142,10 +152,12 @@ class UpdateMixin(
         ],
     ]:
         """Prepare update endpoint."""
+        # Pure validators of validator are run on validation of request
+        request_schema = validator.get_request_schema(update_schema)
 
         async def update(
             pk: pk_query,
-            request: update_schema,
+            request: request_schema,
             user: user_dependency,
             repository: repository_dependency,
             context: context_dependency,
@@ -172,6 +184,7 @@ class UpdateMixin(
                 model=request,
                 validator=validator,
                 repository=repository,
+                limits=validation_limits,
                 instance=instance,
             )
             return await self.perform_update(
@@ -188,6 +201,7 @@ class UpdateMixin(
                 joined_load=joined_load,
                 select_in_load=select_in_load,
                 annotations=annotations,
+                prerender=prerender,
             )
 
         return update
@@ -210,8 +224,14 @@ class UpdateMixin(
         select_in_load: collections.abc.Sequence[
             repositories.LazyLoadedT
         ] = (),
-    ) -> types.DetailSchema:
-        """Perform update operation."""
+        prerender: bool = False,
+    ) -> types.DetailSchema | fastapi.Response:
+        """Perform update operation.
+
+        If `prerender` is set, instance is serialized straight to json
+        response.
+
+        """
         # Instance is reloaded from db inside of `interactor.save()`
         instance = await interactor.save(
             data=validated_data,
@@ -226,4 +246,10 @@ class UpdateMixin(
         )
         if not instance:  # pragma: no cover
             raise exceptions.NotFoundException()
+        if prerender:
+            return self.prepare_prerendered_response(
+                schema=schema,
+                data=instance,
+                context=context,
+            )
         return schema.model_validate(instance, context=context)
@@ -1,11 +1,13 @@
 import collections.abc
 import contextlib
 import functools
+import typing
 
 import fastapi
 import pytest
 import saritasa_s3_tools
 import saritasa_sqlalchemy_tools
+import sqlalchemy
 
 import example_app
 import example_app.dependencies
@@ -116,6 +118,40 @@ def db_session_dependency(
     return _get_db_override
 
 
+@pytest.fixture
+def collect_statements(
+    db_session: saritasa_sqlalchemy_tools.Session,
+) -> shortcuts.StatementsCollector:
+    """Get context manager, which collects statements executed in db."""
+
+    @contextlib.contextmanager
+    def _collect_statements() -> collections.abc.Iterator[list[str]]:
+        statements: list[str] = []
+
+        def before_cursor_execute(
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> None:
+            statements.append(args[2])
+
+        engine = db_session.bind.sync_engine
+        sqlalchemy.event.listen(
+            engine,
+            "before_cursor_execute",
+            before_cursor_execute,
+        )
+        try:
+            yield statements
+        finally:
+            sqlalchemy.event.remove(
+                engine,
+                "before_cursor_execute",
+                before_cursor_execute,
+            )
+
+    return _collect_statements
+
+
 @pytest.fixture
 def fastapi_app(
     fastapi_app: fastapi.FastAPI,
@@ -155,3 +191,33 @@ def soft_delete_test_model_lazy_url(
         app=fastapi_app,
         view=example_app.views.SoftDeleteTestModelAPIView,
     )
+
+
+@pytest.fixture
+def cursor_test_model_lazy_url(
+    fastapi_app: fastapi.FastAPI,
+) -> fastapi_rest_framework.testing.LazyUrl:
+    """Generate shortcut to lazy urls of cursor paginated view."""
+    return functools.partial(
+        fastapi_rest_framework.testing.lazy_url,
+        app=fastapi_app,
+        view=example_app.views.CursorTestModelAPIView,
+    )
+
+
+@pytest.fixture
+def cached_test_model_lazy_url(
+    fastapi_app: fastapi.FastAPI,
+) -> fastapi_rest_framework.testing.LazyUrl:
+    """Generate shortcut to lazy urls of view with cached responses."""
+    return functools.partial(
+        fastapi_rest_framework.testing.lazy_url,
+        app=fastapi_app,
+        view=example_app.views.CachedTestModelAPIView,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    """Clear response cache between tests."""
+    fastapi_rest_framework.get_cache_backend().clear()  # type: ignore
@@ -1,3 +1,5 @@
+import collections.abc
+import contextlib
 import typing
 
 import example_app
@@ -9,3 +11,7 @@ AuthApiClientFactory: typing.TypeAlias = (
 )
 JWTAuthenticationType: typing.TypeAlias = example_app.security.JWTAuthClass
 JWTAuthentication: JWTAuthenticationType = example_app.security.JWTAuth
+StatementsCollector: typing.TypeAlias = collections.abc.Callable[
+    [],
+    contextlib.AbstractContextManager[list[str]],
+]
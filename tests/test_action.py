@@ -1,3 +1,7 @@
+import collections
+import typing
+
+import fastapi
 import pytest
 import pytest_lazy_fixtures
 
@@ -133,3 +137,138 @@ async def test_action_detail_api_not_found(
         ),
     )
     fastapi_rest_framework.testing.validate_not_found(response)
+
+
+def test_action_plan_is_prepared_on_registration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that config of action is resolved once per registered action."""
+    prepared: collections.Counter[str] = collections.Counter()
+    prepare_action_plan = (
+        example_app.views.TestModelAPIView.prepare_action_plan
+    )
+
+    def spy_prepare_action_plan(
+        self: example_app.views.TestModelAPIView,
+        func: typing.Callable[..., typing.Any],
+    ) -> fastapi_rest_framework.ActionPlan:
+        prepared[func.__name__] += 1
+        return prepare_action_plan(self, func)
+
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "prepare_action_plan",
+        spy_prepare_action_plan,
+    )
+
+    class PlanTestModelAPIView(example_app.views.TestModelAPIView):
+        router = fastapi.APIRouter(prefix="/plan-test-models")
+        lazy_registration = True
+
+        @fastapi_rest_framework.action()
+        async def reload_action(
+            self,
+            reload_fetch_statement: typing.Any,
+            **kwargs: typing.Any,
+        ) -> None:
+            """Perform action which reloads instance."""
+
+        @fastapi_rest_framework.action(detail=True)
+        async def plain_action(self, **kwargs: typing.Any) -> None:
+            """Perform action which doesn't reload instance."""
+
+    assert not prepared
+    PlanTestModelAPIView.get_router()
+    assert prepared == {"reload_action": 1, "plain_action": 1}
+
+
+async def test_action_plan_reload_fetch_statement(
+    repository: example_app.repositories.TestModelRepository,
+    user_jwt_data: shortcuts.UserData,
+) -> None:
+    """Test that reload statement is prepared only for actions using it."""
+
+    async def reload_action(
+        self: example_app.views.TestModelAPIView,
+        reload_fetch_statement: typing.Any,
+        **kwargs: typing.Any,
+    ) -> None:
+        """Perform action which reloads instance."""
+
+    async def plain_action(
+        self: example_app.views.TestModelAPIView,
+        **kwargs: typing.Any,
+    ) -> None:
+        """Perform action which doesn't reload instance."""
+
+    view = example_app.views.TestModelAPIView()
+    view.action = "action"
+    for func, use_reload_fetch_statement in (
+        (reload_action, True),
+        (plain_action, False),
+    ):
+        plan = view.prepare_action_plan(func)
+        assert plan.use_reload_fetch_statement is use_reload_fetch_statement
+        statement = await view.get_reload_fetch_statement(
+            plan=plan,
+            user=user_jwt_data,
+            repository=repository,
+        )
+        assert (statement is not None) is use_reload_fetch_statement
+
+
+def test_action_plan_validation_limits() -> None:
+    """Test that validation limits are passed only to actions using them."""
+
+    async def limited_action(
+        self: example_app.views.TestModelAPIView,
+        validation_limits: fastapi_rest_framework.ValidationLimits | None,
+        **kwargs: typing.Any,
+    ) -> None:
+        """Perform action which limits errors of validation."""
+
+    async def plain_action(
+        self: example_app.views.TestModelAPIView,
+        **kwargs: typing.Any,
+    ) -> None:
+        """Perform action which doesn't limit errors of validation."""
+
+    view = example_app.views.TestModelAPIView()
+    view.action = "action"
+    assert view.get_validation_limits_kwargs(
+        view.prepare_action_plan(limited_action),
+    ) == {"validation_limits": view.get_validation_limits(action="action")}
+    assert not view.get_validation_limits_kwargs(
+        view.prepare_action_plan(plain_action),
+    )
+
+
+async def test_action_config_is_not_resolved_on_request(
+    monkeypatch: pytest.MonkeyPatch,
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that requests to action use config resolved on registration."""
+    resolved: collections.Counter[str] = collections.Counter()
+    for method in ("get_permissions", "get_validator", "get_interactor"):
+        original = getattr(example_app.views.TestModelAPIView, method)
+
+        def spy(
+            self: example_app.views.TestModelAPIView,
+            *args: typing.Any,
+            method: str = method,
+            original: typing.Callable[..., typing.Any] = original,
+            **kwargs: typing.Any,
+        ) -> typing.Any:
+            resolved[method] += 1
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(example_app.views.TestModelAPIView, method, spy)
+    url = lazy_url(action_name="action-detail", pk=test_model.id)
+    for _ in range(2):
+        fastapi_rest_framework.testing.validate_no_content(
+            await api_client_factory(user_jwt_data).put(url),
+        )
+    assert not resolved
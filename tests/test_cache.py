@@ -0,0 +1,227 @@
+import collections.abc
+import copy
+
+import fastapi
+import pytest
+import saritasa_s3_tools
+
+import example_app
+import fastapi_rest_framework
+
+from . import shortcuts
+
+
+async def test_list_api_cache(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    repository: example_app.repositories.TestModelRepository,
+    test_model_list: list[example_app.models.TestModel],
+) -> None:
+    """Test that list API is cached until model is changed by interactor."""
+    api_client = api_client_factory(user_jwt_data)
+    url = cached_test_model_lazy_url(action_name="list")
+    params = {"order_by": "id"}
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=await api_client.get(url, params=params),
+            schema=example_app.views.CachedTestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.count == len(test_model_list)
+
+    # Change which bypasses interactor is not visible
+    test_model_list[0].text = "Changed"
+    await repository.save(test_model_list[0])
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=await api_client.get(url, params=params),
+            schema=example_app.views.CachedTestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.results[0].text != "Changed"
+
+    # Other params are cached separately
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=await api_client.get(url, params={"order_by": "-id"}),
+            schema=example_app.views.CachedTestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.results[-1].text == "Changed"
+
+    fastapi_rest_framework.testing.validate_no_content(
+        await api_client.delete(
+            lazy_url(action_name="delete", pk=test_model_list[-1].id),
+        ),
+    )
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=await api_client.get(url, params=params),
+            schema=example_app.views.CachedTestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.count == len(test_model_list) - 1
+    assert response_data.results[0].text == "Changed"
+
+
+async def test_detail_api_cache(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    repository: example_app.repositories.TestModelRepository,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that detail API is cached until model is changed by interactor."""
+    api_client = api_client_factory(user_jwt_data)
+    url = cached_test_model_lazy_url(action_name="detail", pk=test_model.id)
+    text = test_model.text
+    response_data = (
+        fastapi_rest_framework.testing.extract_schema_from_response(
+            response=await api_client.get(url),
+            schema=example_app.views.CachedTestModelAPIView.detail_schema,
+        )
+    )
+    assert response_data.text == text
+
+    test_model.text = "Changed"
+    await repository.save(test_model)
+    response_data = (
+        fastapi_rest_framework.testing.extract_schema_from_response(
+            response=await api_client.get(url),
+            schema=example_app.views.CachedTestModelAPIView.detail_schema,
+        )
+    )
+    assert response_data.text == text
+
+    fastapi_rest_framework.testing.validate_no_content(
+        await api_client.delete(
+            lazy_url(action_name="delete", pk=test_model.id),
+        ),
+    )
+    fastapi_rest_framework.testing.validate_not_found(
+        await api_client.get(url),
+    )
+
+
+async def test_cache_is_separated_by_user(
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    repository: example_app.repositories.TestModelRepository,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that each user has own cached responses."""
+    url = cached_test_model_lazy_url(action_name="detail", pk=test_model.id)
+    fastapi_rest_framework.testing.validate_response_status(
+        await api_client_factory(user_jwt_data).get(url),
+    )
+    test_model.text = "Changed"
+    await repository.save(test_model)
+    other_user = user_jwt_data.model_copy(update={"id": user_jwt_data.id + 1})
+    response_data = (
+        fastapi_rest_framework.testing.extract_schema_from_response(
+            response=await api_client_factory(other_user).get(url),
+            schema=example_app.views.CachedTestModelAPIView.detail_schema,
+        )
+    )
+    assert response_data.text == "Changed"
+
+
+async def test_cached_response_is_not_served_without_permission(
+    monkeypatch: pytest.MonkeyPatch,
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that permissions are checked before cached response is used."""
+    monkeypatch.setattr(
+        example_app.views.CachedTestModelAPIView,
+        "get_cache_scope",
+        lambda self, user: "",
+    )
+    url = cached_test_model_lazy_url(action_name="detail", pk=test_model.id)
+    fastapi_rest_framework.testing.validate_response_status(
+        await api_client_factory(user_jwt_data).get(url),
+    )
+    denied_user = user_jwt_data.model_copy(update={"allow": False})
+    fastapi_rest_framework.testing.validate_forbidden(
+        response=await api_client_factory(denied_user).get(url),
+        message="User is not allowed",
+    )
+
+
+async def test_cache_key_does_not_depend_on_request_state(
+    fastapi_app: fastapi.FastAPI,
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    repository: example_app.repositories.TestModelRepository,
+    test_model: example_app.models.TestModel,
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that cached response is hit, when context is built per request.
+
+    Each request gets own s3 client (as without overrides of tests).
+
+    """
+    fastapi_app.dependency_overrides[
+        example_app.dependencies.get_s3_client
+    ] = lambda: copy.copy(async_s3_client)
+    api_client = api_client_factory(user_jwt_data)
+    url = cached_test_model_lazy_url(action_name="detail", pk=test_model.id)
+    text = test_model.text
+    fastapi_rest_framework.testing.validate_response_status(
+        await api_client.get(url),
+    )
+    test_model.text = "Changed"
+    await repository.save(test_model)
+    response_data = (
+        fastapi_rest_framework.testing.extract_schema_from_response(
+            response=await api_client.get(url),
+            schema=example_app.views.CachedTestModelAPIView.detail_schema,
+        )
+    )
+    assert response_data.text == text
+
+
+class AfterCommitRepository:
+    """Repository, which collects callbacks to run after commit."""
+
+    model = example_app.models.TestModel
+
+    def __init__(self) -> None:
+        self.callbacks: list[
+            collections.abc.Callable[[], collections.abc.Awaitable[None]]
+        ] = []
+
+    def run_after_commit(
+        self,
+        callback: collections.abc.Callable[
+            [],
+            collections.abc.Awaitable[None],
+        ],
+    ) -> None:
+        """Save callback to run it after commit."""
+        self.callbacks.append(callback)
+
+
+async def test_cache_is_invalidated_after_commit() -> None:
+    """Test that version of model is bumped once more after commit."""
+    backend = fastapi_rest_framework.get_cache_backend()
+    namespace = fastapi_rest_framework.cache.get_model_namespace(
+        example_app.models.TestModel,
+    )
+    repository = AfterCommitRepository()
+    (version,) = await backend.get_versions([namespace])
+    await fastapi_rest_framework.ApiDataInteractor(
+        repository=repository,  # type: ignore
+        user=None,
+    ).invalidate_cache()
+    assert await backend.get_versions([namespace]) == [version + 1]
+    for callback in repository.callbacks:
+        await callback()
+    assert await backend.get_versions([namespace]) == [version + 2]
@@ -1,3 +1,8 @@
+import http
+import types
+import typing
+
+import pydantic
 import pytest
 import pytest_lazy_fixtures
 
@@ -63,3 +68,155 @@ async def test_detail_api_not_found(
         return
 
     fastapi_rest_framework.testing.validate_not_found(response=response)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["id", "text"],
+        ["id", "related_model", "related_models_count"],
+        # custom_property is not column, so nothing is pruned in query
+        ["custom_property", "json_field"],
+    ],
+)
+async def test_detail_api_sparse_fields(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model: example_app.models.TestModel,
+    fields: list[str],
+) -> None:
+    """Test that only requested fields are returned in detail API."""
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="detail", pk=test_model.id),
+        params={"fields": fields},
+    )
+    fastapi_rest_framework.testing.validate_response_status(response)
+    response_data = fastapi_rest_framework.testing.extract_json_from_response(
+        response,
+    )
+    assert isinstance(response_data, dict), response_data
+    assert set(response_data) == set(fields), response_data
+    if "related_model" in fields:
+        assert (
+            response_data["related_model"]["id"] == test_model.related_model_id
+        )
+
+
+async def test_detail_api_invalid_sparse_fields(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that only fields of schema can be requested."""
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="detail", pk=test_model.id),
+        params={"fields": ["id", "unknown"]},
+    )
+    fastapi_rest_framework.testing.extract_error_from_response(
+        response=response,
+        field="query.fields.1",
+    )
+
+
+def test_fields_dependency_enum_is_cached() -> None:
+    """Test that enum of fields is generated once per schema."""
+    view = example_app.views.TestModelAPIView()
+    schema = example_app.views.TestModelAPIView.detail_schema
+    first, second = (
+        typing.get_args(typing.get_args(view.get_fields_dependency(schema))[0])
+        for _ in range(2)
+    )
+    assert first == second
+
+
+def test_sparse_fields_with_aliases() -> None:
+    """Test that aliased sparse fields are read by their alias."""
+
+    class Schema(pydantic.BaseModel):
+        id: int
+        name: str = pydantic.Field(validation_alias="title")
+        text: str = pydantic.Field(alias="text_value")
+
+    fields = frozenset(("name", "text"))
+    instance = types.SimpleNamespace(id=1, title="title", text_value="text")
+    attributes = fastapi_rest_framework.views.schemas.get_sparse_attributes(
+        Schema,
+        fields,
+    )
+    assert sorted(attributes) == ["text_value", "title"]
+    result = fastapi_rest_framework.views.schemas.get_sparse_schema(
+        Schema,
+        fields,
+    ).model_validate(
+        {attribute: getattr(instance, attribute) for attribute in attributes},
+    )
+    assert result.name == "title"
+    assert result.text == "text"
+
+
+async def test_detail_api_etag(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that detail API answers matching `If-None-Match` with 304."""
+    api_client = api_client_factory(user_jwt_data)
+    url = cached_test_model_lazy_url(action_name="detail", pk=test_model.id)
+    response = await api_client.get(url)
+    fastapi_rest_framework.testing.validate_response_status(response)
+    assert (etag := response.headers["ETag"])
+    assert response.headers["Cache-Control"] == "private, max-age=60"
+
+    response = await api_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    # Requested fields are part of ETag
+    response = await api_client.get(
+        url,
+        params={"fields": ["id"]},
+        headers={"If-None-Match": etag},
+    )
+    fastapi_rest_framework.testing.validate_response_status(response)
+    assert response.headers["ETag"] != etag
+
+    fastapi_rest_framework.testing.validate_no_content(
+        await api_client.delete(
+            lazy_url(action_name="delete", pk=test_model.id),
+        ),
+    )
+    fastapi_rest_framework.testing.validate_not_found(
+        await api_client.get(url, headers={"If-None-Match": etag}),
+    )
+
+
+async def test_detail_api_etag_permissions(
+    monkeypatch: pytest.MonkeyPatch,
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that permissions are checked before `If-None-Match` is matched."""
+    monkeypatch.setattr(
+        example_app.views.CachedTestModelAPIView,
+        "get_cache_scope",
+        lambda self, user: "",
+    )
+    url = cached_test_model_lazy_url(action_name="detail", pk=test_model.id)
+    response = await api_client_factory(user_jwt_data).get(url)
+    fastapi_rest_framework.testing.validate_response_status(response)
+    etag = response.headers["ETag"]
+    denied_user = user_jwt_data.model_copy(update={"allow": False})
+    fastapi_rest_framework.testing.validate_forbidden(
+        response=await api_client_factory(denied_user).get(
+            url,
+            headers={"If-None-Match": etag},
+        ),
+        message="User is not allowed",
+    )
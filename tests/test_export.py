@@ -0,0 +1,136 @@
+import csv
+import http
+import io
+import json
+import types
+import typing
+
+import pydantic
+import pytest
+import pytest_lazy_fixtures
+
+import example_app
+import fastapi_rest_framework
+
+from . import shortcuts
+
+
+@pytest.mark.parametrize(
+    "user",
+    [
+        None,
+        pytest_lazy_fixtures.lf("user_jwt_data"),
+    ],
+)
+async def test_export_api_ndjson(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user: shortcuts.UserData | None,
+    test_model_list: list[example_app.models.TestModel],
+) -> None:
+    """Test export API in NDJSON format."""
+    response = await api_client_factory(user).get(
+        lazy_url(action_name="export"),
+        params={"order_by": "-id"},
+    )
+    if not fastapi_rest_framework.testing.validate_auth_required_response(
+        response,
+    ):
+        return
+    assert response.status_code == http.HTTPStatus.OK, response.text
+    assert response.headers["content-type"].startswith(
+        "application/x-ndjson",
+    )
+    results = [
+        example_app.views.TestModelAPIView.list_schema.model_validate(
+            json.loads(line),
+        )
+        for line in response.text.splitlines()
+    ]
+    assert [result.id for result in results] == [
+        instance.id for instance in test_model_list[::-1]
+    ]
+    for result in results:
+        assert len(result.related_models) == 5
+
+
+async def test_export_api_csv(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+    test_model_list: list[example_app.models.TestModel],
+) -> None:
+    """Test export API in CSV format, which is loaded in several chunks."""
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "export_chunk_size",
+        2,
+    )
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="export"),
+        params={"format": "csv"},
+    )
+    assert response.status_code == http.HTTPStatus.OK, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(int(row["id"]) for row in rows) == sorted(
+        instance.id for instance in test_model_list
+    )
+    assert set(rows[0]) == set(
+        example_app.views.TestModelAPIView.list_schema.model_fields,
+    )
+    assert len(json.loads(rows[0]["related_models"])) == 5
+
+
+@pytest.mark.usefixtures("test_model_list")
+async def test_export_api_filters(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+) -> None:
+    """Test that filters are applied to export API."""
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="export"),
+        params={"format": "csv", "number__gte": 2147483647},
+    )
+    assert response.status_code == http.HTTPStatus.OK, response.text
+    # Only header is returned
+    assert list(csv.reader(io.StringIO(response.text))) == [
+        list(example_app.views.TestModelAPIView.list_schema.model_fields),
+    ]
+
+
+async def test_export_csv_columns() -> None:
+    """Test that values of CSV rows match header."""
+
+    class Schema(pydantic.BaseModel):
+        model_config = pydantic.ConfigDict(from_attributes=True)
+
+        id: int
+        secret: str = pydantic.Field(exclude=True)
+        name: str = pydantic.Field(alias="title")
+
+        @pydantic.computed_field  # type: ignore[prop-decorator]
+        @property
+        def label(self) -> str:
+            return f"{self.id}-{self.name}"
+
+    async def chunks() -> typing.AsyncIterator[list[types.SimpleNamespace]]:
+        yield [types.SimpleNamespace(id=1, secret="secret", title="name")]
+
+    view = example_app.views.TestModelAPIView()
+    content = "".join(
+        [
+            chunk
+            async for chunk in view.serialize_csv(
+                chunks=chunks(),
+                export_schema=Schema,  # type: ignore
+                context=fastapi_rest_framework.Context(),
+            )
+        ],
+    )
+    assert list(csv.reader(io.StringIO(content))) == [
+        ["id", "title", "label"],
+        ["1", "name", "1-name"],
+    ]
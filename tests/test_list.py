@@ -1,6 +1,13 @@
+import asyncio
+import http
+import typing
+
+import fastapi
+import httpx
 import pytest
 import pytest_lazy_fixtures
 import saritasa_sqlalchemy_tools
+import sqlalchemy
 
 import example_app
 import fastapi_rest_framework
@@ -254,6 +261,13 @@ async def test_filter_custom_filter(
     assert expected_ids == actual_ids, response_data
 
 
+@pytest.mark.parametrize(
+    "two_phase_pagination",
+    [
+        True,
+        False,
+    ],
+)
 @pytest.mark.usefixtures("test_model_list")
 async def test_filter_m2m(
     lazy_url: fastapi_rest_framework.testing.LazyUrl,
@@ -261,8 +275,20 @@ async def test_filter_m2m(
     user_jwt_data: shortcuts.UserData,
     test_model: example_app.models.TestModel,
     repository: example_app.repositories.TestModelRepository,
+    monkeypatch: pytest.MonkeyPatch,
+    two_phase_pagination: bool,
 ) -> None:
-    """Test filter related to m2m fields."""
+    """Test filter related to m2m fields.
+
+    Filter joins collection, so instance is matched several times, but it's
+    returned once.
+
+    """
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "two_phase_pagination",
+        two_phase_pagination,
+    )
     related_model = await factories.RelatedModelFactory.create_async(
         session=repository.db_session,
     )
@@ -291,6 +317,9 @@ async def test_filter_m2m(
             schema=example_app.views.TestModelAPIView.list_schema,
         )
     )
+    if two_phase_pagination:
+        # Without it joined rows are counted
+        assert response_data.count == 1, response_data
     assert len(response_data.results) == 1
     assert response_data.results[0].id == test_model.id
 
@@ -370,3 +399,691 @@ async def test_list_invalid_value_in_filter_body(
         response_data.detail
         == "Value error, Invalid can't be used with condition"
     ), response_data
+
+
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        "id",
+        "-id",
+        "number",
+        "-number",
+    ],
+)
+async def test_list_cursor_pagination(
+    cursor_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model_list: list[example_app.models.TestModel],
+    order_by: str,
+) -> None:
+    """Test that cursor pagination walks over all instances in both ways."""
+    api_client = api_client_factory(user_jwt_data)
+    url = cursor_test_model_lazy_url(action_name="list")
+    field = order_by.removeprefix("-")
+    sign = -1 if order_by.startswith("-") else 1
+    # Primary key is always used as last ordering field
+    expected_ids = [
+        instance.id
+        for instance in sorted(
+            test_model_list,
+            key=lambda item: (sign * getattr(item, field), item.id),
+        )
+    ]
+    pages: list[list[int]] = []
+    cursor: str | None = None
+    while True:
+        response_data = fastapi_rest_framework.testing.extract_cursor_paginated_result_from_response(  # noqa: E501
+            response=await api_client.get(
+                url,
+                params={
+                    "order_by": order_by,
+                    "limit": 2,
+                    **({"cursor": cursor} if cursor else {}),
+                },
+            ),
+            schema=example_app.views.CursorTestModelAPIView.list_schema,
+        )
+        pages.append([result.id for result in response_data.results])
+        if not response_data.next:
+            break
+        cursor = response_data.next
+    assert [pk for page in pages for pk in page] == expected_ids
+    assert response_data.previous
+
+    response_data = fastapi_rest_framework.testing.extract_cursor_paginated_result_from_response(  # noqa: E501
+        response=await api_client.get(
+            url,
+            params={
+                "order_by": order_by,
+                "limit": 2,
+                "cursor": response_data.previous,
+            },
+        ),
+        schema=example_app.views.CursorTestModelAPIView.list_schema,
+    )
+    assert [result.id for result in response_data.results] == pages[-2]
+    assert response_data.next
+
+
+@pytest.mark.usefixtures("test_model_list")
+async def test_list_cursor_pagination_invalid_cursor(
+    cursor_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+) -> None:
+    """Test that invalid or outdated cursor is rejected."""
+    api_client = api_client_factory(user_jwt_data)
+    url = cursor_test_model_lazy_url(action_name="list")
+    response_data = fastapi_rest_framework.testing.extract_cursor_paginated_result_from_response(  # noqa: E501
+        response=await api_client.get(url, params={"limit": 1}),
+        schema=example_app.views.CursorTestModelAPIView.list_schema,
+    )
+    for params in (
+        {"cursor": "invalid"},
+        # Cursor was generated for other ordering
+        {"cursor": response_data.next, "order_by": "-number"},
+    ):
+        response = await api_client.get(url, params=params)
+        error = fastapi_rest_framework.testing.extract_error_from_response(
+            response=response,
+            field="query.cursor",
+        )
+        assert error.detail == "Invalid cursor.", error
+
+
+@pytest.mark.parametrize(
+    argnames=[
+        "count_strategy",
+        "offset",
+        "expected_count",
+        "expected_has_next",
+        "expected_count_is_lower_bound",
+    ],
+    argvalues=[
+        [
+            fastapi_rest_framework.CountStrategy.exact,
+            0,
+            5,
+            True,
+            False,
+        ],
+        [
+            fastapi_rest_framework.CountStrategy.exact,
+            4,
+            5,
+            False,
+            False,
+        ],
+        # Count is capped by `count_cap`
+        [
+            fastapi_rest_framework.CountStrategy.capped,
+            0,
+            3,
+            True,
+            True,
+        ],
+        # Loaded page is beyond `count_cap`
+        [
+            fastapi_rest_framework.CountStrategy.capped,
+            4,
+            5,
+            False,
+            True,
+        ],
+        [
+            fastapi_rest_framework.CountStrategy.none,
+            0,
+            None,
+            True,
+            False,
+        ],
+        [
+            fastapi_rest_framework.CountStrategy.none,
+            4,
+            None,
+            False,
+            False,
+        ],
+    ],
+)
+@pytest.mark.usefixtures("test_model_list")
+async def test_list_count_strategy(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+    count_strategy: fastapi_rest_framework.CountStrategy,
+    offset: int,
+    expected_count: int | None,
+    expected_has_next: bool,
+    expected_count_is_lower_bound: bool,
+) -> None:
+    """Test that count strategies are applied to list API."""
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "count_strategy_map",
+        {"list": count_strategy},
+    )
+    monkeypatch.setattr(example_app.views.TestModelAPIView, "count_cap", 3)
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="list"),
+        params={
+            "limit": 2,
+            "offset": offset,
+        },
+    )
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=response,
+            schema=example_app.views.TestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.count == expected_count, response_data
+    assert response_data.has_next == expected_has_next, response_data
+    assert (
+        response_data.count_is_lower_bound == expected_count_is_lower_bound
+    ), response_data
+
+
+async def test_list_capped_count_of_cap_rows(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+    test_model_list: list[example_app.models.TestModel],
+) -> None:
+    """Test that count equal to `count_cap` is not a lower bound."""
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "count_strategy_map",
+        {"list": fastapi_rest_framework.CountStrategy.capped},
+    )
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "count_cap",
+        len(test_model_list),
+    )
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=await api_client_factory(user_jwt_data).get(
+                lazy_url(action_name="list"),
+                params={"limit": 2},
+            ),
+            schema=example_app.views.TestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.count == len(test_model_list), response_data
+    assert not response_data.count_is_lower_bound, response_data
+
+
+@pytest.mark.usefixtures("test_model_list")
+async def test_list_estimated_count_strategy(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that estimated count is returned for list API."""
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "count_strategy_map",
+        {"list": fastapi_rest_framework.CountStrategy.estimated},
+    )
+    for params in (
+        {},
+        {"number__gte": 0},
+        # Values of filters are bound, not inlined in explained query
+        {"search": "text'; --"},
+    ):
+        response = await api_client_factory(user_jwt_data).get(
+            lazy_url(action_name="list"),
+            params=params,
+        )
+        response_data = fastapi_rest_framework.testing.extract_paginated_result_from_response(  # noqa: E501
+            response=response,
+            schema=example_app.views.TestModelAPIView.list_schema,
+        )
+        assert response_data.count_is_estimated, response_data
+        assert response_data.count is not None, response_data
+        assert response_data.count >= len(response_data.results)
+
+
+@pytest.mark.parametrize(
+    "window_count",
+    [
+        True,
+        False,
+    ],
+)
+@pytest.mark.parametrize(
+    argnames=[
+        "params",
+        "expected_count",
+    ],
+    argvalues=[
+        [
+            {"limit": 2},
+            5,
+        ],
+        # Page is empty, count is loaded separately
+        [
+            {"limit": 2, "offset": 10},
+            5,
+        ],
+        [
+            {"limit": 2, "number__gte": 2147483647},
+            0,
+        ],
+    ],
+)
+@pytest.mark.usefixtures("test_model_list")
+async def test_list_window_count(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+    window_count: bool,
+    params: dict[str, int],
+    expected_count: int,
+) -> None:
+    """Test that count is same with and without window count."""
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "window_count",
+        window_count,
+    )
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="list"),
+        params=params,
+    )
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=response,
+            schema=example_app.views.TestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.count == expected_count, response_data
+
+
+@pytest.mark.parametrize(
+    "two_phase_pagination",
+    [
+        True,
+        False,
+    ],
+)
+@pytest.mark.parametrize(
+    argnames=[
+        "params",
+        "expected_count",
+    ],
+    argvalues=[
+        [
+            {"limit": 2, "order_by": "id"},
+            5,
+        ],
+        [
+            {"limit": 2, "order_by": "id", "number__gte": 2147483647},
+            0,
+        ],
+    ],
+)
+async def test_list_concurrent_count(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+    test_model_list: list[example_app.models.TestModel],
+    two_phase_pagination: bool,
+    params: dict[str, typing.Any],
+    expected_count: int,
+) -> None:
+    """Test that count is loaded concurrently with page.
+
+    Data of tests is not committed, so count is made in session of test.
+
+    """
+    counted_statements = []
+
+    async def count_on_separate_connection(
+        self: example_app.views.TestModelAPIView,
+        repository: example_app.repositories.TestModelRepository,
+        statement: sqlalchemy.Select[typing.Any],
+    ) -> int:
+        counted_statements.append(statement)
+        return (
+            await repository.db_session.scalar(
+                self.get_count_statement(statement),
+            )
+            or 0
+        )
+
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "count_on_separate_connection",
+        count_on_separate_connection,
+    )
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "concurrent_count",
+        True,
+    )
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "two_phase_pagination",
+        two_phase_pagination,
+    )
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="list"),
+        params=params,
+    )
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=response,
+            schema=example_app.views.TestModelAPIView.list_schema,
+        )
+    )
+    assert len(counted_statements) == 1
+    assert response_data.count == expected_count, response_data
+    assert [result.id for result in response_data.results] == [
+        instance.id for instance in test_model_list[:2]
+    ][:expected_count]
+    assert response_data.has_next == (expected_count > 2), response_data
+
+
+async def test_list_concurrent_count_is_cancelled(
+    monkeypatch: pytest.MonkeyPatch,
+    user_jwt_data: shortcuts.UserData,
+    repository: example_app.repositories.TestModelRepository,
+) -> None:
+    """Test that count is cancelled and awaited, if page fails to load."""
+    cancelled_counts = []
+
+    async def count_on_separate_connection(
+        self: example_app.views.TestModelAPIView,
+        **kwargs: typing.Any,
+    ) -> int:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled_counts.append(kwargs["statement"])
+            raise
+        return 0  # pragma: no cover
+
+    async def fetch_all(**kwargs: typing.Any) -> typing.NoReturn:
+        await asyncio.sleep(0)
+        raise ValueError("Page is not loaded")
+
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "count_on_separate_connection",
+        count_on_separate_connection,
+    )
+    monkeypatch.setattr(repository, "fetch_all", fetch_all)
+    view = example_app.views.TestModelAPIView()
+    view.action = "list"
+    with pytest.raises(ValueError, match="Page is not loaded"):
+        await view.paginate_data_with_concurrent_count(
+            user=user_jwt_data,
+            repository=repository,
+            offset=0,
+            limit=2,
+            order_by=(),
+            annotations=(),
+        )
+    assert len(cancelled_counts) == 1
+
+
+@pytest.mark.parametrize(
+    "two_phase_pagination",
+    [
+        True,
+        False,
+    ],
+)
+async def test_list_two_phase_pagination(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+    test_model_list: list[example_app.models.TestModel],
+    two_phase_pagination: bool,
+) -> None:
+    """Test pagination when collections are joined loaded.
+
+    Check that page is same and ordering is kept with and without loading
+    page of primary keys first.
+
+    """
+    monkeypatch.setattr(
+        example_app.views.TestModelAPIView,
+        "two_phase_pagination",
+        two_phase_pagination,
+    )
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="list"),
+        params={
+            "order_by": "-id",
+            "limit": 2,
+            "offset": 1,
+        },
+    )
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=response,
+            schema=example_app.views.TestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.count == len(test_model_list)
+    assert [result.id for result in response_data.results] == [
+        instance.id for instance in test_model_list[::-1][1:3]
+    ]
+    for result in response_data.results:
+        assert len(result.related_models) == 5
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["id", "text"],
+        ["id", "related_models", "related_models_count"],
+        ["custom_property", "json_field"],
+    ],
+)
+async def test_list_sparse_fields(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model_list: list[example_app.models.TestModel],
+    fields: list[str],
+) -> None:
+    """Test that only requested fields are returned in list API."""
+    response = await api_client_factory(user_jwt_data).get(
+        lazy_url(action_name="list"),
+        params={"fields": fields},
+    )
+    fastapi_rest_framework.testing.validate_response_status(response)
+    response_data = fastapi_rest_framework.testing.extract_json_from_response(
+        response,
+    )
+    assert isinstance(response_data, dict), response_data
+    assert response_data["count"] == len(test_model_list), response_data
+    assert len(response_data["results"]) == len(test_model_list)
+    for result in response_data["results"]:
+        assert set(result) == set(fields), result
+        if "related_models" in fields:
+            assert len(result["related_models"]) == 5
+
+
+async def test_list_prerendered_response(
+    cursor_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model_list: list[example_app.models.TestModel],
+) -> None:
+    """Test that prerendered response keeps schema of endpoint."""
+    response_data = fastapi_rest_framework.testing.extract_cursor_paginated_result_from_response(  # noqa: E501
+        response=await api_client_factory(user_jwt_data).get(
+            cursor_test_model_lazy_url(action_name="list"),
+            params={"order_by": "id", "limit": len(test_model_list)},
+        ),
+        schema=example_app.views.CursorTestModelAPIView.list_schema,
+    )
+    assert [result.id for result in response_data.results] == sorted(
+        instance.id for instance in test_model_list
+    )
+    for result in response_data.results:
+        assert len(result.related_models) == 5
+    response_schema = example_app.fastapi_app.openapi()["paths"][
+        "/cursor-test-models/"
+    ]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert response_schema["$ref"].endswith(
+        f"CursorPaginatedResult_{example_app.schemas.TestModelList.__name__}_",
+    )
+
+
+async def test_list_api_etag(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    cached_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    test_model_list: list[example_app.models.TestModel],
+) -> None:
+    """Test that list API answers matching `If-None-Match` with 304."""
+    api_client = api_client_factory(user_jwt_data)
+    url = cached_test_model_lazy_url(action_name="list")
+    response = await api_client.get(url, params={"limit": 2})
+    fastapi_rest_framework.testing.validate_response_status(response)
+    assert (etag := response.headers["ETag"])
+    assert response.headers["Cache-Control"] == "private, max-age=60"
+
+    response = await api_client.get(
+        url,
+        params={"limit": 2},
+        headers={"If-None-Match": f'W/"other", {etag}'},
+    )
+    assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    # Pagination params are part of ETag
+    response = await api_client.get(
+        url,
+        params={"limit": 3},
+        headers={"If-None-Match": etag},
+    )
+    fastapi_rest_framework.testing.validate_response_status(response)
+
+    # Change of filtered set changes ETag
+    fastapi_rest_framework.testing.validate_no_content(
+        await api_client.delete(
+            lazy_url(action_name="delete", pk=test_model_list[-1].id),
+        ),
+    )
+    response = await api_client.get(
+        url,
+        params={"limit": 2},
+        headers={"If-None-Match": etag},
+    )
+    fastapi_rest_framework.testing.validate_response_status(response)
+    assert response.headers["ETag"] != etag
+
+
+def test_generated_types_are_reused() -> None:
+    """Test that generated types are created once per view."""
+    view = example_app.views.TestModelAPIView()
+    view.action = "list"
+    ordering_enum = view.get_ordering_enum(view.ordering_fields)
+    assert view.get_ordering_enum(view.ordering_fields) is ordering_enum
+    pagination_params = view.prepare_pagination_params(
+        ordering_enum=ordering_enum,
+        filters_dependency=view.filters_dependency,
+    )
+    assert (
+        view.prepare_pagination_params(
+            ordering_enum=view.get_ordering_enum(view.ordering_fields),
+            filters_dependency=view.filters_dependency,
+        )
+        is pagination_params
+    )
+    assert (
+        example_app.views.TestModelAPIView().get_default_interactor()
+        is view.get_default_interactor()
+    )
+
+
+def test_lazy_registration() -> None:
+    """Test that endpoints of lazy view are registered on mount."""
+
+    class LazyTestModelAPIView(example_app.views.CursorTestModelAPIView):
+        router = fastapi.APIRouter(prefix="/lazy-test-models")
+        lazy_registration = True
+
+    assert not LazyTestModelAPIView.router.routes
+    router = LazyTestModelAPIView.get_router()
+    assert {route.name for route in router.routes} == {  # type: ignore
+        route.name.replace("cursor-", "lazy-")  # type: ignore
+        for route in example_app.views.CursorTestModelAPIView.router.routes
+    }
+
+
+@pytest.mark.usefixtures("test_model_list")
+async def test_lazy_registration_serves_requests(
+    fastapi_app: fastapi.FastAPI,
+    token_factory: typing.Callable[[shortcuts.UserData], str],
+    user_jwt_data: shortcuts.UserData,
+) -> None:
+    """Test that lazy view included into app serves requests."""
+
+    class ServedLazyTestModelAPIView(
+        example_app.views.CursorTestModelAPIView,
+    ):
+        router = fastapi.APIRouter(prefix="/served-lazy-test-models")
+        lazy_registration = True
+
+    app = fastapi.FastAPI()
+    app.dependency_overrides.update(fastapi_app.dependency_overrides)
+    fastapi_rest_framework.include_views(
+        app.router,
+        ServedLazyTestModelAPIView,
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),  # type: ignore
+        base_url="http://testapp",
+        headers={"Authorization": f"Bearer {token_factory(user_jwt_data)}"},
+    ) as api_client:
+        response = await api_client.get(
+            app.url_path_for("served-lazy-test-models-list"),
+            params={"order_by": "number"},
+        )
+    response_data = fastapi_rest_framework.testing.extract_cursor_paginated_result_from_response(  # noqa: E501
+        response=response,
+        schema=example_app.views.CursorTestModelAPIView.list_schema,
+    )
+    assert response_data.results
+
+
+@pytest.mark.usefixtures("test_model_list")
+async def test_list_statement_cache(
+    cursor_test_model_lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+) -> None:
+    """Test that statement is reused for requests with different filters."""
+    api_client = api_client_factory(user_jwt_data)
+    url = cursor_test_model_lazy_url(action_name="list")
+    results = []
+    for number in (0, 1):
+        hits = fastapi_rest_framework.metrics.counters["statement_cache.hit"]
+        response_data = fastapi_rest_framework.testing.extract_cursor_paginated_result_from_response(  # noqa: E501
+            response=await api_client.get(
+                url,
+                params={"order_by": "number", "number__gte": number},
+            ),
+            schema=example_app.views.CursorTestModelAPIView.list_schema,
+        )
+        results.append(response_data.results)
+    assert (
+        fastapi_rest_framework.metrics.counters["statement_cache.hit"] > hits
+    )
+    assert all(result.number >= 1 for result in results[1])
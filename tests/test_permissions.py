@@ -1,4 +1,5 @@
 import http
+import typing
 
 import pytest
 
@@ -76,3 +77,170 @@ async def test_default_permission_dependency(
         response=response,
         message="User is not allowed",
     )
+
+
+async def test_permission_queryset_filters(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    monkeypatch: pytest.MonkeyPatch,
+    test_model_list: list[example_app.models.TestModel],
+) -> None:
+    """Test that filters of permissions are applied to list."""
+    available_ids = [instance.id for instance in test_model_list[:2]]
+
+    async def get_queryset_filters(
+        self: example_app.security.AllowPermission[
+            example_app.models.TestModel
+        ],
+        user: shortcuts.UserData,
+        action: str,
+        context: fastapi_rest_framework.ContextType,
+    ) -> list[typing.Any]:
+        return [example_app.models.TestModel.id.in_(available_ids)]
+
+    monkeypatch.setattr(
+        example_app.security.AllowPermission,
+        "get_queryset_filters",
+        get_queryset_filters,
+    )
+    response_data = (
+        fastapi_rest_framework.testing.extract_paginated_result_from_response(
+            response=await api_client_factory(user_jwt_data).get(
+                lazy_url(action_name="list"),
+            ),
+            schema=example_app.views.TestModelAPIView.list_schema,
+        )
+    )
+    assert response_data.count == len(available_ids)
+    assert sorted(result.id for result in response_data.results) == sorted(
+        available_ids,
+    )
+
+
+async def test_concurrent_permissions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that concurrent permissions keep order of errors."""
+    monkeypatch.setattr(
+        example_app.security.AuthRequiredPermission,
+        "independent",
+        True,
+    )
+    auth_permission = example_app.security.AuthRequiredPermission[typing.Any]()
+    allow_permission = example_app.security.AllowPermission[typing.Any]()
+    with pytest.raises(fastapi_rest_framework.UnauthorizedException):
+        await fastapi_rest_framework.check_permissions(
+            permissions=(auth_permission, allow_permission, auth_permission),
+            user=example_app.security.UserJWTData(),
+            context={},
+            action="list",
+            request_data=None,
+        )
+    with pytest.raises(fastapi_rest_framework.PermissionException):
+        await fastapi_rest_framework.check_permissions(
+            permissions=(auth_permission, allow_permission),
+            user=example_app.security.UserJWTData(id=1),
+            context={},
+            action="list",
+            request_data=None,
+        )
+
+
+async def test_permission_decision_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that decisions of permissions are reused between checks."""
+    monkeypatch.setattr(
+        example_app.security.AllowPermission,
+        "decision_cache_ttl",
+        60,
+    )
+    monkeypatch.setattr(
+        example_app.security.AllowPermission,
+        "decision_cache",
+        fastapi_rest_framework.PermissionDecisionCache(),
+    )
+    monkeypatch.setattr(
+        example_app.security.AllowPermission,
+        "get_decision_cache_config",
+        lambda self: (),
+    )
+    checked_users: list[example_app.security.UserJWTData] = []
+    check_permission = example_app.security.AllowPermission._check_permission
+
+    async def _check_permission(
+        self: example_app.security.AllowPermission[typing.Any],
+        user: example_app.security.UserJWTData,
+        **kwargs: typing.Any,
+    ) -> None:
+        checked_users.append(user)
+        await check_permission(self, user=user, **kwargs)
+
+    monkeypatch.setattr(
+        example_app.security.AllowPermission,
+        "_check_permission",
+        _check_permission,
+    )
+    permission = example_app.security.AllowPermission[typing.Any]()
+    allowed_user = example_app.security.UserJWTData(id=1, allow=True)
+    denied_user = example_app.security.UserJWTData(id=1)
+    for _ in range(2):
+        await permission(
+            user=allowed_user,
+            context={},
+            action="list",
+            request_data=None,
+        )
+        with pytest.raises(fastapi_rest_framework.PermissionException):
+            await permission(
+                user=denied_user,
+                context={},
+                action="list",
+                request_data=None,
+            )
+    assert checked_users == [allowed_user, denied_user]
+
+
+class ActionPermission(example_app.security.BasePermission[typing.Any]):
+    """Check that action is one of allowed ones."""
+
+    decision_cache_ttl = 60
+    decision_cache = fastapi_rest_framework.PermissionDecisionCache()
+
+    def __init__(self, actions: frozenset[str]) -> None:
+        self.actions = actions
+
+    def get_decision_cache_config(self) -> frozenset[str]:
+        """Get allowed actions."""
+        return self.actions
+
+    async def _check_permission(
+        self,
+        user: example_app.security.UserJWTData,
+        action: str,
+        context: fastapi_rest_framework.ContextType,
+        request_data: fastapi_rest_framework.RequestData,
+    ) -> None:
+        if action not in self.actions:
+            raise fastapi_rest_framework.PermissionException(
+                detail="Action is not allowed",
+            )
+
+
+async def test_permission_decision_cache_config() -> None:
+    """Test that permissions with different config don't share decisions."""
+    user = example_app.security.UserJWTData(id=1, allow=True)
+    await ActionPermission(actions=frozenset(("list",)))(
+        user=user,
+        context={},
+        action="list",
+        request_data=None,
+    )
+    with pytest.raises(fastapi_rest_framework.PermissionException):
+        await ActionPermission(actions=frozenset(("detail",)))(
+            user=user,
+            context={},
+            action="list",
+            request_data=None,
+        )
@@ -328,3 +328,47 @@ async def test_update_instance_with_non_existent_file(
             )
         )
         assert response_data.detail == "File was not found", response_data
+
+
+@pytest.mark.parametrize(
+    "list_threshold",
+    [None, 1],
+)
+async def test_validate_urls_of_files(
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData,
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+    list_threshold: int | None,
+) -> None:
+    """Test that keys of urls of files are checked once and in order."""
+    (
+        file_url,
+        file_key,
+    ) = await fastapi_rest_framework.s3.testing.upload_file_to_s3(
+        api_client=api_client_factory(user_jwt_data),
+        config="all_file_types",
+        file_path=__file__,
+    )
+    validator = fastapi_rest_framework.s3.S3URLValidator(
+        max_concurrency=1,
+        list_threshold=list_threshold,
+    )
+    context = {"s3_client": async_s3_client}
+    assert await validator(
+        value=[file_url, file_url],
+        context=context,
+        loc=("body", "files"),
+    ) == [file_key, file_key]
+    missing_url = file_url.replace(file_key, f"{file_key}.missing")
+    with pytest.raises(fastapi_rest_framework.ValidationError) as error_info:
+        await validator(
+            value=[missing_url, file_url, missing_url],
+            context=context,
+            loc=("body", "files"),
+        )
+    errors = error_info.value.get_schema()
+    assert isinstance(errors, list), errors
+    assert [error.field for error in errors] == [
+        "body.files.0",
+        "body.files.2",
+    ], errors
@@ -1,5 +1,6 @@
 import warnings
 
+import pydantic
 import pytest
 
 import example_app
@@ -302,6 +303,71 @@ async def test_create_api_unique_by_field_validation(
     ), response_data
 
 
+async def test_create_api_optimistic_unique_by_field_validation(
+    lazy_url: fastapi_rest_framework.testing.LazyUrl,
+    api_client_factory: shortcuts.AuthApiClientFactory,
+    user_jwt_data: shortcuts.UserData | None,
+    repository: example_app.repositories.TestModelRepository,
+    test_model: example_app.models.TestModel,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that unique violation in optimistic mode has same error."""
+    monkeypatch.setattr(
+        example_app.validators.TestModelValidator,
+        "optimistic_unique",
+        True,
+    )
+    schema = example_app.views.TestModelAPIView.create_schema.model_validate(
+        test_model,
+    )
+    schema.text = "OptimisticText"
+    response = await api_client_factory(user_jwt_data).post(
+        lazy_url(action_name="create"),
+        json=schema.model_dump(mode="json"),
+    )
+    response_data = fastapi_rest_framework.testing.extract_error_from_response(
+        response=response,
+        field="body.text_unique",
+    )
+    assert (
+        response_data.detail
+        == "There is already an instance with same Text unique"
+    ), response_data
+
+
+def test_unique_violations_registry() -> None:
+    """Test that only violation of matched data is reported."""
+    registry = fastapi_rest_framework.UniqueViolations()
+    for index, text in enumerate(("first, text", "second")):
+        registry.register(
+            fields=("text_unique",),
+            violation=fastapi_rest_framework.UniqueViolation(
+                loc=("body", index, "text_unique"),
+                error_message="Not unique",
+                values={"text_unique": text},
+            ),
+        )
+    for values, expected_loc in (
+        (("first, text",), ("body", 0, "text_unique")),
+        (("second",), ("body", 1, "text_unique")),
+        (("third",), None),
+        # Violated data can't be identified without values
+        (None, None),
+    ):
+        error = registry.get_error(
+            fastapi_rest_framework.UniqueViolationError(
+                fields=("text_unique",),
+                values=values,
+            ),
+        )
+        if expected_loc is None:
+            assert error is None, values
+            continue
+        assert error is not None, values
+        locs = [nested_error.loc for nested_error in error.iter_errors()]
+        assert locs == [expected_loc], values
+
+
 async def test_create_api_invalid_fk(
     lazy_url: fastapi_rest_framework.testing.LazyUrl,
     api_client_factory: shortcuts.AuthApiClientFactory,
@@ -324,3 +390,212 @@ async def test_create_api_invalid_fk(
         field="body.related_model_id",
     )
     assert response_data.detail == "Related model was not found", response_data
+
+
+async def test_validation_checks_are_run_in_one_query(
+    repository: example_app.repositories.TestModelRepository,
+    related_model: example_app.models.RelatedModel,
+    test_model: example_app.models.TestModel,
+    collect_statements: shortcuts.StatementsCollector,
+) -> None:
+    """Test that checks of fields and unique constraints share one query."""
+    with (
+        collect_statements() as statements,
+        pytest.raises(fastapi_rest_framework.ValidationError) as error,
+    ):
+        await example_app.validators.TestModelValidator(
+            repository=repository,
+        )(
+            value={
+                "text": test_model.text,
+                "text_nullable": test_model.text_nullable,
+                "text_unique": test_model.text_unique,
+                "related_model_id": related_model.id,
+                "related_model_id_nullable": -1,
+                "m2m_related_models_ids": [related_model.id],
+            },
+            context={},
+        )
+    assert len(statements) == 1
+    errors = error.value.get_schema()
+    assert isinstance(errors, list)
+    assert {(error.field, error.type) for error in errors} == {
+        ("body.text_unique", "unique"),
+        ("body.related_model_id_nullable", "not_found"),
+    }
+
+
+async def test_lookups_are_checked_once_per_request(
+    repository: example_app.repositories.TestModelRepository,
+    related_model: example_app.models.RelatedModel,
+    test_model: example_app.models.TestModel,
+    collect_statements: shortcuts.StatementsCollector,
+) -> None:
+    """Test that validators of request share results of checks."""
+    context = {
+        fastapi_rest_framework.LOOKUP_CACHE_CONTEXT_KEY: (
+            fastapi_rest_framework.LookupCache()
+        ),
+    }
+    with collect_statements() as statements:
+        for _ in range(2):
+            with pytest.raises(fastapi_rest_framework.ValidationError):
+                await example_app.validators.TestModelValidator(
+                    repository=repository,
+                )(
+                    value={
+                        "text": test_model.text,
+                        "text_nullable": test_model.text_nullable,
+                        "text_unique": test_model.text_unique,
+                        "related_model_id": related_model.id,
+                        "related_model_id_nullable": related_model.id,
+                        "m2m_related_models_ids": [related_model.id],
+                    },
+                    context=context,
+                )
+    assert len(statements) == 1
+
+
+async def test_validation_plan_binding(
+    repository: example_app.repositories.TestModelRepository,
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that validation plan is bound to state of validation."""
+    first = example_app.validators.TestModelValidator(
+        repository=repository,
+        instance=test_model,
+    )._get_validation_map(value={}, context={})
+    second = example_app.validators.TestModelValidator(
+        repository=repository,
+    )._get_validation_map(value={}, context={})
+    # Validators, which don't depend on state of validation, are shared
+    assert first["text_nullable"] is second["text_nullable"]
+    assert first["text_unique"] is not second["text_unique"]
+    (unique_validator,) = first["text_unique"]
+    assert isinstance(
+        unique_validator,
+        fastapi_rest_framework.UniqueByFieldValidator,
+    )
+    assert unique_validator.repository is repository
+    assert unique_validator.instance is test_model
+    # Repository of related model is initialized once per validation
+    (related_validator,) = first["related_model_id"]
+    (m2m_related_validator,) = first["m2m_related_models_ids"]
+    assert isinstance(
+        related_validator,
+        fastapi_rest_framework.ObjectPKValidator,
+    )
+    assert isinstance(
+        m2m_related_validator,
+        fastapi_rest_framework.ObjectPKValidator,
+    )
+    assert isinstance(
+        related_validator.repository,
+        example_app.repositories.RelatedModelRepository,
+    )
+    assert related_validator.repository is m2m_related_validator.repository
+
+
+async def test_pure_validators_are_compiled_into_schema(
+    test_model: example_app.models.TestModel,
+) -> None:
+    """Test that pure validators are run on validation of request schema."""
+    schema = example_app.views.TestModelAPIView.create_schema
+    request_schema = (
+        example_app.validators.TestModelValidator.get_request_schema(schema)
+    )
+    assert request_schema.model_json_schema() == schema.model_json_schema()
+    lowered_validators = (
+        example_app.validators.TestModelValidator.get_lowered_validators(
+            request_schema,
+        )
+    )
+    assert lowered_validators["text_nullable"] == 2
+    assert lowered_validators["text_list"] == 1
+    # Validators, which check data against repository, are run by validator
+    assert "related_model_id" not in lowered_validators
+    data = schema.model_validate(test_model).model_dump(mode="json")
+    data["text_nullable"] = "123456"
+    with pytest.raises(pydantic.ValidationError) as error_info:
+        request_schema.model_validate(data)
+    (error,) = error_info.value.errors()
+    assert error["loc"] == ("text_nullable",)
+    assert error["type"] == fastapi_rest_framework.ValidationErrorType.invalid
+    assert error["msg"] == "Regex validation failed"
+
+
+@pytest.mark.parametrize(
+    ["limits", "expected_fields"],
+    [
+        [
+            fastapi_rest_framework.ValidationLimits(fail_fast=True),
+            ["body.0.text_nullable"],
+        ],
+        [
+            fastapi_rest_framework.ValidationLimits(max_errors=4),
+            [
+                "body.0.text_nullable",
+                "body.0.timezone",
+                "body.0.related_model_id",
+                "body.1.text_nullable",
+            ],
+        ],
+    ],
+)
+async def test_validation_limits(
+    repository: example_app.repositories.TestModelRepository,
+    limits: fastapi_rest_framework.ValidationLimits,
+    expected_fields: list[str],
+) -> None:
+    """Test that validation stops once limit of errors is reached."""
+    validator = example_app.validators.ListTestModelValidator(
+        repository=repository,
+    )
+    validator.limits = limits
+    with pytest.raises(fastapi_rest_framework.ValidationError) as error_info:
+        await validator(
+            value=[
+                {
+                    "text_nullable": "123456",
+                    "timezone": "invalid",
+                    "related_model_id": -1,
+                }
+                for _ in range(10)
+            ],
+            context={},
+        )
+    error_schema = error_info.value.get_schema()
+    assert isinstance(error_schema, list)
+    assert [error.field for error in error_schema] == expected_fields
+
+
+async def test_list_validation_duplicates(
+    repository: example_app.repositories.TestModelRepository,
+    related_model: example_app.models.RelatedModel,
+) -> None:
+    """Test that duplicates in bulk payload are reported per item."""
+    items = [
+        {
+            "text": f"Text{index}",
+            "text_nullable": "Text",
+            "text_unique": "TextUnique",
+            "related_model_id": related_model.id,
+            "m2m_related_models_ids": [related_model.id],
+        }
+        for index in range(3)
+    ]
+    items[2]["text"] = items[0]["text"]
+    items[2]["text_unique"] = "OtherTextUnique"
+    with pytest.raises(fastapi_rest_framework.ValidationError) as error:
+        await example_app.validators.ListTestModelValidator(
+            repository=repository,
+        )(
+            value=items,
+            context={},
+        )
+    errors = error.value.get_schema()
+    assert isinstance(errors, list)
+    assert [(error.field, error.type) for error in errors] == [
+        ("body.1.text_unique", "unique"),
+        ("body.2", "unique"),
+    ]